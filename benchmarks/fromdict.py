@@ -0,0 +1,81 @@
+"""Decoding time of the response models, ``fromdict`` against generated decoders
+
+Run with kenallclient installed, e.g. ``pip install -e .``::
+
+    python benchmarks/fromdict.py
+
+Every payload is taken from ``tests/fixtures``. The ``x1000`` rows repeat the
+records of a search result to the size of a large page.
+"""
+
+import json
+import os
+import timeit
+
+from kenallclient.models import compatible, v20221101, v20240101, v20250101
+from kenallclient.models.compiler import decoder
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+CASES = [
+    ("2025-01-01", "postalcode_get.json", v20250101.AddressResolverResponse),
+    ("2025-01-01", "postalcode_search.json", v20250101.AddressSearcherResponse),
+    ("2025-01-01", "city_get.json", v20250101.CityResolverResponse),
+    ("2025-01-01", "banks_get.json", v20250101.BanksResponse),
+    ("2025-01-01", "bank_branches_get.json", v20250101.BankBranchesResponse),
+    (
+        "2025-01-01",
+        "houjinbangou_search.json",
+        v20250101.NTACorporateInfoSearcherResponse,
+    ),
+    (
+        "2025-01-01",
+        "invoice_issuer_get.json",
+        v20250101.NTAQualifiedInvoiceIssuerInfoResolverResponse,
+    ),
+    ("2025-01-01", "school_search.json", v20250101.SchoolSearcherResponse),
+    (
+        "2024-01-01",
+        "houjinbangou_search.json",
+        v20240101.NTACorporateInfoSearcherResponse,
+    ),
+    ("2022-11-01", "postalcode_search.json", v20221101.AddressSearcherResponse),
+    ("2025-01-01", "postalcode_search.json", compatible.AddressSearcherResponse),
+]
+
+
+def load(version, name):
+    with open(os.path.join(FIXTURES, version, name)) as f:
+        return json.load(f)
+
+
+def repeat(payload, n):
+    """Return ``payload`` with its records repeated ``n`` times"""
+    return dict(payload, data=payload["data"] * n)
+
+
+def best(fn, payload):
+    """Return the best time of one call, in microseconds"""
+    timer = timeit.Timer(lambda: fn(payload))
+    number, _ = timer.autorange()
+    return min(timer.repeat(5, number)) / number * 1e6
+
+
+def main():
+    print(f"{'payload':<58}{'fromdict':>12}{'decoder':>12}{'speedup':>9}")
+    for version, name, cls in CASES:
+        payload = load(version, name)
+        payloads = [("", payload)]
+        if isinstance(payload["data"], list):
+            payloads.append((" x1000", repeat(payload, 1000)))
+        for suffix, data in payloads:
+            fast = decoder(cls)
+            assert fast(data) == cls.fromdict(data)
+            old = best(cls.fromdict, data)
+            new = best(fast, data)
+            label = f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}{suffix}"
+            print(f"{label:<58}{old:>9.1f} us{new:>9.1f} us{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Time taken by ``import kenallclient`` and ``python -m kenallclient --help``
+
+Run with kenallclient installed, e.g. ``pip install -e .``::
+
+    python benchmarks/importtime.py [--budget MS]
+
+Each command runs in a fresh interpreter, and the best of several runs is
+reported, less the startup of a bare interpreter. With ``--budget`` the
+script exits with a non-zero status when a command takes longer, so it can
+catch regressions in CI.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+REPEAT = 10
+COMMANDS = [
+    ("import kenallclient", ["-c", "import kenallclient"]),
+    ("-m kenallclient --help", ["-m", "kenallclient", "--help"]),
+]
+
+
+def best_of(args, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=float, help="maximum time in ms")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    args = parser.parse_args()
+
+    baseline = best_of(["-c", "pass"], args.repeat)
+    print(f"{'command':<26}{'time':>10}")
+    over = False
+    for name, command in COMMANDS:
+        elapsed = best_of(command, args.repeat) - baseline
+        print(f"{name:<26}{elapsed:>7.1f} ms")
+        if args.budget is not None and elapsed > args.budget:
+            over = True
+    if over:
+        print(f"over budget of {args.budget:.1f} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Memory used per model instance, with and without ``__slots__``, and by
+cached search pages, with and without string interning
+
+Run with kenallclient installed, e.g. ``pip install -e .``::
+
+    python benchmarks/memory.py
+
+Field values are shared between instances, so the numbers are the cost of the
+instances themselves, as when many rows repeat the same prefecture or city.
+"""
+
+import dataclasses
+import gc
+import json
+import os
+import tracemalloc
+
+from kenallclient.intern import InternTable
+from kenallclient.models import compatible, v20221101, v20250101
+
+N = 10000
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "2025-01-01"
+)
+
+
+def without_slots(cls):
+    """Return a copy of the dataclass ``cls`` keeping a ``__dict__``"""
+    namespace = {"__annotations__": dict(cls.__annotations__)}
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            namespace[f.name] = f.default
+    return dataclasses.dataclass(type(cls.__name__, (), namespace))
+
+
+def measure(cls, kwargs):
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    items = [cls(**kwargs) for _ in range(N)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    # do not count the list holding the instances
+    return (after - before) / N - 8
+
+
+def main():
+    with open(os.path.join(FIXTURE, "postalcode_get.json")) as f:
+        address = json.load(f)["data"][0]
+    with open(os.path.join(FIXTURE, "bank_get.json")) as f:
+        bank = json.load(f)["data"]
+
+    cases = [
+        ("v20250101.Address", v20250101.Address, address),
+        ("v20221101.Address", v20221101.Address, address),
+        ("compatible.Address", compatible.Address, address),
+        ("v20250101.Bank", v20250101.Bank, bank),
+    ]
+    print(f"{'model':<22}{'fields':>8}{'__dict__':>11}{'__slots__':>11}{'saved':>8}")
+    for name, cls, data in cases:
+        names = {f.name for f in dataclasses.fields(cls)}
+        kwargs = {k: v for k, v in data.items() if k in names}
+        if "corporation" in kwargs:
+            kwargs["corporation"] = None
+        slotted = measure(cls, kwargs)
+        plain = measure(without_slots(cls), kwargs)
+        print(
+            f"{name:<22}{len(names):>8}{plain:>9.0f} B{slotted:>9.0f} B"
+            f"{1 - slotted / plain:>8.0%}"
+        )
+
+
+def measure_pages(body, pages, interner=None):
+    """Return the memory held by ``pages`` payloads decoded from ``body``"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    payloads = [json.loads(body) for _ in range(pages)]
+    if interner is not None:
+        for payload in payloads:
+            interner.intern_payload(payload)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del payloads
+    return after - before
+
+
+def main_interning():
+    with open(os.path.join(FIXTURE, "postalcode_search.json")) as f:
+        payload = json.load(f)
+    # a page of 100 addresses, all in the same city
+    payload["data"] = payload["data"][:1] * 100
+    body = json.dumps(payload).encode("utf-8")
+    pages = 100
+
+    plain = measure_pages(body, pages)
+    interned = measure_pages(body, pages, InternTable())
+    print()
+    print(f"{'cached pages':<22}{'plain':>11}{'interned':>11}{'saved':>8}")
+    print(
+        f"{f'{pages} x 100 addresses':<22}{plain / 1e6:>8.1f} MB"
+        f"{interned / 1e6:>8.1f} MB{1 - interned / plain:>8.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
+    main_interning()
@@ -1,7 +1,26 @@
+from typing import TYPE_CHECKING, Any
+
 from kenallclient.client import KenAllClient
+from kenallclient.exceptions import CircuitOpenError, DeadlineExceeded, NotFoundError
 from kenallclient.types import APIVersion
 
+if TYPE_CHECKING:
+    from kenallclient.aio import AsyncKenAllClient
+
 __all__ = [
+    "AsyncKenAllClient",
+    "CircuitOpenError",
+    "DeadlineExceeded",
     "KenAllClient",
+    "NotFoundError",
     "APIVersion",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # the asyncio client is imported on first use, as asyncio is slow to import
+    if name == "AsyncKenAllClient":
+        from kenallclient.aio import AsyncKenAllClient
+
+        return AsyncKenAllClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
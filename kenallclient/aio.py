@@ -0,0 +1,888 @@
+"""Asynchronous KEN_ALL client built on a pooled non-blocking transport"""
+
+import asyncio
+import functools
+import logging
+import urllib.error
+import urllib.request
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from kenallclient.cache import Cache, CacheEntry, cache_key, endpoint_of
+from kenallclient.circuitbreaker import CircuitBreaker
+from kenallclient.client import BaseKenAllClient
+from kenallclient.decoder import JSONDecoder, get_decoder
+from kenallclient.exceptions import CircuitOpenError, DeadlineExceeded, NotFoundError
+from kenallclient.hedge import HedgePolicy
+from kenallclient.intern import InternTable
+from kenallclient.models.factories import (
+    create_address_resolver_response,
+    create_address_searcher_response,
+    create_bank_branch_resolver_response,
+    create_bank_branches_response,
+    create_bank_resolver_response,
+    create_banks_response,
+    create_corporate_info_resolver_response,
+    create_corporate_info_searcher_response,
+    create_holiday_search_result,
+    create_school_resolver_response,
+    create_school_searcher_response,
+)
+from kenallclient.pool import AsyncConnectionPool
+from kenallclient.ratelimit import RateLimiter
+from kenallclient.retry import RetryPolicy
+from kenallclient.singleflight import AsyncSingleFlight
+from kenallclient.timeout import (
+    Deadline,
+    DeadlineLike,
+    Timeout,
+    TimeoutLike,
+    attempt_timeout,
+)
+from kenallclient.transport import AsyncTransport, Response
+from kenallclient.types import APIVersion
+
+__all__ = [
+    "AsyncKenAllClient",
+]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+if TYPE_CHECKING:
+    from kenallclient.models import (
+        compatible,
+        v20221101,
+        v20230901,
+        v20240101,
+        v20250101,
+    )
+    from kenallclient.models.compatible import HolidaySearchResult
+
+
+class AsyncKenAllClient(BaseKenAllClient):
+    """asyncio counterpart of ``KenAllClient``
+
+    Every lookup method is a coroutine returning the same models as its
+    synchronous counterpart. Requests are sent by ``transport``, by default
+    ``connection_pool``; a pool with default settings is created if both are
+    omitted.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: Optional[str] = None,
+        connection_pool: Optional[AsyncConnectionPool] = None,
+        cache: Optional[Cache] = None,
+        coalesce_requests: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[TimeoutLike] = None,
+        hedge: Optional[HedgePolicy] = None,
+        transport: Optional[AsyncTransport] = None,
+        json_decoder: Union[None, str, JSONDecoder] = None,
+        lazy: bool = False,
+        raw: bool = False,
+        interner: Optional[InternTable] = None,
+    ) -> None:
+        super().__init__(api_key, api_url)
+        self.json_decoder = get_decoder(json_decoder)
+        self.lazy = lazy
+        self.raw = raw
+        self.interner = interner
+        if transport is None:
+            if connection_pool is None:
+                connection_pool = AsyncConnectionPool()
+            transport = connection_pool
+        self.connection_pool = connection_pool
+        self.transport = transport
+        self.cache = cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeout = Timeout.of(timeout)
+        self.hedge = hedge
+        self._single_flight: Optional[AsyncSingleFlight[Any]] = (
+            AsyncSingleFlight() if coalesce_requests else None
+        )
+        self._refreshing: Dict[str, asyncio.Task[None]] = {}
+
+    async def __aenter__(self) -> "AsyncKenAllClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancel background refreshes and close idle transport connections"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self.transport.close()
+
+    async def _fetch_json(
+        self,
+        req: urllib.request.Request,
+        not_found: bool = False,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Any:
+        call_timeout, call_deadline = self._call_limits(timeout, deadline)
+        entry = await self._call_cache(self._cache_get, req)
+        if entry is not None:
+            if entry.is_fresh():
+                if entry.not_found:
+                    raise NotFoundError(req.full_url)
+                return entry.value
+            if self._is_stale_usable(entry):
+                self._refresh_in_background(req, entry, not_found)
+                return entry.value
+        try:
+            return await self._download_json(
+                req, entry, not_found, call_timeout, call_deadline
+            )
+        except CircuitOpenError as e:
+            if entry is None:
+                raise
+            return self._serve_cached_on_open_circuit(req, entry, e)
+
+    async def _download_json(
+        self,
+        req: urllib.request.Request,
+        entry: Optional[CacheEntry],
+        not_found: bool,
+        timeout: Optional[Timeout],
+        deadline: Optional[Deadline],
+    ) -> Any:
+        async def attempt() -> Any:
+            request = functools.partial(
+                self._request_json, req, entry, not_found, timeout, deadline
+            )
+            if self.hedge is None:
+                return await request()
+            return await self.hedge.call_async(req, request)
+
+        async def download() -> Any:
+            if self.retry is None:
+                return await attempt()
+            return await self.retry.call_async(req, attempt, deadline)
+
+        if self._single_flight is None:
+            return await download()
+        return await self._single_flight.do(
+            f"{cache_key(req)} {timeout!r}", download, deadline
+        )
+
+    async def _request_json(
+        self,
+        req: urllib.request.Request,
+        entry: Optional[CacheEntry],
+        not_found: bool,
+        timeout: Optional[Timeout],
+        deadline: Optional[Deadline],
+    ) -> Any:
+        if deadline is not None:
+            deadline.check()
+        with self._circuit(req):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(
+                    self.api_key, endpoint_of(req.full_url), deadline
+                )
+            try:
+                res = await self._request(
+                    req if entry is None else self._conditional_request(req, entry),
+                    timeout,
+                    deadline,
+                )
+            except urllib.error.HTTPError as e:
+                if e.code == 304 and entry is not None:
+                    await self._call_cache(
+                        self._cache_revalidated, req, entry, e.headers
+                    )
+                    return entry.value
+                if e.code == 404 and not_found:
+                    raise await self._call_cache(self._cache_not_found, req, e) from e
+                raise
+        d = self._intern(res.json(self.json_decoder))
+        await self._call_cache(self._cache_set, req, d, len(res.body), res.headers)
+        return d
+
+    async def _call_cache(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call ``fn``, on a worker thread if the cache blocks"""
+        if self.cache is None or not self.cache.blocks:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def _request(
+        self,
+        req: urllib.request.Request,
+        timeout: Optional[Timeout],
+        deadline: Optional[Deadline],
+    ) -> Response:
+        """Send ``req`` by the transport, cancelling it when ``deadline`` passes"""
+        request = self.transport.send(req, attempt_timeout(timeout, deadline))
+        if deadline is None:
+            return await request
+        try:
+            return await asyncio.wait_for(request, deadline.remaining())
+        except asyncio.TimeoutError:
+            if not deadline.expired():
+                raise
+            raise DeadlineExceeded("deadline exceeded", in_flight=True) from None
+
+    def _refresh_in_background(
+        self, req: urllib.request.Request, entry: CacheEntry, not_found: bool
+    ) -> None:
+        """Refresh a stale entry in a task, once per key at a time"""
+        key = cache_key(req)
+        if key in self._refreshing:
+            return
+        self._refreshing[key] = asyncio.get_running_loop().create_task(
+            self._refresh(key, req, entry, not_found)
+        )
+
+    async def _refresh(
+        self,
+        key: str,
+        req: urllib.request.Request,
+        entry: CacheEntry,
+        not_found: bool,
+    ) -> None:
+        try:
+            await self._download_json(req, entry, not_found, self.timeout, None)
+        except Exception:
+            logger.warning("refreshing %s failed", req.full_url, exc_info=True)
+        finally:
+            self._refreshing.pop(key, None)
+
+    # Address resolver with version-specific return types
+    @overload
+    async def get(
+        self,
+        postal_code: str,
+        api_version: Literal["2022-11-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20221101.AddressResolverResponse": ...
+
+    @overload
+    async def get(
+        self,
+        postal_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.AddressResolverResponse": ...
+
+    @overload
+    async def get(
+        self,
+        postal_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.AddressResolverResponse": ...
+
+    @overload
+    async def get(
+        self,
+        postal_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.AddressResolverResponse": ...
+
+    @overload
+    async def get(
+        self,
+        postal_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.AddressResolverResponse": ...
+
+    async def get(
+        self,
+        postal_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get address information by postal code"""
+        req = self.create_request(postal_code, api_version)
+        d = await self._fetch_json(
+            req, not_found=True, timeout=timeout, deadline=deadline
+        )
+        return self._result(create_address_resolver_response, d, api_version)
+
+    # Address search with version-specific return types
+    @overload
+    async def search(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet: Optional[str] = None,
+        api_version: Literal["2022-11-01"] = ...,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20221101.AddressSearcherResponse": ...
+
+    @overload
+    async def search(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet: Optional[str] = None,
+        api_version: Literal["2023-09-01"] = ...,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.AddressSearcherResponse": ...
+
+    @overload
+    async def search(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet: Optional[str] = None,
+        api_version: Literal["2024-01-01"] = ...,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.AddressSearcherResponse": ...
+
+    @overload
+    async def search(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet: Optional[str] = None,
+        api_version: Literal["2025-01-01"] = ...,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.AddressSearcherResponse": ...
+
+    @overload
+    async def search(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet: Optional[str] = None,
+        api_version: None = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.AddressSearcherResponse": ...
+
+    async def search(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Search addresses"""
+        req = self.create_address_search_request(
+            q=q, t=t, offset=offset, limit=limit, facet=facet, api_version=api_version
+        )
+        d = await self._fetch_json(req, timeout=timeout, deadline=deadline)
+        return self._result(create_address_searcher_response, d, api_version, self.lazy)
+
+    # Houjin/Corporate info methods with version-specific return types
+    @overload
+    async def get_houjin(
+        self,
+        houjinbangou: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.NTACorporateInfoResolverResponse": ...
+
+    @overload
+    async def get_houjin(
+        self,
+        houjinbangou: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.NTACorporateInfoResolverResponse": ...
+
+    @overload
+    async def get_houjin(
+        self,
+        houjinbangou: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.NTACorporateInfoResolverResponse": ...
+
+    async def get_houjin(
+        self,
+        houjinbangou: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get corporate info by houjinbangou"""
+        req = self.create_houjin_request(houjinbangou, api_version)
+        d = await self._fetch_json(
+            req, not_found=True, timeout=timeout, deadline=deadline
+        )
+        return self._result(create_corporate_info_resolver_response, d, api_version)
+
+    @overload
+    async def search_houjin(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.NTACorporateInfoSearcherResponse": ...
+
+    @overload
+    async def search_houjin(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.NTACorporateInfoSearcherResponse": ...
+
+    @overload
+    async def search_houjin(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.NTACorporateInfoSearcherResponse": ...
+
+    async def search_houjin(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Search corporate info"""
+        req = self.create_houjin_search_request(
+            q=q,
+            offset=offset,
+            limit=limit,
+            mode=mode,
+            facet_area=facet_area,
+            facet_kind=facet_kind,
+            facet_process=facet_process,
+            facet_close_cause=facet_close_cause,
+            api_version=api_version,
+        )
+        d = await self._fetch_json(req, timeout=timeout, deadline=deadline)
+        return self._result(
+            create_corporate_info_searcher_response, d, api_version, self.lazy
+        )
+
+    # Holiday search (same across all versions)
+    async def search_holiday(
+        self,
+        year: Optional[int] = None,
+        from_: Optional[str] = None,
+        to: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "HolidaySearchResult":
+        """Search holidays"""
+
+        req = self.create_holiday_search_request(
+            year=year, from_date=from_, to_date=to, api_version=api_version
+        )
+        d = await self._fetch_json(req, timeout=timeout, deadline=deadline)
+        return self._result(create_holiday_search_result, d, api_version)
+
+    # Bank APIs with version-specific return types (available from 2023-09-01)
+    @overload
+    async def get_banks(
+        self,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BanksResponse": ...
+
+    @overload
+    async def get_banks(
+        self,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BanksResponse": ...
+
+    @overload
+    async def get_banks(
+        self,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BanksResponse": ...
+
+    @overload
+    async def get_banks(
+        self,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BanksResponse": ...
+
+    async def get_banks(
+        self,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get all banks"""
+        req = self.create_banks_request(api_version)
+        d = await self._fetch_json(req, timeout=timeout, deadline=deadline)
+        return self._result(create_banks_response, d, api_version)
+
+    @overload
+    async def get_bank(
+        self,
+        bank_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BankResolverResponse": ...
+
+    @overload
+    async def get_bank(
+        self,
+        bank_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BankResolverResponse": ...
+
+    @overload
+    async def get_bank(
+        self,
+        bank_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BankResolverResponse": ...
+
+    @overload
+    async def get_bank(
+        self,
+        bank_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BankResolverResponse": ...
+
+    async def get_bank(
+        self,
+        bank_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get specific bank"""
+        req = self.create_bank_request(bank_code, api_version)
+        d = await self._fetch_json(
+            req, not_found=True, timeout=timeout, deadline=deadline
+        )
+        return self._result(create_bank_resolver_response, d, api_version)
+
+    @overload
+    async def get_bank_branches(
+        self,
+        bank_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BankBranchesResponse": ...
+
+    @overload
+    async def get_bank_branches(
+        self,
+        bank_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BankBranchesResponse": ...
+
+    @overload
+    async def get_bank_branches(
+        self,
+        bank_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BankBranchesResponse": ...
+
+    @overload
+    async def get_bank_branches(
+        self,
+        bank_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BankBranchesResponse": ...
+
+    async def get_bank_branches(
+        self,
+        bank_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get branches for a bank"""
+        req = self.create_bank_branches_request(bank_code, api_version)
+        d = await self._fetch_json(req, timeout=timeout, deadline=deadline)
+        return self._result(create_bank_branches_response, d, api_version)
+
+    @overload
+    async def get_bank_branch(
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BankBranchResolverResponse": ...
+
+    @overload
+    async def get_bank_branch(
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BankBranchResolverResponse": ...
+
+    @overload
+    async def get_bank_branch(
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BankBranchResolverResponse": ...
+
+    @overload
+    async def get_bank_branch(
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BankBranchResolverResponse": ...
+
+    async def get_bank_branch(
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get specific branch"""
+        req = self.create_bank_branch_request(bank_code, branch_code, api_version)
+        d = await self._fetch_json(
+            req, not_found=True, timeout=timeout, deadline=deadline
+        )
+        return self._result(create_bank_branch_resolver_response, d, api_version)
+
+    # School APIs (available from 2025-01-01)
+    @overload
+    async def get_school(
+        self,
+        school_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolResolverResponse": ...
+
+    @overload
+    async def get_school(
+        self,
+        school_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolResolverResponse": ...
+
+    async def get_school(
+        self,
+        school_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get school information by school code"""
+        req = self.create_school_request(school_code, api_version)
+        d = await self._fetch_json(
+            req, not_found=True, timeout=timeout, deadline=deadline
+        )
+        return self._result(create_school_resolver_response, d, api_version)
+
+    @overload
+    async def search_school(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet_area: Optional[str] = None,
+        facet_prefecture: Optional[str] = None,
+        facet_type: Optional[str] = None,
+        facet_establishment_type: Optional[str] = None,
+        facet_branch: Optional[str] = None,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolSearcherResponse": ...
+
+    @overload
+    async def search_school(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet_area: Optional[str] = None,
+        facet_prefecture: Optional[str] = None,
+        facet_type: Optional[str] = None,
+        facet_establishment_type: Optional[str] = None,
+        facet_branch: Optional[str] = None,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolSearcherResponse": ...
+
+    async def search_school(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet_area: Optional[str] = None,
+        facet_prefecture: Optional[str] = None,
+        facet_type: Optional[str] = None,
+        facet_establishment_type: Optional[str] = None,
+        facet_branch: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Search school information"""
+        req = self.create_school_search_request(
+            q=q,
+            offset=offset,
+            limit=limit,
+            facet_area=facet_area,
+            facet_prefecture=facet_prefecture,
+            facet_type=facet_type,
+            facet_establishment_type=facet_establishment_type,
+            facet_branch=facet_branch,
+            api_version=api_version,
+        )
+        d = await self._fetch_json(req, timeout=timeout, deadline=deadline)
+        return self._result(create_school_searcher_response, d, api_version, self.lazy)
@@ -0,0 +1,33 @@
+"""Result container for batch lookups"""
+
+import dataclasses
+from typing import Dict, Generic, TypeVar
+
+__all__ = [
+    "BatchResult",
+]
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass()
+class BatchResult(Generic[T]):
+    """Results of a batch lookup keyed by the looked up value
+
+    Items that failed (e.g. a 404 for an unknown postal code) are reported in
+    ``errors`` instead of failing the whole batch.
+    """
+
+    results: Dict[str, T]
+    errors: Dict[str, Exception]
+
+    def __getitem__(self, key: str) -> T:
+        if key in self.errors:
+            raise self.errors[key]
+        return self.results[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.results or key in self.errors
+
+    def __len__(self) -> int:
+        return len(self.results) + len(self.errors)
@@ -0,0 +1,497 @@
+"""Response caches for KenAllClient
+
+Caches hold the decoded JSON payload of a response, so the model of any API
+version can be rebuilt from an entry without another request. Entries are
+keyed by the request URL and the ``KenAll-API-Version`` header.
+
+Expired entries that carry an ``ETag`` or ``Last-Modified`` validator are kept
+until evicted, so the client can revalidate them with a conditional request
+instead of downloading the payload again.
+
+Lookups of unknown postal codes, corporate numbers, banks, branches and
+schools are cached as ``not_found`` entries with the shorter ``negative_ttl``.
+
+With ``stale_while_revalidate``, entries that expired less than that many
+seconds ago are still returned; the client serves them immediately and
+refreshes them in the background.
+"""
+
+import collections
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+import urllib.parse
+import urllib.request
+import zlib
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, Optional
+
+from kenallclient.intern import InternTable
+from kenallclient.sqlite import SQLiteConnections
+
+__all__ = [
+    "Cache",
+    "CacheEntry",
+    "CacheStats",
+    "MemoryCache",
+    "SQLiteCache",
+    "cache_key",
+    "endpoint_of",
+]
+
+DEFAULT_TTL = 3600.0
+DEFAULT_NEGATIVE_TTL = 300.0
+
+
+def endpoint_of(url: str) -> str:
+    """Return the endpoint name of an API url, e.g. ``postalcode`` or ``bank``"""
+    path = urllib.parse.urlsplit(url).path
+    parts = [p for p in path.split("/") if p]
+    if parts and parts[0] == "v1":
+        parts = parts[1:]
+    return parts[0] if parts else ""
+
+
+def cache_key(req: urllib.request.Request) -> str:
+    """Return the cache key of a request"""
+    version = req.get_header("Kenall-api-version") or ""
+    return f"{version} {req.full_url}"
+
+
+@dataclasses.dataclass()
+class CacheEntry:
+    """A decoded response payload held by a cache"""
+
+    value: Any
+    expires_at: float
+    size: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_found: bool = False
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.time()
+        return now < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def is_stale_usable(self, window: float, now: Optional[float] = None) -> bool:
+        """Tell if the expired entry may still be served while it is refreshed"""
+        if now is None:
+            now = time.time()
+        return not self.not_found and now < self.expires_at + window
+
+
+@dataclasses.dataclass()
+class CacheStats:
+    """Counters of a cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class Cache(metaclass=ABCMeta):
+    """Base class of response caches
+
+    :param ttl: default time to live of an entry in seconds
+    :param ttls: time to live per endpoint name (see ``endpoint_of``),
+        e.g. ``{"holidays": 86400}``
+    :param negative_ttl: time to live of not found results, ``None`` disables
+        caching them
+    :param stale_while_revalidate: seconds after expiry during which an entry
+        is served while it is refreshed in the background
+    :param interner: table sharing the repeated strings of the payloads
+        stored by every client of the cache
+    """
+
+    # whether get and set block on I/O, so the asyncio client runs them in a
+    # thread
+    blocks: bool = False
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL,
+        stale_while_revalidate: float = 0.0,
+        interner: Optional[InternTable] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.negative_ttl = negative_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.interner = interner
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(endpoint_of(url), self.ttl)
+
+    def _keep_expired(self, entry: CacheEntry, now: float) -> bool:
+        """Tell if an expired entry is still worth returning"""
+        return entry.revalidatable or entry.is_stale_usable(
+            self.stale_while_revalidate, now
+        )
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored for ``key``
+
+        Expired entries are only returned when they can be revalidated or
+        are within the stale-while-revalidate window.
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` for ``key``"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored for ``key``"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry"""
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters"""
+
+
+class MemoryCache(Cache):
+    """Thread-safe in-process LRU cache with per-endpoint TTLs
+
+    :param max_entries: maximum number of entries
+    :param max_bytes: maximum total size of the cached response bodies
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: float = DEFAULT_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL,
+        stale_while_revalidate: float = 0.0,
+        interner: Optional[InternTable] = None,
+    ) -> None:
+        super().__init__(
+            ttl=ttl,
+            ttls=ttls,
+            negative_ttl=negative_ttl,
+            stale_while_revalidate=stale_while_revalidate,
+            interner=interner,
+        )
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[str, CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            now = time.time()
+            if entry.is_fresh(now):
+                self._stats.hits += 1
+                return entry
+            self._stats.misses += 1
+            if self._keep_expired(entry, now):
+                return entry
+            self._remove(key)
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return dataclasses.replace(
+                self._stats, entries=len(self._entries), bytes=self._bytes
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(Cache):
+    """Persistent cache stored in an SQLite database in WAL mode
+
+    The database can be shared by every process on a host, so workers reuse
+    each other's responses and the cache survives restarts. Payloads are
+    stored as zlib compressed JSON.
+
+    :param path: path of the database file
+    :param max_entries: maximum number of entries
+    :param max_bytes: maximum total size of the cached response bodies
+    :param touch_interval: minimum seconds between updates of the access
+        time of an entry, which drives LRU eviction; this keeps reads from
+        turning into writes on hot keys
+    :param timeout: seconds to wait for a lock held by another process
+    """
+
+    blocks = True
+    schema_version = 3
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100000,
+        max_bytes: Optional[int] = None,
+        ttl: float = DEFAULT_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL,
+        stale_while_revalidate: float = 0.0,
+        touch_interval: float = 60.0,
+        timeout: float = 5.0,
+        interner: Optional[InternTable] = None,
+    ) -> None:
+        super().__init__(
+            ttl=ttl,
+            ttls=ttls,
+            negative_ttl=negative_ttl,
+            stale_while_revalidate=stale_while_revalidate,
+            interner=interner,
+        )
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self.timeout = timeout
+        self._connections = SQLiteConnections(path, timeout)
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._create_schema(self._connections.get())
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != self.schema_version:
+                # the database only holds cached data, so it is simply rebuilt
+                conn.execute("DROP TABLE IF EXISTS responses")
+                conn.execute("DROP TABLE IF EXISTS totals")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "etag TEXT, "
+                "last_modified TEXT, "
+                "not_found INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at "
+                "ON responses (expires_at)"
+            )
+            # the number and total size of the entries, kept up to date by
+            # triggers so that writes do not have to scan the table
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS totals ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), "
+                "entries INTEGER NOT NULL, "
+                "bytes INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO totals (id, entries, bytes) "
+                "SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_insert "
+                "AFTER INSERT ON responses BEGIN "
+                "UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size; "
+                "END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_update "
+                "AFTER UPDATE OF size ON responses BEGIN "
+                "UPDATE totals SET bytes = bytes - OLD.size + NEW.size; "
+                "END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_delete "
+                "AFTER DELETE ON responses BEGIN "
+                "UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size; "
+                "END"
+            )
+            conn.execute(f"PRAGMA user_version = {self.schema_version}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _count(self, **counters: int) -> None:
+        with self._lock:
+            for name, n in counters.items():
+                setattr(self._stats, name, getattr(self._stats, name) + n)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        conn = self._connections.get()
+        row = conn.execute(
+            "SELECT value, expires_at, size, accessed_at, etag, last_modified, "
+            "not_found FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            self._count(misses=1)
+            return None
+        value, expires_at, size, accessed_at, etag, last_modified, not_found = row
+        entry = CacheEntry(
+            value=None,
+            expires_at=expires_at,
+            size=size,
+            etag=etag,
+            last_modified=last_modified,
+            not_found=bool(not_found),
+        )
+        now = time.time()
+        fresh = entry.is_fresh(now)
+        if fresh:
+            self._count(hits=1)
+        else:
+            self._count(misses=1)
+            if not self._keep_expired(entry, now):
+                return None
+        if now - accessed_at >= self.touch_interval:
+            conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        entry.value = json.loads(zlib.decompress(value))
+        if self.interner is not None:
+            self.interner.intern_payload(entry.value)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+        blob = zlib.compress(
+            json.dumps(entry.value, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            )
+        )
+        conn = self._connections.get()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # an upsert rather than INSERT OR REPLACE, whose implicit delete
+            # would not fire the trigger maintaining the totals
+            conn.execute(
+                "INSERT INTO responses "
+                "(key, value, expires_at, size, accessed_at, etag, last_modified, "
+                "not_found) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                "expires_at = excluded.expires_at, size = excluded.size, "
+                "accessed_at = excluded.accessed_at, etag = excluded.etag, "
+                "last_modified = excluded.last_modified, "
+                "not_found = excluded.not_found",
+                (
+                    key,
+                    blob,
+                    entry.expires_at,
+                    entry.size,
+                    now,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.not_found,
+                ),
+            )
+            evicted = self._evict(conn, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if evicted:
+            self._count(evictions=evicted)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        entries, total = conn.execute("SELECT entries, bytes FROM totals").fetchone()
+        if entries <= self.max_entries and (
+            self.max_bytes is None or total <= self.max_bytes
+        ):
+            return 0
+        evicted = conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (now,)
+        ).rowcount
+        entries, total = conn.execute("SELECT entries, bytes FROM totals").fetchone()
+        doomed = []
+        # the cursor is consumed lazily, so only the evicted rows are read
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if entries <= self.max_entries and (
+                self.max_bytes is None or total <= self.max_bytes
+            ):
+                break
+            doomed.append((key,))
+            entries -= 1
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        return evicted + len(doomed)
+
+    def delete(self, key: str) -> None:
+        self._connections.get().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connections.get().execute("DELETE FROM responses")
+
+    def stats(self) -> CacheStats:
+        entries, total = (
+            self._connections.get()
+            .execute("SELECT entries, bytes FROM totals")
+            .fetchone()
+        )
+        with self._lock:
+            return dataclasses.replace(self._stats, entries=entries, bytes=total)
+
+    def close(self) -> None:
+        """Close the connection of the current thread"""
+        self._connections.close()
@@ -0,0 +1,214 @@
+"""Circuit breaker failing fast while the KEN_ALL API is unhealthy
+
+A circuit is kept per endpoint name (see ``kenallclient.cache.endpoint_of``):
+
+closed
+    requests pass; consecutive failures are counted and ``failure_threshold``
+    of them open the circuit
+open
+    requests are rejected with ``CircuitOpenError`` until ``recovery_timeout``
+    seconds have passed
+half-open
+    up to ``half_open_max_calls`` trial requests pass; a success closes the
+    circuit and a failure opens it again
+"""
+
+import asyncio
+import contextlib
+import enum
+import http.client
+import socket
+import threading
+import time
+import urllib.error
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from kenallclient.exceptions import CircuitOpenError, DeadlineExceeded
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitState",
+]
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+StateChangeCallback = Callable[[str, CircuitState, CircuitState], None]
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "trials")
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker with one circuit per endpoint
+
+    Server errors, connection errors and timeouts count as failures. Other
+    answers, including 404 and 429, show that the API is up and count as
+    successes.
+
+    :param failure_threshold: consecutive failures opening a circuit
+    :param recovery_timeout: seconds a circuit stays open
+    :param half_open_max_calls: trial requests let through when half-open
+    :param failure_thresholds: ``failure_threshold`` per endpoint name
+    :param recovery_timeouts: ``recovery_timeout`` per endpoint name
+    :param failure_statuses: HTTP status codes counted as failures
+    :param on_state_change: called with the endpoint name, the old and the
+        new state whenever a circuit changes state
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_thresholds: Optional[Dict[str, int]] = None,
+        recovery_timeouts: Optional[Dict[str, float]] = None,
+        failure_statuses: FrozenSet[int] = frozenset({500, 502, 503, 504}),
+        on_state_change: Optional[StateChangeCallback] = None,
+    ) -> None:
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_calls must be positive"
+            )
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_thresholds = dict(failure_thresholds or {})
+        self.recovery_timeouts = dict(recovery_timeouts or {})
+        self.failure_statuses = failure_statuses
+        self.on_state_change = on_state_change
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def is_failure(self, error: BaseException) -> bool:
+        if isinstance(error, DeadlineExceeded):
+            # the budget of the caller ran out; it only tells about the API if
+            # a request was still waiting for it
+            return error.in_flight
+        if isinstance(error, urllib.error.HTTPError):
+            return error.code in self.failure_statuses
+        return isinstance(
+            error,
+            (
+                urllib.error.URLError,
+                http.client.HTTPException,
+                ConnectionError,
+                socket.timeout,
+                TimeoutError,
+                asyncio.TimeoutError,
+                asyncio.IncompleteReadError,
+            ),
+        )
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Return the current state of the circuit of ``endpoint``"""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return CircuitState.CLOSED
+            if circuit.state is CircuitState.OPEN and self._recovered(
+                endpoint, circuit, time.monotonic()
+            ):
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def _recovered(self, endpoint: str, circuit: _Circuit, now: float) -> bool:
+        timeout = self.recovery_timeouts.get(endpoint, self.recovery_timeout)
+        return now - circuit.opened_at >= timeout
+
+    def _set_state(
+        self,
+        endpoint: str,
+        circuit: _Circuit,
+        state: CircuitState,
+        changes: List[Tuple[str, CircuitState, CircuitState]],
+    ) -> None:
+        if circuit.state is not state:
+            changes.append((endpoint, circuit.state, state))
+            circuit.state = state
+
+    def _notify(self, changes: List[Tuple[str, CircuitState, CircuitState]]) -> None:
+        if self.on_state_change is not None:
+            for change in changes:
+                self.on_state_change(*change)
+
+    def before_request(self, endpoint: str) -> None:
+        """Let a request to ``endpoint`` through or raise ``CircuitOpenError``"""
+        changes: List[Tuple[str, CircuitState, CircuitState]] = []
+        try:
+            with self._lock:
+                circuit = self._circuits.setdefault(endpoint, _Circuit())
+                if circuit.state is CircuitState.OPEN:
+                    now = time.monotonic()
+                    if not self._recovered(endpoint, circuit, now):
+                        timeout = self.recovery_timeouts.get(
+                            endpoint, self.recovery_timeout
+                        )
+                        raise CircuitOpenError(endpoint, circuit.opened_at + timeout)
+                    self._set_state(endpoint, circuit, CircuitState.HALF_OPEN, changes)
+                    circuit.trials = 0
+                if circuit.state is CircuitState.HALF_OPEN:
+                    if circuit.trials >= self.half_open_max_calls:
+                        raise CircuitOpenError(endpoint, time.monotonic())
+                    circuit.trials += 1
+        finally:
+            self._notify(changes)
+
+    def record_success(self, endpoint: str) -> None:
+        changes: List[Tuple[str, CircuitState, CircuitState]] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures = 0
+            self._set_state(endpoint, circuit, CircuitState.CLOSED, changes)
+        self._notify(changes)
+
+    def record_failure(self, endpoint: str) -> None:
+        changes: List[Tuple[str, CircuitState, CircuitState]] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            threshold = self.failure_thresholds.get(endpoint, self.failure_threshold)
+            if circuit.state is CircuitState.HALF_OPEN or circuit.failures >= threshold:
+                circuit.opened_at = time.monotonic()
+                self._set_state(endpoint, circuit, CircuitState.OPEN, changes)
+        self._notify(changes)
+
+    @contextlib.contextmanager
+    def guard(self, endpoint: str) -> Iterator[None]:
+        """Run a request to ``endpoint`` under the breaker, recording its outcome"""
+        self.before_request(endpoint)
+        try:
+            yield
+        except Exception as e:
+            if self.is_failure(e):
+                self.record_failure(endpoint)
+            elif isinstance(e, urllib.error.HTTPError):
+                # the endpoint answered, e.g. 404 for an unknown postal code
+                self.record_success(endpoint)
+            else:
+                # e.g. a deadline passed before sending, or a response could
+                # not be decoded: nothing is learned about the endpoint
+                self._release_trial(endpoint)
+            raise
+        except BaseException:
+            # a cancelled request tells nothing about the endpoint
+            self._release_trial(endpoint)
+            raise
+        self.record_success(endpoint)
+
+    def _release_trial(self, endpoint: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None and circuit.state is CircuitState.HALF_OPEN:
+                circuit.trials = max(0, circuit.trials - 1)
@@ -1,16 +1,40 @@
-import json
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import logging
+import threading
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
-from typing import Dict, List, Literal, Optional, Tuple, overload
-
-from kenallclient.models import (
-    compatible,
-    v20221101,
-    v20230901,
-    v20240101,
-    v20250101,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
 )
-from kenallclient.models.compatible import HolidaySearchResult
+
+from kenallclient.batch import BatchResult
+from kenallclient.cache import Cache, CacheEntry, cache_key, endpoint_of
+from kenallclient.circuitbreaker import CircuitBreaker
+from kenallclient.concurrency import AdaptiveConcurrencyLimiter, served_locally
+from kenallclient.decoder import JSONDecoder, get_decoder
+from kenallclient.exceptions import CircuitOpenError, DeadlineExceeded, NotFoundError
+from kenallclient.hedge import HedgePolicy
+from kenallclient.intern import InternTable
 from kenallclient.models.factories import (
     create_address_resolver_response,
     create_address_searcher_response,
@@ -21,15 +45,69 @@ from kenallclient.models.factories import (
     create_city_resolver_response,
     create_corporate_info_resolver_response,
     create_corporate_info_searcher_response,
+    create_holiday_search_result,
     create_school_resolver_response,
     create_school_searcher_response,
 )
+from kenallclient.pool import ConnectionPool
+from kenallclient.ratelimit import RateLimiter
+from kenallclient.retry import RetryPolicy
+from kenallclient.singleflight import SingleFlight
+from kenallclient.timeout import (
+    Deadline,
+    DeadlineLike,
+    Timeout,
+    TimeoutLike,
+    attempt_timeout,
+)
+from kenallclient.transport import Transport, UrllibTransport
 from kenallclient.types import APIVersion
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+if TYPE_CHECKING:
+    from kenallclient.models import (
+        compatible,
+        v20221101,
+        v20230901,
+        v20240101,
+        v20250101,
+    )
+    from kenallclient.models.compatible import HolidaySearchResult
+
+
+def _is_timeout(error: BaseException) -> bool:
+    """Tell if ``error`` of a transport is a timeout"""
+    if isinstance(error, urllib.error.URLError):
+        return isinstance(error.reason, TimeoutError)
+    return isinstance(error, TimeoutError)
+
+
+def _copy_payload(d: Any) -> Any:
+    """Copy the lists and objects of the decoded JSON ``d``"""
+    if isinstance(d, dict):
+        return {k: _copy_payload(v) for k, v in d.items()}
+    if isinstance(d, list):
+        return [_copy_payload(v) for v in d]
+    return d
+
+
+class BaseKenAllClient:
+    """Request construction and caching shared by the sync and async clients"""
 
-class KenAllClient:
     api_url = "https://api.kenall.jp"
     api_version: Optional[APIVersion] = None
+    cache: Optional[Cache] = None
+    retry: Optional[RetryPolicy] = None
+    rate_limiter: Optional[RateLimiter] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+    hedge: Optional[HedgePolicy] = None
+    timeout: Optional[Timeout] = None
+    raw: bool = False
+    interner: Optional[InternTable] = None
+    _single_flight: Optional[Any] = None
 
     def __init__(
         self,
@@ -40,6 +118,129 @@ class KenAllClient:
         if api_url is not None:
             self.api_url = api_url
 
+    def _result(
+        self,
+        factory: Callable[..., Any],
+        d: Any,
+        api_version: Optional[APIVersion],
+        *args: Any,
+    ) -> Any:
+        """Build the models of the payload ``d`` with ``factory``
+
+        In raw mode ``d`` is returned as decoded from JSON, copied when the
+        cache or coalesced requests may hand the same payload to other calls.
+        """
+        if self.raw:
+            if self.cache is None and self._single_flight is None:
+                return d
+            return _copy_payload(d)
+        return factory(d, api_version, *args)
+
+    def _intern(self, d: Any) -> Any:
+        """Share the repeated strings of the payload ``d``, if enabled
+
+        The table of the client is used, else the one of its cache.
+        """
+        interner = self.interner
+        if interner is None and self.cache is not None:
+            interner = self.cache.interner
+        if interner is None:
+            return d
+        return interner.intern_payload(d)
+
+    def _cache_get(self, req: urllib.request.Request) -> Optional[CacheEntry]:
+        if self.cache is None:
+            return None
+        return self.cache.get(cache_key(req))
+
+    def _cache_set(
+        self, req: urllib.request.Request, value: Any, size: int, headers: Any
+    ) -> None:
+        if self.cache is None:
+            return
+        ttl = self.cache.ttl_for(req.full_url)
+        entry = CacheEntry(
+            value=value,
+            expires_at=time.time() + ttl,
+            size=size,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        self.cache.set(cache_key(req), entry)
+
+    def _cache_revalidated(
+        self, req: urllib.request.Request, entry: CacheEntry, headers: Any
+    ) -> None:
+        """Extend the lifetime of ``entry`` after a 304 Not Modified response"""
+        if self.cache is None:
+            return
+        ttl = self.cache.ttl_for(req.full_url)
+        entry = dataclasses.replace(
+            entry,
+            expires_at=time.time() + ttl,
+            etag=headers.get("ETag") or entry.etag,
+            last_modified=headers.get("Last-Modified") or entry.last_modified,
+        )
+        self.cache.set(cache_key(req), entry)
+
+    def _cache_not_found(
+        self, req: urllib.request.Request, error: urllib.error.HTTPError
+    ) -> NotFoundError:
+        """Cache a 404 answer and return the ``NotFoundError`` to raise"""
+        if self.cache is not None and self.cache.negative_ttl is not None:
+            entry = CacheEntry(
+                value=None,
+                expires_at=time.time() + self.cache.negative_ttl,
+                not_found=True,
+            )
+            self.cache.set(cache_key(req), entry)
+        return NotFoundError(req.full_url, error.msg, error.headers, error.fp)
+
+    def _call_limits(
+        self, timeout: Optional[TimeoutLike], deadline: Optional[DeadlineLike]
+    ) -> Tuple[Optional[Timeout], Optional[Deadline]]:
+        """Resolve the timeout and deadline of a call"""
+        call_timeout = Timeout.of(timeout)
+        return (
+            self.timeout if call_timeout is None else call_timeout,
+            Deadline.of(deadline),
+        )
+
+    def _circuit(self, req: urllib.request.Request) -> ContextManager[None]:
+        """Guard a request with the circuit breaker of its endpoint, if any"""
+        if self.circuit_breaker is None:
+            return contextlib.nullcontext()
+        return self.circuit_breaker.guard(endpoint_of(req.full_url))
+
+    def _serve_cached_on_open_circuit(
+        self, req: urllib.request.Request, entry: CacheEntry, error: CircuitOpenError
+    ) -> Any:
+        """Answer from an expired entry while the circuit is open"""
+        logger.info("serving %s from cache: %s", req.full_url, error)
+        served_locally()
+        if entry.not_found:
+            raise NotFoundError(req.full_url) from error
+        return entry.value
+
+    def _is_stale_usable(self, entry: CacheEntry) -> bool:
+        """Tell if an expired entry may be served while it is refreshed"""
+        if self.cache is None:
+            return False
+        return entry.is_stale_usable(self.cache.stale_while_revalidate)
+
+    def _conditional_request(
+        self, req: urllib.request.Request, entry: CacheEntry
+    ) -> urllib.request.Request:
+        """Return a copy of ``req`` revalidating the validators of ``entry``"""
+        headers = dict(req.header_items())
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return urllib.request.Request(
+            req.full_url, headers=headers, method=req.get_method()
+        )
+
     @property
     def authorization(self) -> Dict[str, str]:
         auth = {"Authorization": f"Token {self.api_key}"}
@@ -54,36 +255,593 @@ class KenAllClient:
             headers["KenAll-API-Version"] = version
         return headers
 
+    def create_request(
+        self, postal_code: str, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Backward compatibility method for tests"""
+        url = urllib.parse.urljoin(f"{self.api_url}/v1/postalcode/", postal_code)
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_address_search_request(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+    ) -> urllib.request.Request:
+        """Create request for address search"""
+        query_mapping: List[Tuple[str, Optional[str]]] = [
+            ("q", q),
+            ("t", t),
+            ("offset", str(offset) if offset is not None else None),
+            ("limit", str(limit) if limit is not None else None),
+            ("facet", facet),
+        ]
+
+        query = urllib.parse.urlencode(
+            [(k, v) for k, v in query_mapping if v is not None]
+        )
+        url = f"{self.api_url}/v1/postalcode/?{query}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_houjin_request(
+        self, houjinbangou: str, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Backward compatibility method for tests"""
+        url = f"{self.api_url}/v1/houjinbangou/{houjinbangou}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_houjin_search_request(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+    ) -> urllib.request.Request:
+        """Create request for houjin search"""
+        query_mapping: List[Tuple[str, Optional[str]]] = [
+            ("q", q),
+            ("offset", str(offset) if offset is not None else None),
+            ("limit", str(limit) if limit is not None else None),
+            ("mode", mode),
+        ]
+
+        # Add facets separately
+        if facet_area:
+            query_mapping.append(("facet_area", facet_area))
+        if facet_kind:
+            query_mapping.append(("facet_kind", facet_kind))
+        if facet_process:
+            query_mapping.append(("facet_process", facet_process))
+        if facet_close_cause:
+            query_mapping.append(("facet_close_cause", facet_close_cause))
+
+        query = urllib.parse.urlencode(
+            [(k, v) for k, v in query_mapping if v is not None]
+        )
+        url = f"{self.api_url}/v1/houjinbangou?{query}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_holiday_search_request(
+        self,
+        year: Optional[int] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+    ) -> urllib.request.Request:
+        """Create request for holiday search"""
+        query_mapping: List[Tuple[str, Optional[str]]] = [
+            ("year", str(year) if year is not None else None),
+            ("from", from_date),
+            ("to", to_date),
+        ]
+
+        query = urllib.parse.urlencode(
+            [(k, v) for k, v in query_mapping if v is not None]
+        )
+        url = f"{self.api_url}/v1/holidays?{query}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_city_request(
+        self, city_code: str, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Create request for city lookup"""
+        url = f"{self.api_url}/v1/cities/{city_code}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_banks_request(
+        self, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Create request for getting all banks"""
+        url = f"{self.api_url}/v1/bank"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_bank_request(
+        self, bank_code: str, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Create request for getting specific bank"""
+        url = f"{self.api_url}/v1/bank/{bank_code}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_bank_branches_request(
+        self, bank_code: str, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Create request for getting bank branches"""
+        url = f"{self.api_url}/v1/bank/{bank_code}/branches"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_bank_branch_request(
+        self, bank_code: str, branch_code: str, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Create request for getting specific bank branch"""
+        url = f"{self.api_url}/v1/bank/{bank_code}/branches/{branch_code}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_school_request(
+        self, school_code: str, api_version: Optional[APIVersion] = None
+    ) -> urllib.request.Request:
+        """Create request for school lookup"""
+        url = f"{self.api_url}/v1/school/{school_code}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+    def create_school_search_request(
+        self,
+        q: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        facet_area: Optional[str] = None,
+        facet_prefecture: Optional[str] = None,
+        facet_type: Optional[str] = None,
+        facet_establishment_type: Optional[str] = None,
+        facet_branch: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+    ) -> urllib.request.Request:
+        """Create request for school search"""
+        query_mapping: List[Tuple[str, Optional[str]]] = [
+            ("q", q),
+            ("offset", str(offset) if offset is not None else None),
+            ("limit", str(limit) if limit is not None else None),
+        ]
+
+        # Add facets separately
+        if facet_area:
+            query_mapping.append(("facet_area", facet_area))
+        if facet_prefecture:
+            query_mapping.append(("facet_prefecture", facet_prefecture))
+        if facet_type:
+            query_mapping.append(("facet_type", facet_type))
+        if facet_establishment_type:
+            query_mapping.append(("facet_establishment_type", facet_establishment_type))
+        if facet_branch:
+            query_mapping.append(("facet_branch", facet_branch))
+
+        query = urllib.parse.urlencode(
+            [(k, v) for k, v in query_mapping if v is not None]
+        )
+        url = f"{self.api_url}/v1/school/?{query}"
+        return urllib.request.Request(url, headers=self._build_headers(api_version))
+
+
+class KenAllClient(BaseKenAllClient):
+    def __init__(
+        self,
+        api_key: str,
+        api_url: Optional[str] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        cache: Optional[Cache] = None,
+        coalesce_requests: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[TimeoutLike] = None,
+        hedge: Optional[HedgePolicy] = None,
+        transport: Optional[Transport] = None,
+        json_decoder: Union[None, str, JSONDecoder] = None,
+        lazy: bool = False,
+        raw: bool = False,
+        interner: Optional[InternTable] = None,
+    ) -> None:
+        super().__init__(api_key, api_url)
+        self.json_decoder = get_decoder(json_decoder)
+        self.lazy = lazy
+        self.raw = raw
+        self.interner = interner
+        self.connection_pool = connection_pool
+        if transport is None:
+            transport = connection_pool or UrllibTransport()
+        self.transport = transport
+        self.cache = cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeout = Timeout.of(timeout)
+        self.hedge = hedge
+        self._single_flight: Optional[SingleFlight[Any]] = (
+            SingleFlight() if coalesce_requests else None
+        )
+        self._refresh_lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._refresh_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._hedge_executors: Optional[
+            Tuple[
+                concurrent.futures.ThreadPoolExecutor,
+                concurrent.futures.ThreadPoolExecutor,
+            ]
+        ] = None
+
+    def close(self) -> None:
+        """Stop background refreshes and close idle transport connections"""
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+            hedge_executors, self._hedge_executors = self._hedge_executors, None
+        for e in (executor, *(hedge_executors or ())):
+            if e is not None:
+                e.shutdown(wait=False)
+        self.transport.close()
+
+    def __enter__(self) -> "KenAllClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _fetch_json(
+        self,
+        req: urllib.request.Request,
+        not_found: bool = False,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Any:
+        """Fetch and decode a JSON response, serving it from the cache if any
+
+        With ``not_found``, a 404 answer is raised as ``NotFoundError`` and
+        cached as a negative result. ``timeout`` overrides the timeout of the
+        client and ``deadline`` bounds the whole call, including retries.
+        """
+        call_timeout, call_deadline = self._call_limits(timeout, deadline)
+        entry = self._cache_get(req)
+        if entry is not None:
+            if entry.is_fresh():
+                served_locally()
+                if entry.not_found:
+                    raise NotFoundError(req.full_url)
+                return entry.value
+            if self._is_stale_usable(entry):
+                served_locally()
+                self._refresh_in_background(req, entry, not_found)
+                return entry.value
+        try:
+            return self._download_json(
+                req, entry, not_found, call_timeout, call_deadline
+            )
+        except CircuitOpenError as e:
+            if entry is None:
+                raise
+            return self._serve_cached_on_open_circuit(req, entry, e)
+
+    def _download_json(
+        self,
+        req: urllib.request.Request,
+        entry: Optional[CacheEntry],
+        not_found: bool,
+        timeout: Optional[Timeout],
+        deadline: Optional[Deadline],
+    ) -> Any:
+        """Request ``req``, revalidating ``entry`` if given, and cache the result
+
+        Concurrent downloads of the same url and API version share one request,
+        retried according to ``retry`` on transient errors and hedged according
+        to ``hedge`` when slow. Only calls with the same ``timeout`` share a
+        request; callers joining a download in progress wait for it until
+        their own deadline, and download anew if it ran out of the deadline
+        of the caller which started it.
+        """
+
+        def attempt() -> Any:
+            request = functools.partial(
+                self._request_json, req, entry, not_found, timeout, deadline
+            )
+            if self.hedge is None:
+                return request()
+            return self.hedge.call(req, request, *self._hedge_pools(self.hedge))
+
+        def download() -> Any:
+            if self.retry is None:
+                return attempt()
+            return self.retry.call(req, attempt, deadline)
+
+        if self._single_flight is None:
+            return download()
+        return self._single_flight.do(
+            f"{cache_key(req)} {timeout!r}", download, deadline
+        )
+
+    def _hedge_pools(
+        self, hedge: HedgePolicy
+    ) -> Tuple[
+        concurrent.futures.ThreadPoolExecutor, concurrent.futures.ThreadPoolExecutor
+    ]:
+        """Return the worker threads running the first and the second requests
+        of hedged lookups"""
+        with self._refresh_lock:
+            if self._hedge_executors is None:
+                self._hedge_executors = (
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=hedge.max_workers,
+                        thread_name_prefix="kenallclient-primary",
+                    ),
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=hedge.max_workers,
+                        thread_name_prefix="kenallclient-hedge",
+                    ),
+                )
+            return self._hedge_executors
+
+    def _request_json(
+        self,
+        req: urllib.request.Request,
+        entry: Optional[CacheEntry],
+        not_found: bool,
+        timeout: Optional[Timeout],
+        deadline: Optional[Deadline],
+    ) -> Any:
+        if deadline is not None:
+            deadline.check()
+        with self._circuit(req):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(
+                    self.api_key, endpoint_of(req.full_url), deadline
+                )
+            try:
+                res = self.transport.send(
+                    req if entry is None else self._conditional_request(req, entry),
+                    attempt_timeout(timeout, deadline),
+                )
+            except urllib.error.HTTPError as e:
+                if e.code == 304 and entry is not None:
+                    self._cache_revalidated(req, entry, e.headers)
+                    return entry.value
+                if e.code == 404 and not_found:
+                    raise self._cache_not_found(req, e) from e
+                raise
+            except (TimeoutError, urllib.error.URLError) as e:
+                # the attempt timed out as its timeouts were capped by the
+                # deadline
+                if deadline is not None and deadline.expired() and _is_timeout(e):
+                    raise DeadlineExceeded("deadline exceeded", in_flight=True) from e
+                raise
+        d = self._intern(res.json(self.json_decoder))
+        self._cache_set(req, d, len(res.body), res.headers)
+        return d
+
+    def _refresh_in_background(
+        self, req: urllib.request.Request, entry: CacheEntry, not_found: bool
+    ) -> None:
+        """Refresh a stale entry on a worker thread, once per key at a time"""
+        key = cache_key(req)
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="kenallclient-refresh"
+                )
+            executor = self._refresh_executor
+        executor.submit(self._refresh, key, req, entry, not_found)
+
+    def _refresh(
+        self,
+        key: str,
+        req: urllib.request.Request,
+        entry: CacheEntry,
+        not_found: bool,
+    ) -> None:
+        try:
+            self._download_json(req, entry, not_found, self.timeout, None)
+        except Exception:
+            logger.warning("refreshing %s failed", req.full_url, exc_info=True)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
     # Address resolver with version-specific return types
     @overload
     def get(
-        self, postal_code: str, api_version: Literal["2022-11-01"] = ...
-    ) -> v20221101.AddressResolverResponse: ...
+        self,
+        postal_code: str,
+        api_version: Literal["2022-11-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20221101.AddressResolverResponse": ...
 
     @overload
     def get(
-        self, postal_code: str, api_version: Literal["2023-09-01"] = ...
-    ) -> v20230901.AddressResolverResponse: ...
+        self,
+        postal_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.AddressResolverResponse": ...
 
     @overload
     def get(
-        self, postal_code: str, api_version: Literal["2024-01-01"] = ...
-    ) -> v20240101.AddressResolverResponse: ...
+        self,
+        postal_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.AddressResolverResponse": ...
 
     @overload
     def get(
-        self, postal_code: str, api_version: Literal["2025-01-01"] = ...
-    ) -> v20250101.AddressResolverResponse: ...
+        self,
+        postal_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.AddressResolverResponse": ...
 
     @overload
     def get(
-        self, postal_code: str, api_version: None = None
-    ) -> compatible.AddressResolverResponse: ...
+        self,
+        postal_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.AddressResolverResponse": ...
 
-    def get(self, postal_code: str, api_version: Optional[APIVersion] = None):
+    def get(
+        self,
+        postal_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
         """Get address information by postal code"""
         req = self.create_request(postal_code, api_version)
-        return self.fetch(req, api_version)
+        return self.fetch(req, api_version, timeout=timeout, deadline=deadline)
+
+    # Batch address resolver with version-specific return types
+    @overload
+    def get_many(
+        self,
+        postal_codes: Iterable[str],
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = ...,
+        api_version: Literal["2022-11-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> BatchResult["v20221101.AddressResolverResponse"]: ...
+
+    @overload
+    def get_many(
+        self,
+        postal_codes: Iterable[str],
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = ...,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> BatchResult["v20230901.AddressResolverResponse"]: ...
+
+    @overload
+    def get_many(
+        self,
+        postal_codes: Iterable[str],
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = ...,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> BatchResult["v20240101.AddressResolverResponse"]: ...
+
+    @overload
+    def get_many(
+        self,
+        postal_codes: Iterable[str],
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = ...,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> BatchResult["v20250101.AddressResolverResponse"]: ...
+
+    @overload
+    def get_many(
+        self,
+        postal_codes: Iterable[str],
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = ...,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> BatchResult["compatible.AddressResolverResponse"]: ...
+
+    def get_many(
+        self,
+        postal_codes: Iterable[str],
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 8,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Get address information for many postal codes
+
+        Duplicated postal codes are looked up once. Lookups run on up to
+        ``concurrency`` worker threads, or within the limit of an
+        ``AdaptiveConcurrencyLimiter``; a failed lookup is reported in
+        ``errors`` of the result without failing the others. ``deadline``
+        bounds the whole batch.
+        """
+        call_deadline = Deadline.of(deadline)
+        unique = list(dict.fromkeys(postal_codes))
+        result: BatchResult = BatchResult(results={}, errors={})
+        futures = self._map_concurrently(
+            lambda postal_code: self.get(
+                postal_code, api_version, timeout=timeout, deadline=call_deadline
+            ),
+            unique,
+            concurrency,
+        )
+        for postal_code, future in zip(unique, futures, strict=True):
+            try:
+                result.results[postal_code] = future.result()
+            except Exception as e:
+                result.errors[postal_code] = e
+        return result
+
+    def _map_concurrently(
+        self,
+        fn: Callable[[Any], T],
+        items: Sequence[Any],
+        concurrency: Union[int, AdaptiveConcurrencyLimiter],
+    ) -> Iterator["concurrent.futures.Future[T]"]:
+        """Call ``fn`` for every item on worker threads
+
+        Futures are yielded in the order of ``items``; calls not started yet
+        are cancelled when the iterator is closed early.
+        """
+        call: Callable[[Any], T] = fn
+        if isinstance(concurrency, AdaptiveConcurrencyLimiter):
+            workers = concurrency.max_limit
+            call = functools.partial(concurrency.call, fn)
+        elif concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        else:
+            workers = concurrency
+        if self.hedge is not None and workers > self.hedge.max_workers:
+            logger.warning(
+                "hedged lookups are limited to HedgePolicy.max_workers=%d in flight",
+                self.hedge.max_workers,
+            )
+        if not items:
+            return
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(workers, len(items))
+        )
+        futures = [executor.submit(call, item) for item in items]
+        try:
+            yield from futures
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
 
     # Address search with version-specific return types
     @overload
@@ -96,7 +854,9 @@ class KenAllClient:
         limit: Optional[int] = None,
         facet: Optional[str] = None,
         api_version: Literal["2022-11-01"] = ...,
-    ) -> v20221101.AddressSearcherResponse: ...
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20221101.AddressSearcherResponse": ...
 
     @overload
     def search(
@@ -108,7 +868,9 @@ class KenAllClient:
         limit: Optional[int] = None,
         facet: Optional[str] = None,
         api_version: Literal["2023-09-01"] = ...,
-    ) -> v20230901.AddressSearcherResponse: ...
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.AddressSearcherResponse": ...
 
     @overload
     def search(
@@ -120,7 +882,9 @@ class KenAllClient:
         limit: Optional[int] = None,
         facet: Optional[str] = None,
         api_version: Literal["2024-01-01"] = ...,
-    ) -> v20240101.AddressSearcherResponse: ...
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.AddressSearcherResponse": ...
 
     @overload
     def search(
@@ -132,7 +896,9 @@ class KenAllClient:
         limit: Optional[int] = None,
         facet: Optional[str] = None,
         api_version: Literal["2025-01-01"] = ...,
-    ) -> v20250101.AddressSearcherResponse: ...
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.AddressSearcherResponse": ...
 
     @overload
     def search(
@@ -144,7 +910,9 @@ class KenAllClient:
         limit: Optional[int] = None,
         facet: Optional[str] = None,
         api_version: None = None,
-    ) -> compatible.AddressSearcherResponse: ...
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.AddressSearcherResponse": ...
 
     def search(
         self,
@@ -155,6 +923,8 @@ class KenAllClient:
         limit: Optional[int] = None,
         facet: Optional[str] = None,
         api_version: Optional[APIVersion] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Search addresses"""
         req = self.create_address_search_request(
@@ -162,28 +932,173 @@ class KenAllClient:
         )
         # Use the internal fetch method but since it's for addresses,
         # we need to use a specialized fetch for search results
-        return self.fetch_address_search_result(req, api_version)
+        return self.fetch_address_search_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
+
+    @overload
+    def iter_search_pages(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        limit: int = 100,
+        facet: Optional[str] = None,
+        api_version: Literal["2022-11-01"] = ...,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["v20221101.AddressSearcherResponse"]: ...
+
+    @overload
+    def iter_search_pages(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        limit: int = 100,
+        facet: Optional[str] = None,
+        api_version: Literal["2023-09-01"] = ...,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["v20230901.AddressSearcherResponse"]: ...
+
+    @overload
+    def iter_search_pages(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        limit: int = 100,
+        facet: Optional[str] = None,
+        api_version: Literal["2024-01-01"] = ...,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["v20240101.AddressSearcherResponse"]: ...
+
+    @overload
+    def iter_search_pages(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        limit: int = 100,
+        facet: Optional[str] = None,
+        api_version: Literal["2025-01-01"] = ...,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["v20250101.AddressSearcherResponse"]: ...
+
+    @overload
+    def iter_search_pages(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        limit: int = 100,
+        facet: Optional[str] = None,
+        api_version: None = None,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["compatible.AddressSearcherResponse"]: ...
+
+    def iter_search_pages(
+        self,
+        *,
+        q: Optional[str],
+        t: Optional[str],
+        limit: int = 100,
+        facet: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Iterate over every page of an address search
+
+        The first page tells the number of results; the following pages are
+        fetched concurrently and yielded in order. ``deadline`` bounds the
+        retrieval of every page.
+        """
+        call_deadline = Deadline.of(deadline)
+
+        def page(offset):
+            return self.search(
+                q=q,
+                t=t,
+                offset=offset,
+                limit=limit,
+                facet=facet,
+                api_version=api_version,
+                timeout=timeout,
+                deadline=call_deadline,
+            )
+
+        return self._iter_pages(page, limit, concurrency)
+
+    def _iter_pages(
+        self,
+        page: Callable[[int], Any],
+        limit: int,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter],
+    ) -> Iterator[Any]:
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        first = page(0)
+        yield first
+        count = first["count"] if self.raw else first.count
+        offsets = range(limit, count, limit)
+        for future in self._map_concurrently(page, offsets, concurrency):
+            yield future.result()
 
     # Houjin/Corporate info methods with version-specific return types
     @overload
     def get_houjin(
-        self, houjinbangou: str, api_version: Literal["2024-01-01"] = ...
-    ) -> v20240101.NTACorporateInfoResolverResponse: ...
+        self,
+        houjinbangou: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.NTACorporateInfoResolverResponse": ...
 
     @overload
     def get_houjin(
-        self, houjinbangou: str, api_version: Literal["2025-01-01"] = ...
-    ) -> v20250101.NTACorporateInfoResolverResponse: ...
+        self,
+        houjinbangou: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.NTACorporateInfoResolverResponse": ...
 
     @overload
     def get_houjin(
-        self, houjinbangou: str, api_version: None = None
-    ) -> compatible.NTACorporateInfoResolverResponse: ...
+        self,
+        houjinbangou: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.NTACorporateInfoResolverResponse": ...
 
-    def get_houjin(self, houjinbangou: str, api_version: Optional[APIVersion] = None):
+    def get_houjin(
+        self,
+        houjinbangou: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
         """Get corporate info by houjinbangou"""
         req = self.create_houjin_request(houjinbangou, api_version)
-        return self.fetch_houjin_result(req, api_version)
+        return self.fetch_houjin_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     @overload
     def search_houjin(
@@ -197,7 +1112,10 @@ class KenAllClient:
         facet_process: Optional[str] = None,
         facet_close_cause: Optional[str] = None,
         api_version: Literal["2024-01-01"] = ...,
-    ) -> v20240101.NTACorporateInfoSearcherResponse: ...
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.NTACorporateInfoSearcherResponse": ...
 
     @overload
     def search_houjin(
@@ -211,7 +1129,10 @@ class KenAllClient:
         facet_process: Optional[str] = None,
         facet_close_cause: Optional[str] = None,
         api_version: Literal["2025-01-01"] = ...,
-    ) -> v20250101.NTACorporateInfoSearcherResponse: ...
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.NTACorporateInfoSearcherResponse": ...
 
     @overload
     def search_houjin(
@@ -225,7 +1146,10 @@ class KenAllClient:
         facet_process: Optional[str] = None,
         facet_close_cause: Optional[str] = None,
         api_version: None = None,
-    ) -> compatible.NTACorporateInfoSearcherResponse: ...
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.NTACorporateInfoSearcherResponse": ...
 
     def search_houjin(
         self,
@@ -238,6 +1162,9 @@ class KenAllClient:
         facet_process: Optional[str] = None,
         facet_close_cause: Optional[str] = None,
         api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Search corporate info"""
         req = self.create_houjin_search_request(
@@ -251,7 +1178,98 @@ class KenAllClient:
             facet_close_cause=facet_close_cause,
             api_version=api_version,
         )
-        return self.fetch_search_houjin_result(req, api_version)
+        return self.fetch_search_houjin_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
+
+    @overload
+    def iter_search_houjin_pages(
+        self,
+        q: str,
+        limit: int = 100,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: Literal["2024-01-01"] = ...,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["v20240101.NTACorporateInfoSearcherResponse"]: ...
+
+    @overload
+    def iter_search_houjin_pages(
+        self,
+        q: str,
+        limit: int = 100,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: Literal["2025-01-01"] = ...,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["v20250101.NTACorporateInfoSearcherResponse"]: ...
+
+    @overload
+    def iter_search_houjin_pages(
+        self,
+        q: str,
+        limit: int = 100,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: None = None,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> Iterator["compatible.NTACorporateInfoSearcherResponse"]: ...
+
+    def iter_search_houjin_pages(
+        self,
+        q: str,
+        limit: int = 100,
+        mode: Optional[str] = None,
+        facet_area: Optional[str] = None,
+        facet_kind: Optional[str] = None,
+        facet_process: Optional[str] = None,
+        facet_close_cause: Optional[str] = None,
+        api_version: Optional[APIVersion] = None,
+        concurrency: Union[int, AdaptiveConcurrencyLimiter] = 4,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
+        """Iterate over every page of a corporate info search
+
+        Pages after the first are fetched concurrently and yielded in order.
+        """
+        call_deadline = Deadline.of(deadline)
+
+        def page(offset):
+            return self.search_houjin(
+                q=q,
+                offset=offset,
+                limit=limit,
+                mode=mode,
+                facet_area=facet_area,
+                facet_kind=facet_kind,
+                facet_process=facet_process,
+                facet_close_cause=facet_close_cause,
+                api_version=api_version,
+                timeout=timeout,
+                deadline=call_deadline,
+            )
+
+        return self._iter_pages(page, limit, concurrency)
 
     # Holiday search (same across all versions)
     def search_holiday(
@@ -260,376 +1278,403 @@ class KenAllClient:
         from_: Optional[str] = None,
         to: Optional[str] = None,
         api_version: Optional[APIVersion] = None,
-    ) -> HolidaySearchResult:
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "HolidaySearchResult":
         """Search holidays"""
 
         req = self.create_holiday_search_request(
             year=year, from_date=from_, to_date=to, api_version=api_version
         )
-        return self.fetch_search_holiday_result(req, api_version)
+        return self.fetch_search_holiday_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     # Bank APIs with version-specific return types (available from 2023-09-01)
     @overload
     def get_banks(
-        self, api_version: Literal["2023-09-01"] = ...
-    ) -> v20230901.BanksResponse: ...
+        self,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BanksResponse": ...
 
     @overload
     def get_banks(
-        self, api_version: Literal["2024-01-01"] = ...
-    ) -> v20240101.BanksResponse: ...
+        self,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BanksResponse": ...
 
     @overload
     def get_banks(
-        self, api_version: Literal["2025-01-01"] = ...
-    ) -> v20250101.BanksResponse: ...
+        self,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BanksResponse": ...
 
     @overload
-    def get_banks(self, api_version: None = None) -> compatible.BanksResponse: ...
+    def get_banks(
+        self,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BanksResponse": ...
 
-    def get_banks(self, api_version: Optional[APIVersion] = None):
+    def get_banks(
+        self,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
         """Get all banks"""
         req = self.create_banks_request(api_version)
-        return self.fetch_banks_result(req, api_version)
+        return self.fetch_banks_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     @overload
     def get_bank(
-        self, bank_code: str, api_version: Literal["2023-09-01"] = ...
-    ) -> v20230901.BankResolverResponse: ...
+        self,
+        bank_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BankResolverResponse": ...
 
     @overload
     def get_bank(
-        self, bank_code: str, api_version: Literal["2024-01-01"] = ...
-    ) -> v20240101.BankResolverResponse: ...
+        self,
+        bank_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BankResolverResponse": ...
 
     @overload
     def get_bank(
-        self, bank_code: str, api_version: Literal["2025-01-01"] = ...
-    ) -> v20250101.BankResolverResponse: ...
+        self,
+        bank_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BankResolverResponse": ...
 
     @overload
     def get_bank(
-        self, bank_code: str, api_version: None = None
-    ) -> compatible.BankResolverResponse: ...
+        self,
+        bank_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BankResolverResponse": ...
 
-    def get_bank(self, bank_code: str, api_version: Optional[APIVersion] = None):
+    def get_bank(
+        self,
+        bank_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
         """Get specific bank"""
         req = self.create_bank_request(bank_code, api_version)
-        return self.fetch_bank_result(req, api_version)
+        return self.fetch_bank_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     @overload
     def get_bank_branches(
-        self, bank_code: str, api_version: Literal["2023-09-01"] = ...
-    ) -> v20230901.BankBranchesResponse: ...
+        self,
+        bank_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BankBranchesResponse": ...
 
     @overload
     def get_bank_branches(
-        self, bank_code: str, api_version: Literal["2024-01-01"] = ...
-    ) -> v20240101.BankBranchesResponse: ...
+        self,
+        bank_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BankBranchesResponse": ...
 
     @overload
     def get_bank_branches(
-        self, bank_code: str, api_version: Literal["2025-01-01"] = ...
-    ) -> v20250101.BankBranchesResponse: ...
+        self,
+        bank_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BankBranchesResponse": ...
 
     @overload
     def get_bank_branches(
-        self, bank_code: str, api_version: None = None
-    ) -> compatible.BankBranchesResponse: ...
+        self,
+        bank_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BankBranchesResponse": ...
 
     def get_bank_branches(
-        self, bank_code: str, api_version: Optional[APIVersion] = None
+        self,
+        bank_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Get branches for a bank"""
         req = self.create_bank_branches_request(bank_code, api_version)
-        return self.fetch_bank_branches_result(req, api_version)
+        return self.fetch_bank_branches_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     @overload
     def get_bank_branch(
-        self, bank_code: str, branch_code: str, api_version: Literal["2023-09-01"] = ...
-    ) -> v20230901.BankBranchResolverResponse: ...
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Literal["2023-09-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20230901.BankBranchResolverResponse": ...
 
     @overload
     def get_bank_branch(
-        self, bank_code: str, branch_code: str, api_version: Literal["2024-01-01"] = ...
-    ) -> v20240101.BankBranchResolverResponse: ...
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Literal["2024-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20240101.BankBranchResolverResponse": ...
 
     @overload
     def get_bank_branch(
-        self, bank_code: str, branch_code: str, api_version: Literal["2025-01-01"] = ...
-    ) -> v20250101.BankBranchResolverResponse: ...
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.BankBranchResolverResponse": ...
 
     @overload
     def get_bank_branch(
-        self, bank_code: str, branch_code: str, api_version: None = None
-    ) -> compatible.BankBranchResolverResponse: ...
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "compatible.BankBranchResolverResponse": ...
 
     def get_bank_branch(
-        self, bank_code: str, branch_code: str, api_version: Optional[APIVersion] = None
+        self,
+        bank_code: str,
+        branch_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Get specific branch"""
         req = self.create_bank_branch_request(bank_code, branch_code, api_version)
-        return self.fetch_bank_branch_result(req, api_version)
+        return self.fetch_bank_branch_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     # Backward compatibility methods for existing tests
-    def create_request(
-        self, postal_code: str, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Backward compatibility method for tests"""
-        url = urllib.parse.urljoin(f"{self.api_url}/v1/postalcode/", postal_code)
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
-    def create_address_search_request(
+    def fetch(
         self,
-        *,
-        q: Optional[str],
-        t: Optional[str],
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
-        facet: Optional[str] = None,
+        req: urllib.request.Request,
         api_version: Optional[APIVersion] = None,
-    ) -> urllib.request.Request:
-        """Create request for address search"""
-        query_mapping: List[Tuple[str, Optional[str]]] = [
-            ("q", q),
-            ("t", t),
-            ("offset", str(offset) if offset is not None else None),
-            ("limit", str(limit) if limit is not None else None),
-            ("facet", facet),
-        ]
-
-        query = urllib.parse.urlencode(
-            [(k, v) for k, v in query_mapping if v is not None]
-        )
-        url = f"{self.api_url}/v1/postalcode/?{query}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
-    def fetch(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Backward compatibility method for tests"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, not_found=True, timeout=timeout, deadline=deadline)
 
-        return create_address_resolver_response(d, api_version)
+        return self._result(create_address_resolver_response, d, api_version)
 
     def fetch_address_search_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch address search result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, timeout=timeout, deadline=deadline)
 
-        return create_address_searcher_response(d, api_version)
+        return self._result(create_address_searcher_response, d, api_version, self.lazy)
 
-    def create_houjin_request(
-        self, houjinbangou: str, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Backward compatibility method for tests"""
-        url = f"{self.api_url}/v1/houjinbangou/{houjinbangou}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
-    def create_houjin_search_request(
+    def fetch_houjin_result(
         self,
-        q: str,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
-        mode: Optional[str] = None,
-        facet_area: Optional[str] = None,
-        facet_kind: Optional[str] = None,
-        facet_process: Optional[str] = None,
-        facet_close_cause: Optional[str] = None,
+        req: urllib.request.Request,
         api_version: Optional[APIVersion] = None,
-    ) -> urllib.request.Request:
-        """Create request for houjin search"""
-        query_mapping: List[Tuple[str, Optional[str]]] = [
-            ("q", q),
-            ("offset", str(offset) if offset is not None else None),
-            ("limit", str(limit) if limit is not None else None),
-            ("mode", mode),
-        ]
-
-        # Add facets separately
-        if facet_area:
-            query_mapping.append(("facet_area", facet_area))
-        if facet_kind:
-            query_mapping.append(("facet_kind", facet_kind))
-        if facet_process:
-            query_mapping.append(("facet_process", facet_process))
-        if facet_close_cause:
-            query_mapping.append(("facet_close_cause", facet_close_cause))
-
-        query = urllib.parse.urlencode(
-            [(k, v) for k, v in query_mapping if v is not None]
-        )
-        url = f"{self.api_url}/v1/houjinbangou?{query}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
-    def fetch_houjin_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Backward compatibility method for tests"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, not_found=True, timeout=timeout, deadline=deadline)
 
-        return create_corporate_info_resolver_response(d, api_version)
+        return self._result(create_corporate_info_resolver_response, d, api_version)
 
     def fetch_search_houjin_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Backward compatibility method for tests"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, timeout=timeout, deadline=deadline)
 
-        return create_corporate_info_searcher_response(d, api_version)
+        return self._result(
+            create_corporate_info_searcher_response, d, api_version, self.lazy
+        )
 
     def fetch_search_holiday_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Backward compatibility method for tests"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
-        # Holiday model is the same across all versions
-        from kenallclient.models.compatible import HolidaySearchResult
-
-        return HolidaySearchResult.fromdict(d)
+        d = self._fetch_json(req, timeout=timeout, deadline=deadline)
+        return self._result(create_holiday_search_result, d, api_version)
 
-    def create_holiday_search_request(
+    def fetch_city_result(
         self,
-        year: Optional[int] = None,
-        from_date: Optional[str] = None,
-        to_date: Optional[str] = None,
+        req: urllib.request.Request,
         api_version: Optional[APIVersion] = None,
-    ) -> urllib.request.Request:
-        """Create request for holiday search"""
-        query_mapping: List[Tuple[str, Optional[str]]] = [
-            ("year", str(year) if year is not None else None),
-            ("from", from_date),
-            ("to", to_date),
-        ]
-
-        query = urllib.parse.urlencode(
-            [(k, v) for k, v in query_mapping if v is not None]
-        )
-        url = f"{self.api_url}/v1/holidays?{query}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
-    def create_city_request(
-        self, city_code: str, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Create request for city lookup"""
-        url = f"{self.api_url}/v1/cities/{city_code}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
-    def fetch_city_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch city result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, timeout=timeout, deadline=deadline)
 
-        return create_city_resolver_response(d, api_version)
+        return self._result(create_city_resolver_response, d, api_version)
 
     # Bank API helper methods
-    def create_banks_request(
-        self, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Create request for getting all banks"""
-        url = f"{self.api_url}/v1/bank"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
     def fetch_banks_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch banks result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, timeout=timeout, deadline=deadline)
 
-        return create_banks_response(d, api_version)
-
-    def create_bank_request(
-        self, bank_code: str, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Create request for getting specific bank"""
-        url = f"{self.api_url}/v1/bank/{bank_code}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
+        return self._result(create_banks_response, d, api_version)
 
     def fetch_bank_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch bank result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, not_found=True, timeout=timeout, deadline=deadline)
 
-        return create_bank_resolver_response(d, api_version)
-
-    def create_bank_branches_request(
-        self, bank_code: str, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Create request for getting bank branches"""
-        url = f"{self.api_url}/v1/bank/{bank_code}/branches"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
+        return self._result(create_bank_resolver_response, d, api_version)
 
     def fetch_bank_branches_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch bank branches result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, timeout=timeout, deadline=deadline)
 
-        return create_bank_branches_response(d, api_version)
-
-    def create_bank_branch_request(
-        self, bank_code: str, branch_code: str, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Create request for getting specific bank branch"""
-        url = f"{self.api_url}/v1/bank/{bank_code}/branches/{branch_code}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
+        return self._result(create_bank_branches_response, d, api_version)
 
     def fetch_bank_branch_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch bank branch result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, not_found=True, timeout=timeout, deadline=deadline)
 
-        return create_bank_branch_resolver_response(d, api_version)
+        return self._result(create_bank_branch_resolver_response, d, api_version)
 
     # School APIs (available from 2025-01-01)
     @overload
     def get_school(
-        self, school_code: str, api_version: Literal["2025-01-01"] = ...
-    ) -> v20250101.SchoolResolverResponse: ...
+        self,
+        school_code: str,
+        api_version: Literal["2025-01-01"] = ...,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolResolverResponse": ...
 
     @overload
     def get_school(
-        self, school_code: str, api_version: None = None
-    ) -> v20250101.SchoolResolverResponse: ...
+        self,
+        school_code: str,
+        api_version: None = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolResolverResponse": ...
 
-    def get_school(self, school_code: str, api_version: Optional[APIVersion] = None):
+    def get_school(
+        self,
+        school_code: str,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ):
         """Get school information by school code"""
         req = self.create_school_request(school_code, api_version)
-        return self.fetch_school_result(req, api_version)
+        return self.fetch_school_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     @overload
     def search_school(
@@ -643,7 +1688,10 @@ class KenAllClient:
         facet_establishment_type: Optional[str] = None,
         facet_branch: Optional[str] = None,
         api_version: Literal["2025-01-01"] = ...,
-    ) -> v20250101.SchoolSearcherResponse: ...
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolSearcherResponse": ...
 
     @overload
     def search_school(
@@ -657,7 +1705,10 @@ class KenAllClient:
         facet_establishment_type: Optional[str] = None,
         facet_branch: Optional[str] = None,
         api_version: None = None,
-    ) -> v20250101.SchoolSearcherResponse: ...
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> "v20250101.SchoolSearcherResponse": ...
 
     def search_school(
         self,
@@ -670,6 +1721,9 @@ class KenAllClient:
         facet_establishment_type: Optional[str] = None,
         facet_branch: Optional[str] = None,
         api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Search school information"""
         req = self.create_school_search_request(
@@ -683,71 +1737,33 @@ class KenAllClient:
             facet_branch=facet_branch,
             api_version=api_version,
         )
-        return self.fetch_school_search_result(req, api_version)
+        return self.fetch_school_search_result(
+            req, api_version, timeout=timeout, deadline=deadline
+        )
 
     # School API helper methods
-    def create_school_request(
-        self, school_code: str, api_version: Optional[APIVersion] = None
-    ) -> urllib.request.Request:
-        """Create request for school lookup"""
-        url = f"{self.api_url}/v1/school/{school_code}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
     def fetch_school_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        self,
+        req: urllib.request.Request,
+        api_version: Optional[APIVersion] = None,
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch school result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, not_found=True, timeout=timeout, deadline=deadline)
 
-        return create_school_resolver_response(d, api_version)
+        return self._result(create_school_resolver_response, d, api_version)
 
-    def create_school_search_request(
+    def fetch_school_search_result(
         self,
-        q: str,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
-        facet_area: Optional[str] = None,
-        facet_prefecture: Optional[str] = None,
-        facet_type: Optional[str] = None,
-        facet_establishment_type: Optional[str] = None,
-        facet_branch: Optional[str] = None,
+        req: urllib.request.Request,
         api_version: Optional[APIVersion] = None,
-    ) -> urllib.request.Request:
-        """Create request for school search"""
-        query_mapping: List[Tuple[str, Optional[str]]] = [
-            ("q", q),
-            ("offset", str(offset) if offset is not None else None),
-            ("limit", str(limit) if limit is not None else None),
-        ]
-
-        # Add facets separately
-        if facet_area:
-            query_mapping.append(("facet_area", facet_area))
-        if facet_prefecture:
-            query_mapping.append(("facet_prefecture", facet_prefecture))
-        if facet_type:
-            query_mapping.append(("facet_type", facet_type))
-        if facet_establishment_type:
-            query_mapping.append(("facet_establishment_type", facet_establishment_type))
-        if facet_branch:
-            query_mapping.append(("facet_branch", facet_branch))
-
-        query = urllib.parse.urlencode(
-            [(k, v) for k, v in query_mapping if v is not None]
-        )
-        url = f"{self.api_url}/v1/school/?{query}"
-        return urllib.request.Request(url, headers=self._build_headers(api_version))
-
-    def fetch_school_search_result(
-        self, req: urllib.request.Request, api_version: Optional[APIVersion] = None
+        *,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[DeadlineLike] = None,
     ):
         """Fetch school search result with version awareness"""
-        with urllib.request.urlopen(req) as res:
-            if not res.headers["Content-Type"].startswith("application/json"):
-                raise ValueError("not json response", res.read())
-            d = json.load(res)
+        d = self._fetch_json(req, timeout=timeout, deadline=deadline)
 
-        return create_school_searcher_response(d, api_version)
+        return self._result(create_school_searcher_response, d, api_version, self.lazy)
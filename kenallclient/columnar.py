@@ -0,0 +1,151 @@
+"""Columnar export of search results
+
+``ColumnarBuilder`` turns pages of search results into one list per field,
+reading the decoded JSON records directly instead of building a model per
+row. Use it with a client in raw mode::
+
+    client = KenAllClient(API_KEY, raw=True)
+    builder = ColumnarBuilder(model=v20250101.Address)
+    builder.add_pages(client.iter_search_pages(q="千代田", t=None))
+    df = builder.to_pandas()
+
+Nested records are flattened into dotted column names such as
+``corporation.name``; a missing or ``null`` record gives ``None`` in each of
+its columns. ``to_pandas`` and ``to_arrow`` need pandas and pyarrow, which
+are optional (``pip install kenallclient[pandas]`` or ``[arrow]``).
+"""
+
+import dataclasses
+import importlib
+import typing
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+__all__ = [
+    "ColumnarBuilder",
+]
+
+Path = Tuple[str, ...]
+
+# Stands for a null nested record
+_EMPTY: Mapping[str, Any] = {}
+
+
+def _model_paths(cls: Any, prefix: Path = ()) -> List[Path]:
+    """Return the flattened field paths of the model ``cls``"""
+    paths: List[Path] = []
+    hints = typing.get_type_hints(cls)
+    for f in dataclasses.fields(cls):
+        tp = hints[f.name]
+        if typing.get_origin(tp) is typing.Union:
+            args = [a for a in typing.get_args(tp) if a is not type(None)]
+            if len(args) == 1:
+                tp = args[0]
+        if isinstance(tp, type) and dataclasses.is_dataclass(tp):
+            paths.extend(_model_paths(tp, prefix + (f.name,)))
+        else:
+            paths.append(prefix + (f.name,))
+    return paths
+
+
+def _record_paths(record: Mapping[str, Any], prefix: Path = ()) -> List[Path]:
+    """Return the flattened field paths of the JSON record ``record``"""
+    paths: List[Path] = []
+    for name, value in record.items():
+        if isinstance(value, dict) and value:
+            paths.extend(_record_paths(value, prefix + (name,)))
+        else:
+            paths.append(prefix + (name,))
+    return paths
+
+
+def _lookup(record: Any, path: Path) -> Any:
+    for name in path:
+        if not isinstance(record, Mapping):
+            return None
+        record = record.get(name)
+    return record
+
+
+def _require(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{module} is required, install it with: pip install kenallclient[{extra}]"
+        ) from None
+
+
+class ColumnarBuilder:
+    """Accumulates JSON records into per-field columns
+
+    The columns are ``fields`` if given, as dotted names, else the flattened
+    fields of ``model``, else the fields of the first record added.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        model: Optional[Any] = None,
+    ) -> None:
+        self._paths: Optional[List[Path]] = None
+        if fields is not None:
+            self._paths = [tuple(name.split(".")) for name in fields]
+        elif model is not None:
+            self._paths = _model_paths(model)
+        self._columns: List[List[Any]] = []
+        self._rows = 0
+        if self._paths is not None:
+            self._columns = [[] for _ in self._paths]
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def fields(self) -> List[str]:
+        """Names of the columns, empty until known"""
+        return [".".join(path) for path in self._paths or ()]
+
+    def add_records(self, records: Sequence[Mapping[str, Any]]) -> None:
+        """Append the JSON records ``records``, one row each"""
+        if not records:
+            return
+        if self._paths is None:
+            self._paths = _record_paths(records[0])
+            self._columns = [[] for _ in self._paths]
+        for path, column in zip(self._paths, self._columns, strict=True):
+            if len(path) == 1:
+                name = path[0]
+                column.extend([r.get(name) for r in records])
+            elif len(path) == 2:
+                outer, inner = path
+                column.extend([(r.get(outer) or _EMPTY).get(inner) for r in records])
+            else:
+                column.extend([_lookup(r, path) for r in records])
+        self._rows += len(records)
+
+    def add_page(self, page: Mapping[str, Any]) -> None:
+        """Append the records of a search result page, decoded from JSON"""
+        if not isinstance(page, Mapping):
+            raise TypeError(
+                "pages must be decoded JSON, as returned by a client with raw=True"
+            )
+        self.add_records(page["data"])
+
+    def add_pages(self, pages: Iterable[Mapping[str, Any]]) -> None:
+        """Append the records of every page of ``pages``"""
+        for page in pages:
+            self.add_page(page)
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Return the columns by name"""
+        return dict(zip(self.fields, self._columns, strict=True))
+
+    def to_pandas(self) -> Any:
+        """Return the columns as a ``pandas.DataFrame``"""
+        pandas = _require("pandas", "pandas")
+        return pandas.DataFrame(self.columns(), columns=self.fields)
+
+    def to_arrow(self) -> Any:
+        """Return the columns as a ``pyarrow.Table``"""
+        pyarrow = _require("pyarrow", "arrow")
+        return pyarrow.table(self.columns())
@@ -0,0 +1,201 @@
+"""Adaptive concurrency control for batch lookups
+
+``AdaptiveConcurrencyLimiter`` bounds the number of requests in flight with an
+AIMD (additive increase, multiplicative decrease) limit: it grows by about one
+request per round trip while requests succeed with a healthy latency, and is
+cut by ``backoff_ratio`` when the API answers 429 or a request times out.
+Calls answered without reaching the API, such as cache hits, call
+``served_locally()`` and are not recorded.
+"""
+
+import collections
+import dataclasses
+import socket
+import threading
+import time
+import urllib.error
+from typing import Callable, Optional, TypeVar
+
+from kenallclient.exceptions import DeadlineExceeded
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyStats",
+    "served_locally",
+]
+
+T = TypeVar("T")
+
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+_local = threading.local()
+
+
+def served_locally() -> None:
+    """Mark the current ``AdaptiveConcurrencyLimiter.call`` as not sent
+
+    Its outcome is left out of the limit and the latency statistics.
+    """
+    _local.served_locally = True
+
+
+def is_overload(error: BaseException) -> bool:
+    """Tell if ``error`` means the API or the network is overloaded"""
+    if isinstance(error, DeadlineExceeded):
+        return False
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in OVERLOAD_STATUSES
+    if isinstance(error, urllib.error.URLError):
+        return isinstance(error.reason, (socket.timeout, TimeoutError))
+    return isinstance(error, (socket.timeout, TimeoutError))
+
+
+@dataclasses.dataclass()
+class ConcurrencyStats:
+    """Snapshot of the state of an ``AdaptiveConcurrencyLimiter``
+
+    Latencies are in seconds; ``latency`` is an exponentially weighted moving
+    average of successful requests.
+    """
+
+    limit: int
+    in_flight: int
+    latency: float
+    min_latency: float
+    successes: int
+    overloads: int
+    errors: int
+
+
+class AdaptiveConcurrencyLimiter:
+    """Thread-safe AIMD limit on the number of requests in flight
+
+    A request is healthy when it succeeds within ``latency_tolerance`` times
+    the lowest latency of the last ``window`` successes. Healthy requests
+    raise the limit, other failures and slow requests hold it. The limit is
+    cut at most once per round trip, so a burst of 429s from one window is a
+    single signal.
+
+    :param initial_limit: starting number of requests in flight
+    :param min_limit: lower bound of the limit
+    :param max_limit: upper bound of the limit
+    :param backoff_ratio: factor applied to the limit on overload
+    :param latency_tolerance: ratio to the lowest latency above which the
+        limit stops growing
+    :param smoothing: weight of a new sample in the average latency
+    :param window: number of recent successes the lowest latency is taken from
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        window: int = 100,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min <= initial <= max")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if window < 1:
+            raise ValueError("window must be positive")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._latency = 0.0
+        self._min_latency = 0.0
+        self._recent: collections.deque[float] = collections.deque(maxlen=window)
+        self._successes = 0
+        self._overloads = 0
+        self._errors = 0
+        self._decreased_at = float("-inf")
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def stats(self) -> ConcurrencyStats:
+        with self._cond:
+            return ConcurrencyStats(
+                limit=self.limit,
+                in_flight=self._in_flight,
+                latency=self._latency,
+                min_latency=self._min_latency,
+                successes=self._successes,
+                overloads=self._overloads,
+                errors=self._errors,
+            )
+
+    def acquire(self) -> float:
+        """Block until a request may start and return its start time"""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+        return time.monotonic()
+
+    def release(
+        self,
+        started: float,
+        error: Optional[BaseException] = None,
+        sent: bool = True,
+    ) -> None:
+        """Record the outcome of a request started at ``started``
+
+        A request that was not ``sent`` to the API only frees its slot.
+        """
+        now = time.monotonic()
+        with self._cond:
+            self._in_flight -= 1
+            if sent:
+                self._record_outcome(started, now, error)
+            self._cond.notify_all()
+
+    def _record_outcome(
+        self, started: float, now: float, error: Optional[BaseException]
+    ) -> None:
+        if error is None:
+            latency = now - started
+            self._successes += 1
+            self._record_latency(latency)
+            if latency <= self._min_latency * self.latency_tolerance:
+                # about one more request per full window of successes
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+        elif is_overload(error):
+            self._overloads += 1
+            if started >= self._decreased_at:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._decreased_at = now
+        else:
+            self._errors += 1
+
+    def _record_latency(self, latency: float) -> None:
+        if self._successes == 1:
+            self._latency = latency
+        else:
+            self._latency += self.smoothing * (latency - self._latency)
+        self._recent.append(latency)
+        self._min_latency = min(self._recent)
+
+    def call(self, fn: Callable[..., T], *args: object) -> T:
+        """Call ``fn(*args)`` within the limit, recording its outcome
+
+        The outcome is not recorded when ``fn`` calls ``served_locally()``.
+        """
+        started = self.acquire()
+        _local.served_locally = False
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            self.release(started, e, sent=not _local.served_locally)
+            raise
+        self.release(started, sent=not _local.served_locally)
+        return result
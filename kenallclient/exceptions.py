@@ -0,0 +1,56 @@
+"""Exceptions raised by KenAllClient"""
+
+import email.message
+import urllib.error
+from typing import IO, Any, Optional
+
+__all__ = [
+    "CircuitOpenError",
+    "DeadlineExceeded",
+    "NotFoundError",
+]
+
+
+class NotFoundError(urllib.error.HTTPError):
+    """The looked up postal code, corporate number, bank, branch or school
+    does not exist
+
+    This is an ``urllib.error.HTTPError`` with code 404, so existing handlers
+    of ``HTTPError`` keep working.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        msg: str = "Not Found",
+        hdrs: Any = None,
+        fp: Optional[IO[bytes]] = None,
+    ) -> None:
+        if hdrs is None:
+            hdrs = email.message.Message()
+        super().__init__(url, 404, msg, hdrs, fp)
+
+
+class CircuitOpenError(Exception):
+    """Requests to an endpoint are rejected because its circuit is open
+
+    The endpoint failed repeatedly; requests are let through again after
+    ``retry_at`` (a ``time.monotonic()`` value).
+    """
+
+    def __init__(self, endpoint: str, retry_at: float) -> None:
+        super().__init__(f"circuit for {endpoint!r} is open")
+        self.endpoint = endpoint
+        self.retry_at = retry_at
+
+
+class DeadlineExceeded(TimeoutError):
+    """The time budget given by the ``deadline`` of a call ran out
+
+    ``in_flight`` tells that a request was waiting for the API when the
+    deadline passed, rather than waiting for a rate limit or a shared call.
+    """
+
+    def __init__(self, *args: Any, in_flight: bool = False) -> None:
+        super().__init__(*args)
+        self.in_flight = in_flight
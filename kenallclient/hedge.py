@@ -0,0 +1,260 @@
+"""Hedged requests to cut the tail latency of resolver lookups
+
+A hedged request sends a second, identical request when the first has not
+answered after a delay taken from a high percentile of recent latencies. The
+first response to arrive wins and the other request is cancelled. Hedging is
+budgeted: every request earns ``budget_ratio`` of a token, and each hedge
+spends a whole one, so the extra load stays below that ratio.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import math
+import threading
+import time
+import urllib.parse
+import urllib.request
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Optional,
+    TypeVar,
+)
+
+from kenallclient.cache import endpoint_of
+
+__all__ = [
+    "HedgePolicy",
+    "HedgeStats",
+]
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclasses.dataclass()
+class HedgeStats:
+    """Counters of a ``HedgePolicy``
+
+    ``hedged`` requests sent a second request; ``won`` of them were answered
+    by it first. ``skipped`` requests were slow but out of budget.
+    """
+
+    requests: int
+    hedged: int
+    won: int
+    skipped: int
+
+
+class HedgePolicy:
+    """Send a second request when a resolver lookup is slower than usual
+
+    Only idempotent requests without a query string, i.e. lookups of a single
+    resource such as ``get`` or ``get_bank``, are hedged; searches are not.
+    Until ``min_samples`` latencies have been observed for an endpoint the
+    delay is ``initial_delay``.
+
+    The synchronous client sends the requests of hedged lookups from worker
+    threads, the second ones from a pool of their own so that they never
+    queue behind first requests. It cannot interrupt a request already sent:
+    the losing response is read and discarded.
+
+    :param percentile: percentile of recent latencies after which a request
+        is hedged
+    :param initial_delay: delay in seconds before enough latencies are known
+    :param min_delay: lower bound of the delay in seconds
+    :param max_delay: upper bound of the delay in seconds
+    :param window: number of recent latencies kept per endpoint
+    :param min_samples: number of latencies needed to use ``percentile``
+    :param budget_ratio: extra requests allowed per request
+    :param max_budget: hedges that can be sent in a burst
+    :param endpoints: endpoint names to hedge (see ``endpoint_of``), all
+        resolver endpoints if omitted
+    :param max_workers: worker threads of each pool of the synchronous
+        client, which bounds its hedgeable lookups in flight; set it at least
+        to the ``concurrency`` of ``get_many``
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.05,
+        min_delay: float = 0.005,
+        max_delay: float = 1.0,
+        window: int = 200,
+        min_samples: int = 20,
+        budget_ratio: float = 0.1,
+        max_budget: float = 10.0,
+        endpoints: Optional[FrozenSet[str]] = None,
+        max_workers: int = 32,
+    ) -> None:
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= min_delay <= max_delay:
+            raise ValueError("delays must satisfy 0 <= min_delay <= max_delay")
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.budget_ratio = budget_ratio
+        self.max_budget = max_budget
+        self.endpoints = endpoints
+        self.max_workers = max_workers
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._budget = max_budget
+        self._requests = 0
+        self._hedged = 0
+        self._won = 0
+        self._skipped = 0
+        self._lock = threading.Lock()
+
+    def is_hedgeable(self, req: urllib.request.Request) -> bool:
+        if req.get_method() not in IDEMPOTENT_METHODS:
+            return False
+        if urllib.parse.urlsplit(req.full_url).query:
+            return False
+        return self.endpoints is None or endpoint_of(req.full_url) in self.endpoints
+
+    def delay(self, endpoint: str) -> float:
+        """Return the seconds to wait for a response before hedging"""
+        with self._lock:
+            latencies = sorted(self._latencies.get(endpoint, ()))
+        if len(latencies) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            rank = math.ceil(self.percentile / 100 * len(latencies))
+            delay = latencies[rank - 1]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(
+                requests=self._requests,
+                hedged=self._hedged,
+                won=self._won,
+                skipped=self._skipped,
+            )
+
+    def _record_latency(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = collections.deque(
+                    maxlen=self.window
+                )
+            latencies.append(latency)
+
+    def _start(self) -> None:
+        """Count a request and credit its share of the budget"""
+        with self._lock:
+            self._requests += 1
+            self._budget = min(self.max_budget, self._budget + self.budget_ratio)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                self._skipped += 1
+                return False
+            self._budget -= 1
+            self._hedged += 1
+            return True
+
+    def _record_win(self) -> None:
+        with self._lock:
+            self._won += 1
+
+    def _timed(self, endpoint: str, fn: Callable[[], T]) -> T:
+        started = time.monotonic()
+        result = fn()
+        self._record_latency(endpoint, time.monotonic() - started)
+        return result
+
+    def call(
+        self,
+        req: urllib.request.Request,
+        fn: Callable[[], T],
+        executor: concurrent.futures.Executor,
+        hedge_executor: Optional[concurrent.futures.Executor] = None,
+    ) -> T:
+        """Call ``fn`` performing ``req`` on ``executor``, hedging it if slow
+
+        The second request runs on ``hedge_executor``, by default
+        ``executor``. The first successful response wins; if both requests
+        fail, the error of the first one is raised.
+        """
+        if not self.is_hedgeable(req):
+            return fn()
+        endpoint = endpoint_of(req.full_url)
+        self._start()
+        primary = executor.submit(self._timed, endpoint, fn)
+        done, _ = concurrent.futures.wait([primary], timeout=self.delay(endpoint))
+        if done or not self._take_budget():
+            return primary.result()
+        hedge = (hedge_executor or executor).submit(self._timed, endpoint, fn)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is hedge:
+                        self._record_win()
+                    return future.result()
+        return primary.result()
+
+    async def call_async(
+        self,
+        req: urllib.request.Request,
+        fn: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Await ``fn()`` performing ``req``, hedging it if slow
+
+        The request which loses the race is cancelled.
+        """
+        if not self.is_hedgeable(req):
+            return await fn()
+        endpoint = endpoint_of(req.full_url)
+        self._start()
+
+        async def timed() -> T:
+            started = time.monotonic()
+            result = await fn()
+            self._record_latency(endpoint, time.monotonic() - started)
+            return result
+
+        primary = asyncio.ensure_future(timed())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay(endpoint))
+            if done or not self._take_budget():
+                return await primary
+            hedge = asyncio.ensure_future(timed())
+            tasks.add(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._record_win()
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,156 @@
+"""Interning of repeated strings in decoded payloads
+
+The records of a search page repeat the same prefecture, city and code
+strings, and the JSON decoder makes a new copy of each. An ``InternTable``
+replaces the values of such low-cardinality fields with one shared instance,
+so cached payloads and the models built from them hold each string once.
+
+A table is scoped to a client (``KenAllClient(interner=...)``) or to a cache
+(``MemoryCache(interner=...)``), and bounded: once full, new strings are left
+as they are.
+"""
+
+import dataclasses
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+__all__ = [
+    "INTERNED_FIELDS",
+    "InternStats",
+    "InternTable",
+]
+
+# Fields of Address, City, NTAEntityAddress and School taking few values
+INTERNED_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "version",
+        "jisx0402",
+        "prefecture",
+        "prefecture_code",
+        "prefecture_kana",
+        "prefecture_roman",
+        "city",
+        "city_code",
+        "city_kana",
+        "city_roman",
+        "county",
+        "county_kana",
+        "county_roman",
+        "city_without_county_and_ward",
+        "city_without_county_and_ward_kana",
+        "city_without_county_and_ward_roman",
+        "city_ward",
+        "city_ward_kana",
+        "city_ward_roman",
+        "type",
+        "jurisdiction_prefecture_code",
+    }
+)
+
+
+@dataclasses.dataclass()
+class InternStats:
+    """Counters of an intern table
+
+    ``hits`` values were replaced with an interned string, ``misses`` were
+    added to the table and ``rejected`` were left as is as the table is full.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    rejected: int = 0
+    entries: int = 0
+
+
+class InternTable:
+    """Bounded table of shared strings
+
+    :param max_entries: maximum number of distinct strings
+    :param fields: names of the payload fields whose values are interned
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 8192,
+        fields: Optional[Iterable[str]] = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.fields = INTERNED_FIELDS if fields is None else frozenset(fields)
+        self._strings: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stats = InternStats()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: str) -> str:
+        """Return the shared instance of ``value``"""
+        shared = self._strings.get(value)
+        if shared is None:
+            return self._add(value)
+        with self._lock:
+            self._stats.hits += 1
+        return shared
+
+    def _add(self, value: str) -> str:
+        with self._lock:
+            if len(self._strings) >= self.max_entries:
+                self._stats.rejected += 1
+                return value
+            self._stats.misses += 1
+            return self._strings.setdefault(value, value)
+
+    def intern_payload(self, payload: Any) -> Any:
+        """Intern the values of ``fields`` in the decoded JSON ``payload``
+
+        ``payload`` is modified in place and returned.
+        """
+        if isinstance(payload, dict):
+            hits = self._intern_dict(payload)
+        elif isinstance(payload, list):
+            hits = self._intern_list(payload)
+        else:
+            return payload
+        # hits are looked up without the lock and counted once per payload
+        if hits:
+            with self._lock:
+                self._stats.hits += hits
+        return payload
+
+    def _intern_dict(self, d: Dict[str, Any]) -> int:
+        fields = self.fields
+        strings = self._strings
+        hits = 0
+        for key, value in d.items():
+            if type(value) is str:
+                if key in fields:
+                    shared = strings.get(value)
+                    if shared is None:
+                        d[key] = self._add(value)
+                    else:
+                        d[key] = shared
+                        hits += 1
+            elif isinstance(value, dict):
+                hits += self._intern_dict(value)
+            elif isinstance(value, list):
+                hits += self._intern_list(value)
+        return hits
+
+    def _intern_list(self, items: Any) -> int:
+        hits = 0
+        for item in items:
+            if isinstance(item, dict):
+                hits += self._intern_dict(item)
+            elif isinstance(item, list):
+                hits += self._intern_list(item)
+        return hits
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strings.clear()
+
+    def stats(self) -> InternStats:
+        with self._lock:
+            return dataclasses.replace(self._stats, entries=len(self._strings))
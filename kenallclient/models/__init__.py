@@ -1,7 +1,31 @@
-from typing import Literal
+import importlib
+from typing import Any, List, Literal
 
 APIVersion = Literal["2022-11-01", "2023-09-01", "2024-01-01", "2025-01-01"]
 
 __all__ = [
     "APIVersion",
 ]
+
+# Submodules imported on first access, so that a process only pays for the
+# model classes of the API versions it uses
+_SUBMODULES = (
+    "compatible",
+    "compiler",
+    "factories",
+    "lazy",
+    "v20221101",
+    "v20230901",
+    "v20240101",
+    "v20250101",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_SUBMODULES))
@@ -43,7 +43,7 @@ __all__ = [
 
 
 # Base classes merged from v20220901 (used only internally for compatibility)
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Corporation:
     """Corporation model (base class for compatibility)"""
 
@@ -59,7 +59,7 @@ class Corporation:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoFacetResults:
     """Facet results for corporate info (base class for compatibility)"""
 
@@ -106,7 +106,7 @@ class NTACorporateInfoFacetResults:
         )
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Address:
     """Compatible Address model that works with both v20220901 and v20221101"""
 
@@ -165,7 +165,7 @@ class Address:
         return cls(**filtered_data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressResolverResponse:
     """Compatible Address resolver response"""
 
@@ -178,7 +178,7 @@ class AddressResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressSearcherResponse:
     """Compatible Address searcher response"""
 
@@ -201,7 +201,7 @@ class AddressSearcherResponse:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class City:
     """Compatible City model that works with both v20220901 and v20221101"""
 
@@ -226,7 +226,7 @@ class City:
         return cls(**filtered_data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class CityResolverResponse:
     """Compatible City resolver response"""
 
@@ -239,7 +239,7 @@ class CityResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Holiday:
     """Holiday model (same across all versions)"""
 
@@ -253,7 +253,7 @@ class Holiday:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class HolidaySearchResult:
     """Holiday search result (same across all versions)"""
 
@@ -265,7 +265,7 @@ class HolidaySearchResult:
         return HolidaySearchResult(data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfo:
     """Compatible NTACorporateInfo that ensures close_cause is always string"""
 
@@ -357,7 +357,7 @@ class NTACorporateInfo:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoResolverResponse:
     """Compatible resolver response that converts numeric close_cause to string"""
 
@@ -373,7 +373,7 @@ class NTACorporateInfoResolverResponse:
         )
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoSearcherResponse:
     """Compatible searcher response (no conversion needed for search results)"""
 
@@ -395,7 +395,7 @@ class NTACorporateInfoSearcherResponse:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchesResponse:
     """Compatible bank branches response that flattens the nested structure"""
 
@@ -435,7 +435,7 @@ class BankBranchesResponse:
             raise ValueError(f"Bank API not available for version {api_version}")
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchResolverResponse:
     """Compatible bank branch resolver response that flattens the nested structure"""
 
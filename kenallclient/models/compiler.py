@@ -0,0 +1,226 @@
+"""Generated fast-path decoders of the response models
+
+``fromdict`` builds models generically: it copies the payload, converts
+nested records one ``fromdict`` call at a time and passes every field by
+keyword. For large search results that bookkeeping dominates decoding.
+
+``decoder(cls)`` compiles, once per model class, a function doing the same
+work in a single expression: fields are passed positionally and nested
+records, lists and mappings are built inline. The field layout comes from
+the dataclass fields and type hints of ``cls``, so every API version gets
+its own decoder.
+
+A compiled decoder only takes the fast path for payloads whose keys match
+the fields of the model exactly; anything else, including malformed
+payloads, is handed to ``cls.fromdict``. Results and errors are therefore
+the same as those of ``fromdict``.
+"""
+
+import dataclasses
+import inspect
+import threading
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+__all__ = [
+    "compile_decoder",
+    "decoder",
+]
+
+T = TypeVar("T")
+
+Decoder = Callable[[Dict[str, Any]], Any]
+
+# Keys the API may leave out of a payload, with the fallback of fromdict
+_OPTIONAL_KEYS = ("facets",)
+
+_lock = threading.RLock()
+_decoders: Dict[type, Decoder] = {}
+
+
+def _is_model(tp: Any) -> bool:
+    return isinstance(tp, type) and dataclasses.is_dataclass(tp)
+
+
+def _is_handwritten(cls: Any) -> bool:
+    """Whether ``fromdict`` of ``cls`` does more than map fields"""
+    if cls.__name__.endswith("FacetResults"):
+        return True
+    return "api_version" in inspect.signature(cls.fromdict).parameters
+
+
+def _is_lenient(cls: Any) -> bool:
+    """Whether ``fromdict`` of ``cls`` accepts missing and unknown keys"""
+    return any(
+        f.default is not dataclasses.MISSING
+        or f.default_factory is not dataclasses.MISSING
+        for f in dataclasses.fields(cls)
+    )
+
+
+def _optional_arg(tp: Any) -> Any:
+    """Return ``X`` if ``tp`` is ``Optional[X]``, else ``None``"""
+    if typing.get_origin(tp) is typing.Union:
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return None
+
+
+class _Builder:
+    """Source generator of one decoder function"""
+
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {}
+        self._names: Dict[int, str] = {}
+        self._counter = 0
+
+    def ref(self, obj: Any) -> str:
+        """Return the name binding ``obj`` in the generated function"""
+        name = self._names.get(id(obj))
+        if name is None:
+            name = self._names[id(obj)] = f"_{len(self._names)}"
+            self.namespace[name] = obj
+        return name
+
+    def var(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def bind(self, src: str) -> Tuple[str, str]:
+        """Return a name for ``src``, and how to bind it on first use"""
+        if src.isidentifier():
+            return src, src
+        name = self.var("v")
+        return name, f"({name} := {src})"
+
+    def value(self, tp: Any, src: str) -> str:
+        """Return the expression converting ``src``, a value of type ``tp``"""
+        if _is_model(tp):
+            return self.model(tp, src)
+        inner = _optional_arg(tp)
+        if inner is not None:
+            if not self.converts(inner):
+                return src
+            name, bound = self.bind(src)
+            return f"({self.value(inner, name)} if {bound} else {name})"
+        origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if origin is list and args and self.converts(args[0]):
+            item = self.var("i")
+            return f"[{self.value(args[0], item)} for {item} in {src}]"
+        if origin is dict and len(args) == 2 and self.converts(args[1]):
+            key, item = self.var("k"), self.var("i")
+            return (
+                f"{{{key}: {self.value(args[1], item)}"
+                f" for {key}, {item} in {src}.items()}}"
+            )
+        return src
+
+    def converts(self, tp: Any) -> bool:
+        """Whether values of type ``tp`` are converted at all"""
+        if _is_model(tp):
+            return True
+        inner = _optional_arg(tp)
+        if inner is not None:
+            return self.converts(inner)
+        origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if origin is list and args:
+            return self.converts(args[0])
+        if origin is dict and len(args) == 2:
+            return self.converts(args[1])
+        return False
+
+    def model(self, cls: Any, src: str) -> str:
+        """Return the expression building ``cls`` from ``src``"""
+        if _is_handwritten(cls):
+            return f"{self.ref(cls.fromdict)}({src})"
+        if _is_lenient(cls):
+            return f"{self.ref(decoder(cls))}({src})"
+        name, bound = self.bind(src)
+        return (
+            f"({self.ref(cls)}({self.arguments(cls, name)})"
+            f" if len({bound}) == {self.size(cls, name)}"
+            f" else {self.ref(cls.fromdict)}({name}))"
+        )
+
+    def size(self, cls: Any, src: str) -> str:
+        """Return the expected number of keys in ``src``"""
+        size = str(len(dataclasses.fields(cls)))
+        for f in dataclasses.fields(cls):
+            if f.name in _OPTIONAL_KEYS:
+                size += f" - ({f.name!r} not in {src})"
+        return size
+
+    def arguments(self, cls: Any, src: str) -> str:
+        hints = typing.get_type_hints(cls)
+        args: List[str] = []
+        for f in dataclasses.fields(cls):
+            tp = hints[f.name]
+            if f.name in _OPTIONAL_KEYS:
+                args.append(self.optional_key(tp, f"{src}.get({f.name!r})"))
+            elif f.default is not dataclasses.MISSING:
+                default = self.ref(f.default)
+                args.append(self.value(tp, f"{src}.get({f.name!r}, {default})"))
+            elif f.default_factory is not dataclasses.MISSING:
+                factory = self.ref(f.default_factory)
+                value = self.value(tp, f"{src}[{f.name!r}]")
+                args.append(f"({value} if {f.name!r} in {src} else {factory}())")
+            else:
+                args.append(self.value(tp, f"{src}[{f.name!r}]"))
+        return ", ".join(args)
+
+    def optional_key(self, tp: Any, src: str) -> str:
+        """Return the expression converting the facets of a search result"""
+        facets = _optional_arg(tp) or tp
+        if _is_model(facets):
+            return f"{self.ref(facets.fromdict)}({src} or {{}})"
+        return f"[tuple(p) for p in ({src} or {{}}).get('area', [])]"
+
+    def function(self, cls: Any) -> str:
+        """Return the source of the decoder of ``cls``"""
+        if _is_lenient(cls):
+            body = f"{self.ref(cls)}({self.arguments(cls, 'd')})"
+        else:
+            body = self.model(cls, "d")
+        fallback = self.ref(cls.fromdict)
+        return (
+            "def decode(d):\n"
+            "    try:\n"
+            f"        return {body}\n"
+            "    except Exception:\n"
+            f"        return {fallback}(d)\n"
+        )
+
+
+def compile_decoder(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """Build the decoder of ``cls``, bypassing the cache
+
+    Models whose ``fromdict`` depends on the API version, and facet results,
+    are returned as ``cls.fromdict``.
+    """
+    if not _is_model(cls):
+        raise TypeError(f"not a model class: {cls!r}")
+    if _is_handwritten(cls):
+        return cls.fromdict  # type: ignore[attr-defined, no-any-return]
+    builder = _Builder()
+    source = builder.function(cls)
+    code = compile(source, f"<decoder {cls.__module__}.{cls.__qualname__}>", "exec")
+    exec(code, builder.namespace)
+    fn = builder.namespace["decode"]
+    fn.__qualname__ = f"decoder.<{cls.__qualname__}>"
+    fn.__source__ = source
+    return fn  # type: ignore[no-any-return]
+
+
+def decoder(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """Return the decoder of ``cls``, compiling it on first use
+
+    The decoder is a drop-in replacement of ``cls.fromdict``.
+    """
+    fn: Optional[Decoder] = _decoders.get(cls)
+    if fn is None:
+        with _lock:
+            fn = _decoders.get(cls)
+            if fn is None:
+                fn = _decoders[cls] = compile_decoder(cls)
+    return fn
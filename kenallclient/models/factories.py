@@ -1,138 +1,171 @@
 """Factory functions for creating version-specific model instances from JSON payloads"""
 
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
+from kenallclient import models
 from kenallclient.types import APIVersion
 
-from . import (
-    compatible,
-    v20221101,
-    v20230901,
-    v20240101,
-    v20250101,
-)
+from .compiler import decoder
+from .lazy import lazy_decoder
+
+# The model modules are imported through ``models`` on first use; these
+# imports are for type checkers only
+if TYPE_CHECKING:
+    from . import (
+        compatible,
+        v20221101,
+        v20230901,
+        v20240101,
+        v20250101,
+    )
+
+
+def _search_decoder(cls: Any, lazy: bool) -> Any:
+    """Return the decoder of the search result ``cls``, lazy if ``lazy``"""
+    return lazy_decoder(cls) if lazy else decoder(cls)
 
 
 def create_address_resolver_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20221101.AddressResolverResponse,
-    v20230901.AddressResolverResponse,
-    v20240101.AddressResolverResponse,
-    v20250101.AddressResolverResponse,
-    compatible.AddressResolverResponse,
+    "v20221101.AddressResolverResponse",
+    "v20230901.AddressResolverResponse",
+    "v20240101.AddressResolverResponse",
+    "v20250101.AddressResolverResponse",
+    "compatible.AddressResolverResponse",
 ]:
     """Create an AddressResolverResponse instance for the specified API version"""
     if api_version == "2022-11-01":
-        return v20221101.AddressResolverResponse.fromdict(data)
+        return decoder(models.v20221101.AddressResolverResponse)(data)
     elif api_version == "2023-09-01":
-        return v20230901.AddressResolverResponse.fromdict(data)
+        return decoder(models.v20230901.AddressResolverResponse)(data)
     elif api_version == "2024-01-01":
-        return v20240101.AddressResolverResponse.fromdict(data)
+        return decoder(models.v20240101.AddressResolverResponse)(data)
     elif api_version == "2025-01-01":
-        return v20250101.AddressResolverResponse.fromdict(data)
+        return decoder(models.v20250101.AddressResolverResponse)(data)
     else:
-        return compatible.AddressResolverResponse.fromdict(data)
+        return decoder(models.compatible.AddressResolverResponse)(data)
 
 
 def create_address_searcher_response(
-    data: Dict[str, Any], api_version: Optional[APIVersion] = None
+    data: Dict[str, Any],
+    api_version: Optional[APIVersion] = None,
+    lazy: bool = False,
 ) -> Union[
-    v20221101.AddressSearcherResponse,
-    v20230901.AddressSearcherResponse,
-    v20240101.AddressSearcherResponse,
-    v20250101.AddressSearcherResponse,
-    compatible.AddressSearcherResponse,
+    "v20221101.AddressSearcherResponse",
+    "v20230901.AddressSearcherResponse",
+    "v20240101.AddressSearcherResponse",
+    "v20250101.AddressSearcherResponse",
+    "compatible.AddressSearcherResponse",
 ]:
     """Create an AddressSearcherResponse instance for the specified API version"""
     if api_version == "2022-11-01":
-        return v20221101.AddressSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20221101.AddressSearcherResponse, lazy)(data)
     elif api_version == "2023-09-01":
-        return v20230901.AddressSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20230901.AddressSearcherResponse, lazy)(data)
     elif api_version == "2024-01-01":
-        return v20240101.AddressSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20240101.AddressSearcherResponse, lazy)(data)
     elif api_version == "2025-01-01":
-        return v20250101.AddressSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20250101.AddressSearcherResponse, lazy)(data)
     else:
-        return compatible.AddressSearcherResponse.fromdict(data)
+        return _search_decoder(models.compatible.AddressSearcherResponse, lazy)(data)
 
 
 def create_city_resolver_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20221101.CityResolverResponse,
-    v20230901.CityResolverResponse,
-    v20240101.CityResolverResponse,
-    v20250101.CityResolverResponse,
-    compatible.CityResolverResponse,
+    "v20221101.CityResolverResponse",
+    "v20230901.CityResolverResponse",
+    "v20240101.CityResolverResponse",
+    "v20250101.CityResolverResponse",
+    "compatible.CityResolverResponse",
 ]:
     """Create a CityResolverResponse instance for the specified API version"""
     if api_version == "2022-11-01":
-        return v20221101.CityResolverResponse.fromdict(data)
+        return decoder(models.v20221101.CityResolverResponse)(data)
     elif api_version == "2023-09-01":
-        return v20230901.CityResolverResponse.fromdict(data)
+        return decoder(models.v20230901.CityResolverResponse)(data)
     elif api_version == "2024-01-01":
-        return v20240101.CityResolverResponse.fromdict(data)
+        return decoder(models.v20240101.CityResolverResponse)(data)
     elif api_version == "2025-01-01":
-        return v20250101.CityResolverResponse.fromdict(data)
+        return decoder(models.v20250101.CityResolverResponse)(data)
     else:
-        return compatible.CityResolverResponse.fromdict(data)
+        return decoder(models.compatible.CityResolverResponse)(data)
+
+
+def create_holiday_search_result(
+    data: Dict[str, Any], api_version: Optional[APIVersion] = None
+) -> "compatible.HolidaySearchResult":
+    """Create a HolidaySearchResult, which is the same for every API version"""
+    return decoder(models.compatible.HolidaySearchResult)(data)
 
 
 def create_corporate_info_resolver_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20240101.NTACorporateInfoResolverResponse,
-    v20250101.NTACorporateInfoResolverResponse,
-    compatible.NTACorporateInfoResolverResponse,
+    "v20240101.NTACorporateInfoResolverResponse",
+    "v20250101.NTACorporateInfoResolverResponse",
+    "compatible.NTACorporateInfoResolverResponse",
 ]:
     """Create a NTACorporateInfoResolverResponse for the specified API version"""
     if api_version == "2022-11-01":
-        return v20240101.NTACorporateInfoResolverResponse.fromdict(data)
+        return decoder(models.v20240101.NTACorporateInfoResolverResponse)(data)
     elif api_version == "2023-09-01":
-        return v20240101.NTACorporateInfoResolverResponse.fromdict(data)
+        return decoder(models.v20240101.NTACorporateInfoResolverResponse)(data)
     elif api_version == "2024-01-01":
-        return v20240101.NTACorporateInfoResolverResponse.fromdict(data)
+        return decoder(models.v20240101.NTACorporateInfoResolverResponse)(data)
     elif api_version == "2025-01-01":
-        return v20250101.NTACorporateInfoResolverResponse.fromdict(data)
+        return decoder(models.v20250101.NTACorporateInfoResolverResponse)(data)
     else:
         # Compatible mode: always convert to string close_cause
-        return compatible.NTACorporateInfoResolverResponse.fromdict(data)
+        return decoder(models.compatible.NTACorporateInfoResolverResponse)(data)
 
 
 def create_corporate_info_searcher_response(
-    data: Dict[str, Any], api_version: Optional[APIVersion] = None
+    data: Dict[str, Any],
+    api_version: Optional[APIVersion] = None,
+    lazy: bool = False,
 ) -> Union[
-    v20240101.NTACorporateInfoSearcherResponse,
-    v20250101.NTACorporateInfoSearcherResponse,
-    compatible.NTACorporateInfoSearcherResponse,
+    "v20240101.NTACorporateInfoSearcherResponse",
+    "v20250101.NTACorporateInfoSearcherResponse",
+    "compatible.NTACorporateInfoSearcherResponse",
 ]:
     """Create a NTACorporateInfoSearcherResponse for the specified API version"""
     if api_version == "2022-11-01":
-        return v20240101.NTACorporateInfoSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20240101.NTACorporateInfoSearcherResponse, lazy)(
+            data
+        )
     elif api_version == "2023-09-01":
-        return v20240101.NTACorporateInfoSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20240101.NTACorporateInfoSearcherResponse, lazy)(
+            data
+        )
     elif api_version == "2024-01-01":
-        return v20240101.NTACorporateInfoSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20240101.NTACorporateInfoSearcherResponse, lazy)(
+            data
+        )
     elif api_version == "2025-01-01":
-        return v20250101.NTACorporateInfoSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20250101.NTACorporateInfoSearcherResponse, lazy)(
+            data
+        )
     else:
         # Compatible mode: no conversion needed for search results
-        return compatible.NTACorporateInfoSearcherResponse.fromdict(data)
+        return _search_decoder(
+            models.compatible.NTACorporateInfoSearcherResponse, lazy
+        )(data)
 
 
 def create_banks_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20230901.BanksResponse,
-    v20240101.BanksResponse,
-    v20250101.BanksResponse,
-    compatible.BanksResponse,
+    "v20230901.BanksResponse",
+    "v20240101.BanksResponse",
+    "v20250101.BanksResponse",
+    "compatible.BanksResponse",
 ]:
     """Create a BanksResponse instance for the specified API version"""
     # Bank API only available from 2023-09-01
     if api_version in ["2023-09-01", "2024-01-01", "2025-01-01", None]:
-        return compatible.BanksResponse.fromdict(data)
+        return decoder(models.compatible.BanksResponse)(data)
     else:
         raise ValueError(f"Bank API not available for version {api_version}")
 
@@ -140,15 +173,15 @@ def create_banks_response(
 def create_bank_resolver_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20230901.BankResolverResponse,
-    v20240101.BankResolverResponse,
-    v20250101.BankResolverResponse,
-    compatible.BankResolverResponse,
+    "v20230901.BankResolverResponse",
+    "v20240101.BankResolverResponse",
+    "v20250101.BankResolverResponse",
+    "compatible.BankResolverResponse",
 ]:
     """Create a BankResolverResponse instance for the specified API version"""
     # Bank API only available from 2023-09-01
     if api_version in ["2023-09-01", "2024-01-01", "2025-01-01", None]:
-        return compatible.BankResolverResponse.fromdict(data)
+        return decoder(models.compatible.BankResolverResponse)(data)
     else:
         raise ValueError(f"Bank API not available for version {api_version}")
 
@@ -156,15 +189,17 @@ def create_bank_resolver_response(
 def create_bank_branches_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20230901.BankBranchesResponse,
-    v20240101.BankBranchesResponse,
-    v20250101.BankBranchesResponse,
-    compatible.BankBranchesResponse,
+    "v20230901.BankBranchesResponse",
+    "v20240101.BankBranchesResponse",
+    "v20250101.BankBranchesResponse",
+    "compatible.BankBranchesResponse",
 ]:
     """Create a BankBranchesResponse instance for the specified API version"""
     # Bank API only available from 2023-09-01
     if api_version in ["2023-09-01", "2024-01-01", "2025-01-01", None]:
-        return compatible.BankBranchesResponse.fromdict(data, api_version=api_version)
+        return models.compatible.BankBranchesResponse.fromdict(
+            data, api_version=api_version
+        )
     else:
         raise ValueError(f"Bank API not available for version {api_version}")
 
@@ -172,15 +207,15 @@ def create_bank_branches_response(
 def create_bank_branch_resolver_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20230901.BankBranchResolverResponse,
-    v20240101.BankBranchResolverResponse,
-    v20250101.BankBranchResolverResponse,
-    compatible.BankBranchResolverResponse,
+    "v20230901.BankBranchResolverResponse",
+    "v20240101.BankBranchResolverResponse",
+    "v20250101.BankBranchResolverResponse",
+    "compatible.BankBranchResolverResponse",
 ]:
     """Create a BankBranchResolverResponse for the specified API version"""
     # Bank API only available from 2023-09-01
     if api_version in ["2023-09-01", "2024-01-01", "2025-01-01", None]:
-        return compatible.BankBranchResolverResponse.fromdict(
+        return models.compatible.BankBranchResolverResponse.fromdict(
             data, api_version=api_version
         )
     else:
@@ -190,35 +225,39 @@ def create_bank_branch_resolver_response(
 def create_invoice_issuer_resolver_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
 ) -> Union[
-    v20240101.NTAQualifiedInvoiceIssuerInfoResolverResponse,
-    v20250101.NTAQualifiedInvoiceIssuerInfoResolverResponse,
-    compatible.NTAQualifiedInvoiceIssuerInfoResolverResponse,
+    "v20240101.NTAQualifiedInvoiceIssuerInfoResolverResponse",
+    "v20250101.NTAQualifiedInvoiceIssuerInfoResolverResponse",
+    "compatible.NTAQualifiedInvoiceIssuerInfoResolverResponse",
 ]:
     """Create a NTAQualifiedInvoiceIssuerInfoResolverResponse for the version"""
     # Invoice API only available from 2024-01-01
     if api_version in ["2024-01-01", "2025-01-01", None]:
-        return compatible.NTAQualifiedInvoiceIssuerInfoResolverResponse.fromdict(data)
+        return decoder(models.compatible.NTAQualifiedInvoiceIssuerInfoResolverResponse)(
+            data
+        )
     else:
         raise ValueError(f"Invoice API not available for version {api_version}")
 
 
 def create_school_resolver_response(
     data: Dict[str, Any], api_version: Optional[APIVersion] = None
-) -> v20250101.SchoolResolverResponse:
+) -> "v20250101.SchoolResolverResponse":
     """Create a SchoolResolverResponse for the specified API version"""
     # School API only available from 2025-01-01
     if api_version in ["2025-01-01", None]:
-        return v20250101.SchoolResolverResponse.fromdict(data)
+        return decoder(models.v20250101.SchoolResolverResponse)(data)
     else:
         raise ValueError(f"School API not available for version {api_version}")
 
 
 def create_school_searcher_response(
-    data: Dict[str, Any], api_version: Optional[APIVersion] = None
-) -> v20250101.SchoolSearcherResponse:
+    data: Dict[str, Any],
+    api_version: Optional[APIVersion] = None,
+    lazy: bool = False,
+) -> "v20250101.SchoolSearcherResponse":
     """Create a SchoolSearcherResponse for the specified API version"""
     # School API only available from 2025-01-01
     if api_version in ["2025-01-01", None]:
-        return v20250101.SchoolSearcherResponse.fromdict(data)
+        return _search_decoder(models.v20250101.SchoolSearcherResponse, lazy)(data)
     else:
         raise ValueError(f"School API not available for version {api_version}")
@@ -0,0 +1,159 @@
+"""Search results building their records on access
+
+A search page holds up to hundreds of records, of which callers often read a
+few fields of a few records. ``lazy_decoder(cls)`` decodes a search result
+``cls`` but leaves its ``data`` as a ``LazySequence`` over the JSON records,
+building each model on first access.
+
+``dataclasses.asdict`` and ``dataclasses.astuple`` do not recurse into a
+``LazySequence``: they copy it as a list of models, not of dicts. Call
+``materialize(result)`` first to get the same output as an eager result.
+"""
+
+import dataclasses
+import threading
+import typing
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from .compiler import decoder
+
+__all__ = [
+    "LazySequence",
+    "lazy_decoder",
+    "materialize",
+]
+
+T = TypeVar("T")
+
+_MISSING: Any = object()
+
+_lock = threading.Lock()
+_decoders: Dict[type, Callable[[Dict[str, Any]], Any]] = {}
+
+
+class LazySequence(Sequence[T]):
+    """Read-only sequence decoding the JSON records of a search result
+
+    Each record is built with ``decode`` on first access and cached. Slices
+    are lazy views sharing the cache. A lazy sequence compares equal to a
+    list of the same models, and is pickled and copied as a list. As it is
+    not a list, ``dataclasses.asdict`` copies it without converting its
+    models to dicts; see ``materialize``.
+    """
+
+    __slots__ = ("_records", "_decode", "_models", "_indices")
+
+    def __init__(
+        self,
+        records: List[Dict[str, Any]],
+        decode: Callable[[Dict[str, Any]], T],
+        _models: Optional[List[Any]] = None,
+        _indices: Optional[range] = None,
+    ) -> None:
+        self._records = records
+        self._decode = decode
+        self._models = [_MISSING] * len(records) if _models is None else _models
+        self._indices = range(len(records)) if _indices is None else _indices
+
+    def _get(self, index: int) -> T:
+        model = self._models[index]
+        if model is _MISSING:
+            model = self._models[index] = self._decode(self._records[index])
+        return model  # type: ignore[no-any-return]
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazySequence[T]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "LazySequence[T]"]:
+        if isinstance(index, slice):
+            return LazySequence(
+                self._records, self._decode, self._models, self._indices[index]
+            )
+        return self._get(self._indices[index])
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[T]:
+        for index in self._indices:
+            yield self._get(index)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, LazySequence)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other, strict=True)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazySequence({list(self)!r})"
+
+    def __reduce__(self) -> Any:
+        return list, (list(self),)
+
+    @property
+    def decoded(self) -> int:
+        """Number of records built so far"""
+        return sum(self._models[i] is not _MISSING for i in self._indices)
+
+
+def _build(cls: Any) -> Callable[[Dict[str, Any]], Any]:
+    item = typing.get_args(typing.get_type_hints(cls)["data"])[0]
+    decode_envelope = decoder(cls)
+    decode_item = decoder(item)
+
+    def decode(d: Dict[str, Any]) -> Any:
+        records = d["data"]
+        result = decode_envelope(dict(d, data=[]))
+        result.data = LazySequence(records, decode_item)
+        return result
+
+    return decode
+
+
+def lazy_decoder(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """Return the lazy decoder of the search result ``cls``
+
+    The decoder builds ``cls`` like ``decoder(cls)``, except for ``data``
+    which is a ``LazySequence`` of its models.
+    """
+    fn = _decoders.get(cls)
+    if fn is None:
+        with _lock:
+            fn = _decoders.get(cls)
+            if fn is None:
+                fn = _decoders[cls] = _build(cls)
+    return fn
+
+
+def materialize(result: T) -> T:
+    """Return ``result`` with its ``LazySequence`` fields built into lists
+
+    ``dataclasses.asdict(materialize(result))`` is the same as for the eager
+    result. ``result`` is returned as is when it holds no lazy sequence.
+    """
+    lazy = {
+        f.name: list(value)
+        for f in dataclasses.fields(result)  # type: ignore[arg-type]
+        if isinstance(value := getattr(result, f.name), LazySequence)
+    }
+    if not lazy:
+        return result
+    return dataclasses.replace(result, **lazy)  # type: ignore[type-var]
@@ -13,7 +13,7 @@ __all__ = [
 ]
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Corporation:
     """Corporation model for v2022-11-01"""
 
@@ -29,7 +29,7 @@ class Corporation:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Address:
     """Address model for v2022-11-01 - adds romanization and more fields"""
 
@@ -78,7 +78,7 @@ class Address:
         return cls(**i)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressResolverResponse:
     """Address resolver response for v2022-11-01"""
 
@@ -91,7 +91,7 @@ class AddressResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressSearcherResponse:
     """Address searcher response for v2022-11-01"""
 
@@ -114,7 +114,7 @@ class AddressSearcherResponse:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class City:
     """City model for v2022-11-01 - adds romanization"""
 
@@ -134,7 +134,7 @@ class City:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class CityResolverResponse:
     """City resolver response for v2022-11-01"""
 
@@ -22,7 +22,7 @@ __all__ = [
 
 
 # Models copied from v2022-11-01 to make this module self-contained
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Corporation:
     """Corporation model for v2022-11-01"""
 
@@ -38,7 +38,7 @@ class Corporation:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Address:
     """Address model for v2022-11-01 - adds romanization and more fields"""
 
@@ -87,7 +87,7 @@ class Address:
         return cls(**i)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressResolverResponse:
     """Address resolver response for v2022-11-01"""
 
@@ -100,7 +100,7 @@ class AddressResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressSearcherResponse:
     """Address searcher response for v2022-11-01"""
 
@@ -123,7 +123,7 @@ class AddressSearcherResponse:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class City:
     """City model for v2023-09-01 - adds county_* and city_without_county_and_ward_*"""
 
@@ -148,7 +148,7 @@ class City:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class CityResolverResponse:
     """City resolver response for v2022-11-01"""
 
@@ -162,7 +162,7 @@ class CityResolverResponse:
 
 
 # New models added in v2023-09-01 for Bank API
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Bank:
     """Bank model for v2023-09-01"""
 
@@ -177,7 +177,7 @@ class Bank:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranch:
     """Bank branch model for v2023-09-01"""
 
@@ -192,7 +192,7 @@ class BankBranch:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BanksResponse:
     """Banks response for v2023-09-01"""
 
@@ -205,7 +205,7 @@ class BanksResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankResolverResponse:
     """Bank resolver response for v2023-09-01"""
 
@@ -217,7 +217,7 @@ class BankResolverResponse:
         return cls(version=d["version"], data=Bank.fromdict(d["data"]))
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchesData:
     """Nested data structure for bank branches response in v2023-09-01"""
 
@@ -233,7 +233,7 @@ class BankBranchesData:
         return cls(bank=bank, branches=branches)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchesResponse:
     """Bank branches response for v2023-09-01"""
 
@@ -246,7 +246,7 @@ class BankBranchesResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchData:
     """Nested data structure for bank branch resolver response in v2023-09-01"""
 
@@ -260,7 +260,7 @@ class BankBranchData:
         return cls(bank=bank, branch=branch)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchResolverResponse:
     """Bank branch resolver response for v2023-09-01"""
 
@@ -29,7 +29,7 @@ __all__ = [
 
 
 # Models copied from v2023-09-01 to make this module self-contained
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Corporation:
     """Corporation model for v2022-11-01"""
 
@@ -45,7 +45,7 @@ class Corporation:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Address:
     """Address model for v2022-11-01 - adds romanization and more fields"""
 
@@ -94,7 +94,7 @@ class Address:
         return cls(**i)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressResolverResponse:
     """Address resolver response for v2022-11-01"""
 
@@ -107,7 +107,7 @@ class AddressResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressSearcherResponse:
     """Address searcher response for v2022-11-01"""
 
@@ -130,7 +130,7 @@ class AddressSearcherResponse:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class City:
     jisx0402: str
     prefecture: str
@@ -153,7 +153,7 @@ class City:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class CityResolverResponse:
     """City resolver response for v2022-11-01"""
 
@@ -166,7 +166,7 @@ class CityResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTAEntityAddress:
     """Enhanced address structure for invoice/school APIs"""
 
@@ -190,7 +190,7 @@ class NTAEntityAddress:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfo:
     """Corporate info model for v2022-11-01"""
 
@@ -228,7 +228,7 @@ class NTACorporateInfo:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoResolverResponse:
     """Corporate info resolver response for v2022-11-01"""
 
@@ -240,7 +240,7 @@ class NTACorporateInfoResolverResponse:
         return cls(version=d["version"], data=NTACorporateInfo.fromdict(d["data"]))
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoFacetResults:
     area: Optional[List[Tuple[str, int]]]
     kind: Optional[List[Tuple[str, int]]]
@@ -285,12 +285,12 @@ class NTACorporateInfoFacetResults:
         )
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoSearcherResponse:
     """Corporate info searcher response for v2024-01-01"""
 
     version: str
-    data: List[str]
+    data: List[NTACorporateInfo]
     query: str
     count: int
     offset: int
@@ -306,7 +306,7 @@ class NTACorporateInfoSearcherResponse:
 
 
 # New models added in v2023-09-01 for Bank API
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Bank:
     """Bank model for v2023-09-01"""
 
@@ -321,7 +321,7 @@ class Bank:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranch:
     """Bank branch model for v2023-09-01"""
 
@@ -336,7 +336,7 @@ class BankBranch:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BanksResponse:
     """Banks response for v2023-09-01"""
 
@@ -349,7 +349,7 @@ class BanksResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankResolverResponse:
     """Bank resolver response for v2023-09-01"""
 
@@ -361,7 +361,7 @@ class BankResolverResponse:
         return cls(version=d["version"], data=Bank.fromdict(d["data"]))
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchesData:
     """Nested data structure for bank branches response in v2024-01-01"""
 
@@ -377,7 +377,7 @@ class BankBranchesData:
         return cls(bank=bank, branches=branches)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchesResponse:
     """Bank branches response for v2024-01-01"""
 
@@ -390,7 +390,7 @@ class BankBranchesResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchData:
     """Nested data structure for bank branch resolver response in v2024-01-01"""
 
@@ -404,7 +404,7 @@ class BankBranchData:
         return cls(bank=bank, branch=branch)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchResolverResponse:
     """Bank branch resolver response for v2024-01-01"""
 
@@ -417,7 +417,7 @@ class BankBranchResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTAQualifiedInvoiceIssuerInfo:
     """Invoice issuer info for v2024-01-01"""
 
@@ -453,7 +453,7 @@ class NTAQualifiedInvoiceIssuerInfo:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTAQualifiedInvoiceIssuerInfoResolverResponse:
     """Invoice issuer resolver response for v2024-01-01"""
 
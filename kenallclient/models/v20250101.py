@@ -33,7 +33,7 @@ __all__ = [
 
 
 # Models copied from v2024-01-01 to make this module self-contained
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Corporation:
     """Corporation model for v2022-11-01"""
 
@@ -49,7 +49,7 @@ class Corporation:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Address:
     """Address model for v2022-11-01 - adds romanization and more fields"""
 
@@ -98,7 +98,7 @@ class Address:
         return cls(**i)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressResolverResponse:
     """Address resolver response for v2022-11-01"""
 
@@ -111,7 +111,7 @@ class AddressResolverResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class AddressSearcherResponse:
     """Address searcher response for v2022-11-01"""
 
@@ -134,7 +134,7 @@ class AddressSearcherResponse:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class City:
     jisx0402: str
     prefecture: str
@@ -157,7 +157,7 @@ class City:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class CityResolverResponse:
     """City resolver response for v2022-11-01"""
 
@@ -171,7 +171,7 @@ class CityResolverResponse:
 
 
 # New models added in v2023-09-01 for Bank API
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Bank:
     """Bank model for v2023-09-01"""
 
@@ -186,7 +186,7 @@ class Bank:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranch:
     """Bank branch model for v2023-09-01"""
 
@@ -201,7 +201,7 @@ class BankBranch:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BanksResponse:
     """Banks response for v2023-09-01"""
 
@@ -214,7 +214,7 @@ class BanksResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankResolverResponse:
     """Bank resolver response for v2023-09-01"""
 
@@ -226,7 +226,7 @@ class BankResolverResponse:
         return cls(version=d["version"], data=Bank.fromdict(d["data"]))
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchesData:
     """Nested data structure for bank branches response in v2025-01-01"""
 
@@ -243,7 +243,7 @@ class BankBranchesData:
         return cls(bank=bank, branches=branches)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchesResponse:
     """Bank branches response for v2025-01-01"""
 
@@ -256,7 +256,7 @@ class BankBranchesResponse:
         return cls(version=d["version"], data=data)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchData:
     """Nested data structure for bank branch resolver response in v2025-01-01"""
 
@@ -270,7 +270,7 @@ class BankBranchData:
         return cls(bank=bank, branch=branch)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BankBranchResolverResponse:
     """Bank branch resolver response for v2025-01-01"""
 
@@ -284,7 +284,7 @@ class BankBranchResolverResponse:
 
 
 # New models for invoice issuer API
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTAEntityAddress:
     """Enhanced address structure for invoice/school APIs"""
 
@@ -308,7 +308,7 @@ class NTAEntityAddress:
         return cls(**d)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTAQualifiedInvoiceIssuerInfo:
     """Invoice issuer info for v2025-01-01"""
 
@@ -344,7 +344,7 @@ class NTAQualifiedInvoiceIssuerInfo:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTAQualifiedInvoiceIssuerInfoResolverResponse:
     """Invoice issuer resolver response for v2025-01-01"""
 
@@ -360,7 +360,7 @@ class NTAQualifiedInvoiceIssuerInfoResolverResponse:
         )
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfo:
     """Corporate info model for v2025-01-01 with numeric close_cause"""
 
@@ -398,7 +398,7 @@ class NTACorporateInfo:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoResolverResponse:
     """Corporate info resolver response for v2025-01-01"""
 
@@ -410,7 +410,7 @@ class NTACorporateInfoResolverResponse:
         return cls(version=d["version"], data=NTACorporateInfo.fromdict(d["data"]))
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoFacetResults:
     area: Optional[List[Tuple[str, int]]]
     kind: Optional[List[Tuple[str, int]]]
@@ -455,12 +455,12 @@ class NTACorporateInfoFacetResults:
         )
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class NTACorporateInfoSearcherResponse:
     """Corporate info searcher response for v2025-01-01"""
 
     version: str
-    data: List[str]
+    data: List[NTACorporateInfo]
     query: str
     count: int
     offset: int
@@ -476,7 +476,7 @@ class NTACorporateInfoSearcherResponse:
 
 
 # New models for school API (available from 2025-01-01)
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class School:
     """School model for v2025-01-01"""
 
@@ -503,7 +503,7 @@ class School:
         return cls(**dd)
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class SchoolResolverResponse:
     """School resolver response for v2025-01-01"""
 
@@ -515,7 +515,7 @@ class SchoolResolverResponse:
         return cls(version=d["version"], data=School.fromdict(d["data"]))
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class SchoolFacetResults:
     area: Optional[List[Tuple[str, int]]]
     type: Optional[List[Tuple[str, int]]]
@@ -560,7 +560,7 @@ class SchoolFacetResults:
         )
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class SchoolSearcherResponse:
     """School searcher response for v2025-01-01"""
 
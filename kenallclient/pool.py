@@ -0,0 +1,597 @@
+"""Keep-alive HTTP/1.1 connection pools, usable as client transports"""
+
+import asyncio
+import collections
+import email.parser
+import http.client
+import io
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from kenallclient.timeout import Timeout
+from kenallclient.transport import (
+    CHUNK_SIZE,
+    ContentDecoder,
+    Response,
+    TransferMeter,
+    TransferStats,
+    accept_encoding,
+    decoded_http_error,
+    read_body,
+)
+
+__all__ = [
+    "AsyncConnectionPool",
+    "AsyncResponse",
+    "ConnectionPool",
+    "PooledResponse",
+]
+
+HostKey = Tuple[str, str, Optional[int]]
+
+
+def _phase_timeouts(
+    default: Optional[float], timeout: Optional[Timeout]
+) -> Tuple[Optional[float], Optional[float]]:
+    """Return the connect and read timeouts, falling back to ``default``"""
+    if timeout is None:
+        return default, default
+    return (
+        default if timeout.connect is None else timeout.connect,
+        default if timeout.read is None else timeout.read,
+    )
+
+
+# Errors raised when a server has silently dropped an idle keep-alive connection
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class _PooledConnection:
+    """A connection together with the bookkeeping used to decide its reuse"""
+
+    def __init__(self, conn: http.client.HTTPConnection) -> None:
+        self.conn = conn
+        self.requests = 0
+        self.last_used = time.monotonic()
+
+
+class PooledResponse:
+    """Response wrapper that hands its connection back to the pool on close
+
+    It quacks like the object returned by ``urllib.request.urlopen``: it can be
+    used as a context manager, read from and inspected through ``headers``.
+    """
+
+    def __init__(
+        self,
+        pool: "ConnectionPool",
+        key: HostKey,
+        pooled: _PooledConnection,
+        response: http.client.HTTPResponse,
+        url: str,
+    ) -> None:
+        self._pool = pool
+        self._key = key
+        self._pooled: Optional[_PooledConnection] = pooled
+        self._response = response
+        self.url = url
+
+    @property
+    def headers(self) -> http.client.HTTPMessage:
+        return self._response.headers
+
+    @property
+    def status(self) -> int:
+        return self._response.status
+
+    @property
+    def reason(self) -> str:
+        return self._response.reason
+
+    def getcode(self) -> int:
+        return self._response.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        data = self._response.read(amt)
+        if self._response.isclosed():
+            self.release()
+        return data
+
+    def readinto(self, b: Any) -> int:
+        n = self._response.readinto(b)
+        if self._response.isclosed():
+            self.release()
+        return n
+
+    def release(self) -> None:
+        """Return the underlying connection to the pool (or discard it)"""
+        pooled, self._pooled = self._pooled, None
+        if pooled is None:
+            return
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool._put_connection(self._key, pooled)
+        else:
+            # The body was not fully consumed or the server asked to close
+            pooled.conn.close()
+
+    def close(self) -> None:
+        self.release()
+        self._response.close()
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of persistent HTTP/1.1 connections, kept per host
+
+    :param maxsize: number of idle connections retained per host
+    :param idle_timeout: seconds an idle connection may sit in the pool
+        before it is discarded
+    :param max_requests: number of requests served by a single connection
+        before it is retired
+    :param timeout: socket timeout for new connections
+    :param compress: ask for gzip or deflate compressed responses in ``send``
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10,
+        idle_timeout: float = 60.0,
+        max_requests: int = 1000,
+        timeout: Optional[float] = None,
+        compress: bool = True,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        if max_requests < 1:
+            raise ValueError("max_requests must be positive")
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.compress = compress
+        self._meter = TransferMeter()
+        self._lock = threading.Lock()
+        self._idle: Dict[HostKey, Deque[_PooledConnection]] = {}
+
+    def _new_connection(self, key: HostKey) -> _PooledConnection:
+        scheme, host, port = key
+        conn: http.client.HTTPConnection
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        elif scheme == "http":
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        else:
+            raise ValueError(f"unsupported url scheme: {scheme}")
+        return _PooledConnection(conn)
+
+    def _get_connection(self, key: HostKey) -> Tuple[_PooledConnection, bool]:
+        """Return an idle connection for ``key`` or a new one
+
+        The second item tells whether the connection was reused.
+        """
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                pooled = idle.pop()
+                if now - pooled.last_used <= self.idle_timeout:
+                    return pooled, True
+                pooled.conn.close()
+        return self._new_connection(key), False
+
+    def _put_connection(self, key: HostKey, pooled: _PooledConnection) -> None:
+        if pooled.requests >= self.max_requests:
+            pooled.conn.close()
+            return
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            idle = self._idle.setdefault(key, collections.deque())
+            if len(idle) < self.maxsize:
+                idle.append(pooled)
+                return
+        pooled.conn.close()
+
+    def _send(
+        self,
+        pooled: _PooledConnection,
+        req: urllib.request.Request,
+        path: str,
+        timeout: Optional[Timeout],
+    ) -> http.client.HTTPResponse:
+        connect_timeout, read_timeout = _phase_timeouts(self.timeout, timeout)
+        if pooled.conn.sock is None:
+            pooled.conn.timeout = connect_timeout
+            pooled.conn.connect()
+        pooled.conn.sock.settimeout(read_timeout)
+        pooled.requests += 1
+        pooled.conn.request(
+            req.get_method(), path, body=req.data, headers=dict(req.header_items())
+        )
+        return pooled.conn.getresponse()
+
+    def urlopen(
+        self, req: urllib.request.Request, timeout: Optional[Timeout] = None
+    ) -> PooledResponse:
+        """Send ``req`` over a pooled connection
+
+        Like ``urllib.request.urlopen``, non-2xx responses are raised as
+        ``urllib.error.HTTPError``. ``timeout`` overrides the timeouts of the
+        pool for this request.
+        """
+        url = urllib.parse.urlsplit(req.full_url)
+        key: HostKey = (url.scheme, url.hostname or "", url.port)
+        path = urllib.parse.urlunsplit(("", "", url.path or "/", url.query, ""))
+
+        pooled, reused = self._get_connection(key)
+        try:
+            response = self._send(pooled, req, path, timeout)
+        except _STALE_CONNECTION_ERRORS:
+            pooled.conn.close()
+            if not reused:
+                raise
+            # The idle connection went away under us; retry once on a fresh one
+            pooled = self._new_connection(key)
+            try:
+                response = self._send(pooled, req, path, timeout)
+            except BaseException:
+                pooled.conn.close()
+                raise
+        except BaseException:
+            pooled.conn.close()
+            raise
+
+        result = PooledResponse(self, key, pooled, response, req.full_url)
+        if not 200 <= response.status < 300:
+            with result:
+                body = result.read()
+            raise urllib.error.HTTPError(
+                req.full_url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(body),
+            )
+        return result
+
+    def send(
+        self, req: urllib.request.Request, timeout: Optional[Timeout] = None
+    ) -> Response:
+        """Send ``req`` and return the decoded response (see ``Transport``)"""
+        if self.compress:
+            accept_encoding(req)
+        try:
+            res = self.urlopen(req, timeout)
+        except urllib.error.HTTPError as e:
+            raise decoded_http_error(e) from None
+        with res:
+            body, wire_bytes = read_body(res, res.headers)
+            response = Response(
+                url=req.full_url,
+                status=res.status,
+                reason=res.reason,
+                headers=res.headers,
+                body=body,
+                wire_bytes=wire_bytes,
+            )
+        self._meter.record(response)
+        return response
+
+    def stats(self) -> TransferStats:
+        """Return the sizes of the responses received by ``send``"""
+        return self._meter.stats()
+
+    def clear(self) -> None:
+        """Close every idle connection held by the pool"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for pooled in connections:
+                pooled.conn.close()
+
+    close = clear
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.clear()
+
+
+# Fully read response returned by ``AsyncConnectionPool``
+AsyncResponse = Response
+
+
+class _AsyncConnection:
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.requests = 0
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncConnectionPool:
+    """Non-blocking pool of persistent HTTP/1.1 connections, kept per host
+
+    At most ``maxsize`` connections per host are open at the same time; any
+    further requests wait for a connection to be released, so a large number
+    of concurrent lookups share a bounded set of sockets on one event loop.
+
+    :param maxsize: number of connections per host
+    :param idle_timeout: seconds an idle connection may sit in the pool
+        before it is discarded
+    :param max_requests: number of requests served by a single connection
+        before it is retired
+    :param timeout: timeout in seconds for connecting and for each read
+    :param compress: ask for gzip or deflate compressed responses
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10,
+        idle_timeout: float = 60.0,
+        max_requests: int = 1000,
+        timeout: Optional[float] = None,
+        compress: bool = True,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        if max_requests < 1:
+            raise ValueError("max_requests must be positive")
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.compress = compress
+        self._meter = TransferMeter()
+        self._idle: Dict[HostKey, Deque[_AsyncConnection]] = {}
+        self._slots: Dict[HostKey, asyncio.Semaphore] = {}
+
+    async def _new_connection(
+        self, key: HostKey, timeout: Optional[float]
+    ) -> _AsyncConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host, port or 443, ssl=ssl.create_default_context()
+                ),
+                timeout,
+            )
+        elif scheme == "http":
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port or 80), timeout
+            )
+        else:
+            raise ValueError(f"unsupported url scheme: {scheme}")
+        return _AsyncConnection(reader, writer)
+
+    def _get_idle(self, key: HostKey) -> Optional[_AsyncConnection]:
+        now = time.monotonic()
+        idle = self._idle.get(key)
+        while idle:
+            conn = idle.pop()
+            if now - conn.last_used <= self.idle_timeout and not (
+                conn.reader.at_eof() or conn.writer.is_closing()
+            ):
+                return conn
+            conn.close()
+        return None
+
+    def _put_idle(self, key: HostKey, conn: _AsyncConnection) -> None:
+        if conn.requests >= self.max_requests:
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        self._idle.setdefault(key, collections.deque()).append(conn)
+
+    async def _readline(
+        self, conn: _AsyncConnection, timeout: Optional[float]
+    ) -> bytes:
+        return await asyncio.wait_for(conn.reader.readline(), timeout)
+
+    async def _read_body(
+        self,
+        conn: _AsyncConnection,
+        status: int,
+        headers: http.client.HTTPMessage,
+        timeout: Optional[float],
+        decoder: ContentDecoder,
+    ) -> bool:
+        """Feed the response body to ``decoder`` as it arrives
+
+        Return whether the connection can be reused.
+        """
+        if status in (204, 304) or 100 <= status < 200:
+            return True
+        if headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                size_line = await self._readline(conn, timeout)
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+                if size == 0:
+                    # skip trailers
+                    trailer = await self._readline(conn, timeout)
+                    while trailer not in (b"\r\n", b"\n", b""):
+                        trailer = await self._readline(conn, timeout)
+                    return True
+                chunk = await asyncio.wait_for(
+                    conn.reader.readexactly(size + 2), timeout
+                )
+                decoder.feed(chunk[:-2])
+        length = headers.get("Content-Length")
+        if length is not None:
+            remaining = int(length)
+            while remaining:
+                chunk = await asyncio.wait_for(
+                    conn.reader.readexactly(min(remaining, CHUNK_SIZE)), timeout
+                )
+                decoder.feed(chunk)
+                remaining -= len(chunk)
+            return True
+        while True:
+            chunk = await asyncio.wait_for(conn.reader.read(CHUNK_SIZE), timeout)
+            if not chunk:
+                return False
+            decoder.feed(chunk)
+
+    async def _send(
+        self,
+        conn: _AsyncConnection,
+        req: urllib.request.Request,
+        path: str,
+        timeout: Optional[float],
+    ) -> Response:
+        conn.requests += 1
+        host = req.host
+        lines = [f"{req.get_method()} {path} HTTP/1.1", f"Host: {host}"]
+        lines.extend(f"{k}: {v}" for k, v in req.header_items())
+        head = "\r\n".join(lines) + "\r\n\r\n"
+        conn.writer.write(head.encode("latin-1"))
+        if req.data:
+            conn.writer.write(req.data)  # type: ignore[arg-type]
+        await conn.writer.drain()
+
+        status_line = await self._readline(conn, timeout)
+        if not status_line:
+            raise http.client.RemoteDisconnected(
+                "Remote end closed connection without response"
+            )
+        try:
+            version, status, reason = (
+                status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""]
+            )[:3]
+            code = int(status)
+        except ValueError:
+            raise http.client.BadStatusLine(status_line.decode("latin-1")) from None
+
+        header_lines = []
+        while True:
+            line = await self._readline(conn, timeout)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            header_lines.append(line)
+        headers = email.parser.Parser(_class=http.client.HTTPMessage).parsestr(
+            b"".join(header_lines).decode("iso-8859-1")
+        )
+        decoder = ContentDecoder(headers.get("Content-Encoding"))
+        reusable = await self._read_body(
+            conn,
+            code,
+            headers,  # type: ignore[arg-type]
+            timeout,
+            decoder,
+        )
+        if (
+            not reusable
+            or version == "HTTP/1.0"
+            or headers.get("Connection", "").lower() == "close"
+        ):
+            conn.requests = self.max_requests
+        return Response(
+            req.full_url,
+            code,
+            reason,
+            headers,  # type: ignore[arg-type]
+            decoder.finish(),
+            decoder.wire_bytes,
+        )
+
+    async def request(
+        self, req: urllib.request.Request, timeout: Optional[Timeout] = None
+    ) -> Response:
+        """Send ``req`` and return the fully read, decoded response
+
+        Like ``urllib.request.urlopen``, non-2xx responses are raised as
+        ``urllib.error.HTTPError``. ``timeout`` overrides the timeouts of the
+        pool for this request.
+        """
+        connect_timeout, read_timeout = _phase_timeouts(self.timeout, timeout)
+        url = urllib.parse.urlsplit(req.full_url)
+        key: HostKey = (url.scheme, url.hostname or "", url.port)
+        path = urllib.parse.urlunsplit(("", "", url.path or "/", url.query, ""))
+        if self.compress:
+            accept_encoding(req)
+
+        slots = self._slots.get(key)
+        if slots is None:
+            slots = self._slots[key] = asyncio.Semaphore(self.maxsize)
+        async with slots:
+            conn = self._get_idle(key)
+            reused = conn is not None
+            if conn is None:
+                conn = await self._new_connection(key, connect_timeout)
+            try:
+                response = await self._send(conn, req, path, read_timeout)
+            except (
+                *_STALE_CONNECTION_ERRORS,
+                asyncio.IncompleteReadError,
+            ):
+                conn.close()
+                if not reused:
+                    raise
+                # The idle connection went away under us; retry on a fresh one
+                conn = await self._new_connection(key, connect_timeout)
+                try:
+                    response = await self._send(conn, req, path, read_timeout)
+                except BaseException:
+                    conn.close()
+                    raise
+            except BaseException:
+                conn.close()
+                raise
+            self._put_idle(key, conn)
+
+        if not 200 <= response.status < 300:
+            raise urllib.error.HTTPError(
+                req.full_url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(response.body),
+            )
+        self._meter.record(response)
+        return response
+
+    send = request
+
+    def stats(self) -> TransferStats:
+        """Return the sizes of the successful responses received"""
+        return self._meter.stats()
+
+    def clear(self) -> None:
+        """Close every idle connection held by the pool"""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    close = clear
+
+    async def __aenter__(self) -> "AsyncConnectionPool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.clear()
@@ -0,0 +1,244 @@
+"""Client-side rate limiting of KEN_ALL API requests
+
+Limiters are token buckets holding one bucket per API key and endpoint name
+(see ``kenallclient.cache.endpoint_of``). A request takes a token from its
+bucket, or reserves the next one and waits until it is due, so callers are
+served in order at the configured sustained rate. Rates are set for all
+buckets, per endpoint or per API key.
+
+``MemoryRateLimiter`` is shared by the threads and tasks of one process.
+``SQLiteRateLimiter`` keeps its buckets in an SQLite database, so every process
+on a host using the same file stays under a common quota.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from kenallclient.exceptions import DeadlineExceeded
+from kenallclient.sqlite import SQLiteConnections
+from kenallclient.timeout import Deadline
+
+__all__ = [
+    "MemoryRateLimiter",
+    "RateLimiter",
+    "SQLiteRateLimiter",
+]
+
+T = TypeVar("T")
+
+
+def take_token(
+    tokens: float, updated_at: float, now: float, rate: float, burst: float
+) -> Tuple[float, float]:
+    """Take a token from a bucket and return its new level and the wait time
+
+    The level goes below zero when the bucket is empty; the deficit is the
+    number of tokens already promised to earlier callers.
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated_at) * rate) - 1
+    return tokens, max(0.0, -tokens / rate)
+
+
+class RateLimiter(metaclass=ABCMeta):
+    """Base class of rate limiters
+
+    :param rate: sustained requests per second allowed for each endpoint
+    :param burst: number of requests allowed at once after an idle period,
+        defaults to one second worth of requests
+    :param rates: requests per second per endpoint name, e.g.
+        ``{"postalcode": 20, "houjinbangou": 5}``
+    :param key_rates: requests per second for each endpoint of an API key,
+        taking precedence over ``rate`` and ``rates``, e.g. for keys of
+        different plans sharing one limiter
+    """
+
+    # whether reserve blocks on I/O, so the asyncio client runs it in a thread
+    reserve_blocks: bool = False
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        rates: Optional[Dict[str, float]] = None,
+        key_rates: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self.key_rates = dict(key_rates or {})
+        if any(r <= 0 for r in [rate, *self.rates.values(), *self.key_rates.values()]):
+            raise ValueError("rate must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+
+    def rate_for(self, endpoint: str, api_key: Optional[str] = None) -> float:
+        if api_key is not None and api_key in self.key_rates:
+            return self.key_rates[api_key]
+        return self.rates.get(endpoint, self.rate)
+
+    def burst_for(self, endpoint: str, api_key: Optional[str] = None) -> float:
+        if self.burst is not None:
+            return self.burst
+        return max(1.0, self.rate_for(endpoint, api_key))
+
+    @staticmethod
+    def bucket_key(api_key: str, endpoint: str) -> str:
+        """Return the bucket name, which does not reveal the API key"""
+        digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        return f"{digest} {endpoint}"
+
+    @abstractmethod
+    def reserve(self, api_key: str, endpoint: str) -> float:
+        """Take a token and return the seconds to wait before using it"""
+
+    @abstractmethod
+    def release(self, api_key: str, endpoint: str) -> None:
+        """Give back a token taken by ``reserve`` that will not be used"""
+
+    @staticmethod
+    def _past_deadline(delay: float, deadline: Optional[Deadline]) -> bool:
+        return deadline is not None and delay >= deadline.remaining()
+
+    def acquire(
+        self, api_key: str, endpoint: str, deadline: Optional[Deadline] = None
+    ) -> float:
+        """Block until a request to ``endpoint`` is allowed
+
+        Return the time spent waiting. When the token is due past ``deadline``,
+        it is given back and ``DeadlineExceeded`` is raised without waiting.
+        """
+        delay = self.reserve(api_key, endpoint)
+        if delay > 0:
+            if self._past_deadline(delay, deadline):
+                self.release(api_key, endpoint)
+                raise DeadlineExceeded("deadline exceeded waiting for the rate limit")
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(
+        self, api_key: str, endpoint: str, deadline: Optional[Deadline] = None
+    ) -> float:
+        """Wait without blocking the event loop until a request is allowed"""
+        delay = await self._call_async(self.reserve, api_key, endpoint)
+        if delay > 0:
+            if self._past_deadline(delay, deadline):
+                await self._call_async(self.release, api_key, endpoint)
+                raise DeadlineExceeded("deadline exceeded waiting for the rate limit")
+            await asyncio.sleep(delay)
+        return delay
+
+    async def _call_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call ``fn``, on a worker thread if reservations block"""
+        if not self.reserve_blocks:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+
+class MemoryRateLimiter(RateLimiter):
+    """Thread-safe rate limiter shared within one process"""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        rates: Optional[Dict[str, float]] = None,
+        key_rates: Optional[Dict[str, float]] = None,
+    ) -> None:
+        super().__init__(rate, burst=burst, rates=rates, key_rates=key_rates)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, api_key: str, endpoint: str) -> float:
+        key = self.bucket_key(api_key, endpoint)
+        burst = self.burst_for(endpoint, api_key)
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens, delay = take_token(
+                tokens, updated_at, now, self.rate_for(endpoint, api_key), burst
+            )
+            self._buckets[key] = (tokens, now)
+        return delay
+
+    def release(self, api_key: str, endpoint: str) -> None:
+        key = self.bucket_key(api_key, endpoint)
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated_at = self._buckets[key]
+                burst = self.burst_for(endpoint, api_key)
+                self._buckets[key] = (min(burst, tokens + 1), updated_at)
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """Rate limiter whose buckets are shared by every process using ``path``
+
+    Each reservation is a short write transaction, so the database should be
+    on a local file system. The asyncio client makes reservations on a worker
+    thread, as they may wait for the lock of another process.
+
+    :param path: path of the database file
+    :param timeout: seconds to wait for a lock held by another process
+    """
+
+    reserve_blocks = True
+
+    def __init__(
+        self,
+        path: str,
+        rate: float,
+        burst: Optional[float] = None,
+        rates: Optional[Dict[str, float]] = None,
+        key_rates: Optional[Dict[str, float]] = None,
+        timeout: float = 5.0,
+    ) -> None:
+        super().__init__(rate, burst=burst, rates=rates, key_rates=key_rates)
+        self.path = path
+        self.timeout = timeout
+        self._connections = SQLiteConnections(path, timeout)
+        self._connections.get().execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, "
+            "tokens REAL NOT NULL, "
+            "updated_at REAL NOT NULL)"
+        )
+
+    def reserve(self, api_key: str, endpoint: str) -> float:
+        key = self.bucket_key(api_key, endpoint)
+        burst = self.burst_for(endpoint, api_key)
+        conn = self._connections.get()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # wall clock time, as monotonic clocks are not comparable across
+            # processes
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated_at = row if row is not None else (burst, now)
+            tokens, delay = take_token(
+                tokens, updated_at, now, self.rate_for(endpoint, api_key), burst
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated_at) "
+                "VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return delay
+
+    def release(self, api_key: str, endpoint: str) -> None:
+        self._connections.get().execute(
+            "UPDATE buckets SET tokens = MIN(?, tokens + 1) WHERE key = ?",
+            (self.burst_for(endpoint, api_key), self.bucket_key(api_key, endpoint)),
+        )
+
+    def close(self) -> None:
+        """Close the connection of the current thread"""
+        self._connections.close()
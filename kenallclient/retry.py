@@ -0,0 +1,183 @@
+"""Retry policy with exponential backoff for transient KEN_ALL API failures"""
+
+import asyncio
+import dataclasses
+import email.utils
+import http.client
+import logging
+import random
+import time
+import urllib.error
+import urllib.request
+from typing import Awaitable, Callable, FrozenSet, Optional, TypeVar
+
+from kenallclient.exceptions import DeadlineExceeded
+from kenallclient.timeout import Deadline
+
+__all__ = [
+    "RetryEvent",
+    "RetryPolicy",
+]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+# Errors of the transport itself, e.g. a refused or reset connection
+TRANSIENT_ERRORS = (
+    urllib.error.URLError,
+    http.client.HTTPException,
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    asyncio.IncompleteReadError,
+)
+
+
+@dataclasses.dataclass()
+class RetryEvent:
+    """Emitted before a failed request is retried"""
+
+    url: str
+    attempt: int
+    delay: float
+    error: BaseException
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Return the delay in seconds requested by a ``Retry-After`` header"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if now is None:
+        now = time.time()
+    return max(0.0, when.timestamp() - now)
+
+
+@dataclasses.dataclass()
+class RetryPolicy:
+    """Retry idempotent requests failing with a transient error
+
+    Delays grow exponentially from ``base_delay`` up to ``max_delay`` with full
+    jitter, so concurrent clients do not retry in lockstep. A ``Retry-After``
+    header sent with the error takes precedence over the computed delay, up to
+    ``max_retry_after``: a server asking for a longer wait ends the retries.
+
+    :param max_attempts: total number of attempts, including the first one
+    :param base_delay: delay in seconds before the first retry
+    :param max_delay: upper bound of the computed delay in seconds
+    :param max_retry_after: longest ``Retry-After`` delay in seconds waited for
+    :param deadline: seconds after the first attempt past which no retry is
+        started
+    :param retry_statuses: HTTP status codes considered transient
+    :param on_retry: called with a ``RetryEvent`` before each retry
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 10.0
+    max_retry_after: float = 60.0
+    deadline: Optional[float] = None
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    on_retry: Optional[Callable[[RetryEvent], None]] = None
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be positive")
+
+    def is_retryable(self, req: urllib.request.Request, error: BaseException) -> bool:
+        if req.get_method() not in IDEMPOTENT_METHODS:
+            return False
+        if isinstance(error, DeadlineExceeded):
+            return False
+        if isinstance(error, urllib.error.HTTPError):
+            return error.code in self.retry_statuses
+        return isinstance(error, TRANSIENT_ERRORS)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay before retry number ``attempt``"""
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def _next_delay(
+        self,
+        req: urllib.request.Request,
+        error: BaseException,
+        attempt: int,
+        started: float,
+        deadline: Optional[Deadline],
+    ) -> Optional[float]:
+        """Return the delay before the next attempt, or None to give up"""
+        if attempt >= self.max_attempts or not self.is_retryable(req, error):
+            return None
+        delay = None
+        if isinstance(error, urllib.error.HTTPError) and error.headers is not None:
+            delay = parse_retry_after(error.headers.get("Retry-After"))
+            if delay is not None and delay > self.max_retry_after:
+                return None
+        if delay is None:
+            delay = self.backoff(attempt)
+        if (
+            self.deadline is not None
+            and time.monotonic() + delay - started > self.deadline
+        ):
+            return None
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+        event = RetryEvent(url=req.full_url, attempt=attempt, delay=delay, error=error)
+        logger.info("retrying %s in %.3fs after %r", req.full_url, delay, error)
+        if self.on_retry is not None:
+            self.on_retry(event)
+        return delay
+
+    def call(
+        self,
+        req: urllib.request.Request,
+        fn: Callable[[], T],
+        deadline: Optional[Deadline] = None,
+    ) -> T:
+        """Call ``fn`` performing ``req``, retrying it on transient errors
+
+        No retry is started that could not begin before ``deadline``.
+        """
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                delay = self._next_delay(req, e, attempt, started, deadline)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(
+        self,
+        req: urllib.request.Request,
+        fn: Callable[[], Awaitable[T]],
+        deadline: Optional[Deadline] = None,
+    ) -> T:
+        """Await ``fn()`` performing ``req``, retrying it on transient errors"""
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                delay = self._next_delay(req, e, attempt, started, deadline)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
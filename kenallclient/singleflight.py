@@ -0,0 +1,124 @@
+"""Coalescing of concurrent identical calls
+
+While a call for a key is in flight, further calls with the same key wait for
+it and receive its result (or exception) instead of doing the work again. A
+caller stops waiting once its own deadline passes, and makes its own call when
+the shared one ran out of the deadline of the caller which started it.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+from kenallclient.exceptions import DeadlineExceeded
+from kenallclient.timeout import Deadline
+
+__all__ = [
+    "AsyncSingleFlight",
+    "SingleFlight",
+]
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """Thread-safe coalescing of concurrent calls sharing a key"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call[T]] = {}
+
+    def do(
+        self, key: str, fn: Callable[[], T], deadline: Optional[Deadline] = None
+    ) -> T:
+        """Call ``fn`` unless a call for ``key`` is in flight, then share it
+
+        Waiting for the call in flight raises ``DeadlineExceeded`` once
+        ``deadline`` passes; the call itself goes on for the other callers.
+        When it fails with ``DeadlineExceeded``, the budget of its caller ran
+        out, so ``fn`` is called again under ``deadline``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if not leader:
+            timeout = None if deadline is None else deadline.remaining()
+            if not call.done.wait(timeout):
+                raise DeadlineExceeded("deadline exceeded waiting for a shared call")
+            if isinstance(call.error, DeadlineExceeded):
+                return self.do(key, fn, deadline)
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight(Generic[T]):
+    """asyncio coalescing of concurrent calls sharing a key
+
+    The shared call runs in its own task, so a waiter being cancelled does
+    not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Future[T]] = {}
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        deadline: Optional[Deadline] = None,
+    ) -> T:
+        """Await ``fn()`` unless a call for ``key`` is in flight, then share it
+
+        Waiting for a call started by another caller raises
+        ``DeadlineExceeded`` once ``deadline`` passes, and ``fn`` is awaited
+        anew when that call ran out of its caller's deadline. The caller
+        starting the call waits for it, as ``fn`` keeps to its own deadline.
+        """
+        future = self._calls.get(key)
+        leader = future is None
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+
+            def forget(_: Any) -> None:
+                if self._calls.get(key) is future:
+                    del self._calls[key]
+
+            future.add_done_callback(forget)
+        if leader:
+            return await asyncio.shield(future)
+        # unlike wait_for, wait neither cancels the shared call on expiry nor
+        # mistakes a TimeoutError raised by the call for the deadline
+        timeout = None if deadline is None else deadline.remaining()
+        done, _ = await asyncio.wait([future], timeout=timeout)
+        if not done:
+            raise DeadlineExceeded("deadline exceeded waiting for a shared call")
+        if isinstance(future.exception(), DeadlineExceeded):
+            return await self.do(key, fn, deadline)
+        return future.result()
+
+    def __len__(self) -> int:
+        return len(self._calls)
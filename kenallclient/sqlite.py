@@ -0,0 +1,50 @@
+"""SQLite connections shared by the persistent cache and rate limiter
+
+``SQLiteCache`` and ``SQLiteRateLimiter`` keep their state in a database file
+that every process on a host may use at once. ``SQLiteConnections`` opens the
+connections to such a file in WAL mode, one per thread and process.
+"""
+
+import os
+import sqlite3
+import threading
+
+__all__ = [
+    "SQLiteConnections",
+]
+
+
+class SQLiteConnections:
+    """Connections to one database file, one per thread
+
+    Connections are never shared across threads or inherited across fork.
+    They are in autocommit mode, so callers manage their own transactions.
+
+    :param path: path of the database file
+    :param timeout: seconds to wait for a lock held by another process
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """Return the connection of the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        """Close the connection of the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,97 @@
+"""Socket timeouts and end-to-end deadlines of KEN_ALL API calls
+
+A ``Timeout`` bounds each connect and each read of a single request. A
+``Deadline`` bounds a whole call: every attempt, retry delay and page of a
+pagination helper must fit in the time left before it expires.
+"""
+
+import dataclasses
+import time
+from typing import Optional, Union
+
+from kenallclient.exceptions import DeadlineExceeded
+
+__all__ = [
+    "Deadline",
+    "Timeout",
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class Timeout:
+    """Seconds allowed to connect and to wait for each read
+
+    A phase left to ``None`` uses the default of the transport, e.g. the
+    ``timeout`` of a connection pool, and otherwise waits indefinitely.
+    """
+
+    connect: Optional[float] = None
+    read: Optional[float] = None
+
+    @classmethod
+    def of(cls, timeout: Union[None, float, "Timeout"]) -> Optional["Timeout"]:
+        """Return ``timeout`` as a ``Timeout``; a number bounds both phases"""
+        if timeout is None or isinstance(timeout, Timeout):
+            return timeout
+        return cls(connect=timeout, read=timeout)
+
+    def cap(self, limit: float) -> "Timeout":
+        """Return a copy where no phase exceeds ``limit`` seconds"""
+        return Timeout(
+            connect=limit if self.connect is None else min(self.connect, limit),
+            read=limit if self.read is None else min(self.read, limit),
+        )
+
+    @property
+    def socket_timeout(self) -> Optional[float]:
+        """Single timeout for APIs which use one value for both phases"""
+        return self.read if self.read is not None else self.connect
+
+
+class Deadline:
+    """Point in time by which a call must have completed
+
+    :param seconds: time left from now
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.expires_at = time.monotonic() + seconds
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+    @classmethod
+    def of(cls, deadline: Union[None, float, "Deadline"]) -> Optional["Deadline"]:
+        """Return ``deadline`` as a ``Deadline``; a number is seconds from now
+
+        A ``Deadline`` is returned as is, so one budget can be shared by
+        several calls.
+        """
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        """Raise ``DeadlineExceeded`` once the deadline has passed"""
+        if self.expired():
+            raise DeadlineExceeded("deadline exceeded")
+
+
+TimeoutLike = Union[float, Timeout]
+DeadlineLike = Union[float, Deadline]
+
+
+def attempt_timeout(
+    timeout: Optional[Timeout], deadline: Optional[Deadline]
+) -> Optional[Timeout]:
+    """Return the timeout of one attempt, bounded by the time left"""
+    if deadline is None:
+        return timeout
+    deadline.check()
+    return (timeout or Timeout()).cap(deadline.remaining())
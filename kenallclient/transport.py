@@ -0,0 +1,268 @@
+"""HTTP transports of the KEN_ALL clients
+
+The clients are split into a sans-IO core and a transport. The core describes
+each call as a ``urllib.request.Request`` and turns the ``Response`` of a
+transport into models; caching, retries, rate limiting and the like wrap the
+core and never touch sockets. A transport only sends a request and returns its
+status, headers and body, so a faster HTTP stack can be swapped in by passing
+``transport=`` to a client.
+
+``UrllibTransport`` is the default of ``KenAllClient``. ``ConnectionPool`` and
+``AsyncConnectionPool`` from ``kenallclient.pool`` are transports as well,
+reusing keep-alive ``http.client`` and asyncio connections.
+
+The bundled transports ask for gzip or deflate compressed responses and
+decompress bodies incrementally as they are read, counting the bytes received
+and decoded in ``TransferStats``.
+"""
+
+import dataclasses
+import http.client
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+import zlib
+from typing import Any, Callable, List, Optional, Protocol, Tuple
+
+from kenallclient.timeout import Timeout
+
+__all__ = [
+    "AsyncTransport",
+    "ContentDecoder",
+    "Response",
+    "TransferStats",
+    "Transport",
+    "UrllibTransport",
+]
+
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Size of the reads feeding a ContentDecoder
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclasses.dataclass()
+class Response:
+    """Fully read response of a transport
+
+    ``body`` is decompressed; ``wire_bytes`` is its size as received, and
+    defaults to the size of ``body``.
+    """
+
+    url: str
+    status: int
+    reason: str
+    headers: http.client.HTTPMessage
+    body: bytes
+    wire_bytes: int = -1
+
+    def __post_init__(self) -> None:
+        if self.wire_bytes < 0:
+            self.wire_bytes = len(self.body)
+
+    def json(self, decoder: Callable[[bytes], Any] = json.loads) -> Any:
+        """Decode the body of a JSON response with ``decoder``
+
+        :raises ValueError: if the response is not JSON
+        """
+        if not self.headers.get("Content-Type", "").startswith("application/json"):
+            raise ValueError("not json response", self.body)
+        return decoder(self.body)
+
+
+class ContentDecoder:
+    """Incremental decoder of a body sent with a ``Content-Encoding``
+
+    :param encoding: value of the ``Content-Encoding`` header, if any
+    :raises ValueError: if the encoding is not supported
+    """
+
+    def __init__(self, encoding: Optional[str] = None) -> None:
+        self.encoding = (encoding or "identity").strip().lower()
+        self._zlib: Optional[Any]
+        if self.encoding in ("gzip", "x-gzip"):
+            self._zlib = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == "deflate":
+            self._zlib = zlib.decompressobj()
+        elif self.encoding == "identity":
+            self._zlib = None
+        else:
+            raise ValueError(f"unsupported content encoding: {encoding}")
+        self.wire_bytes = 0
+        self._chunks: List[bytes] = []
+
+    @property
+    def compressed(self) -> bool:
+        return self._zlib is not None
+
+    def feed(self, data: bytes) -> None:
+        first = self.wire_bytes == 0
+        self.wire_bytes += len(data)
+        if self._zlib is None:
+            self._chunks.append(data)
+            return
+        try:
+            self._chunks.append(self._zlib.decompress(data))
+        except zlib.error:
+            # some servers send raw deflate data without the zlib wrapper
+            if self.encoding != "deflate" or not first:
+                raise
+            self._zlib = zlib.decompressobj(-zlib.MAX_WBITS)
+            self._chunks.append(self._zlib.decompress(data))
+
+    def finish(self) -> bytes:
+        """Return the decoded body
+
+        :raises ValueError: if the compressed body is truncated
+        """
+        if self._zlib is not None:
+            self._chunks.append(self._zlib.flush())
+            if self.wire_bytes and not self._zlib.eof:
+                raise ValueError("incomplete compressed response body")
+        return b"".join(self._chunks)
+
+
+def read_body(res: Any, headers: Any) -> Tuple[bytes, int]:
+    """Read and decode the body of ``res``, a file-like response
+
+    Return the decoded body and its size as received.
+    """
+    decoder = ContentDecoder(headers.get("Content-Encoding"))
+    if not decoder.compressed:
+        body = res.read()
+        return body, len(body)
+    while True:
+        chunk = res.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        decoder.feed(chunk)
+    return decoder.finish(), decoder.wire_bytes
+
+
+def accept_encoding(req: urllib.request.Request) -> None:
+    """Ask for a compressed response unless ``req`` names its own encodings"""
+    if not req.has_header("Accept-encoding"):
+        req.add_unredirected_header("Accept-Encoding", ACCEPT_ENCODING)
+
+
+def decoded_http_error(error: urllib.error.HTTPError) -> urllib.error.HTTPError:
+    """Return ``error`` with its body decompressed"""
+    if error.fp is None or error.headers is None:
+        return error
+    if not error.headers.get("Content-Encoding"):
+        return error
+    with error:
+        body, _ = read_body(error, error.headers)
+    return urllib.error.HTTPError(
+        error.url, error.code, error.msg, error.headers, io.BytesIO(body)
+    )
+
+
+@dataclasses.dataclass()
+class TransferStats:
+    """Sizes of the successful responses received by a transport
+
+    ``wire_bytes`` counts bodies as received and ``body_bytes`` after
+    decompression; ``compressed`` responses were sent with a
+    ``Content-Encoding``.
+    """
+
+    responses: int = 0
+    compressed: int = 0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+
+
+class TransferMeter:
+    """Thread-safe accumulator of ``TransferStats``"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats = TransferStats()
+
+    def record(self, res: Response) -> None:
+        with self._lock:
+            self._stats.responses += 1
+            if res.headers.get("Content-Encoding"):
+                self._stats.compressed += 1
+            self._stats.wire_bytes += res.wire_bytes
+            self._stats.body_bytes += len(res.body)
+
+    def stats(self) -> TransferStats:
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+
+class Transport(Protocol):
+    """Sends requests on behalf of ``KenAllClient``
+
+    Like ``urllib.request.urlopen``, ``send`` raises non-2xx responses as
+    ``urllib.error.HTTPError``, and network failures as ``OSError``.
+    ``timeout`` overrides the default timeouts of the transport.
+    """
+
+    def send(
+        self, req: urllib.request.Request, timeout: Optional[Timeout] = None
+    ) -> Response: ...
+
+    def close(self) -> None:
+        """Release idle resources; the transport stays usable"""
+
+
+class AsyncTransport(Protocol):
+    """Sends requests on behalf of ``AsyncKenAllClient``"""
+
+    async def send(
+        self, req: urllib.request.Request, timeout: Optional[Timeout] = None
+    ) -> Response: ...
+
+    def close(self) -> None:
+        """Release idle resources; the transport stays usable"""
+
+
+class UrllibTransport:
+    """Transport opening a new connection per request with ``urlopen``
+
+    ``urllib.request.urlopen`` takes a single timeout for connecting and
+    reading, so it is given the read timeout.
+
+    :param compress: ask for gzip or deflate compressed responses
+    """
+
+    def __init__(self, compress: bool = True) -> None:
+        self.compress = compress
+        self._meter = TransferMeter()
+
+    def send(
+        self, req: urllib.request.Request, timeout: Optional[Timeout] = None
+    ) -> Response:
+        if self.compress:
+            accept_encoding(req)
+        try:
+            if timeout is None or timeout.socket_timeout is None:
+                res = urllib.request.urlopen(req)
+            else:
+                res = urllib.request.urlopen(req, timeout=timeout.socket_timeout)
+        except urllib.error.HTTPError as e:
+            raise decoded_http_error(e) from None
+        with res:
+            body, wire_bytes = read_body(res, res.headers)
+            response = Response(
+                url=req.full_url,
+                # urlopen raises HTTPError for any other status
+                status=getattr(res, "status", 200),
+                reason=getattr(res, "reason", ""),
+                headers=res.headers,
+                body=body,
+                wire_bytes=wire_bytes,
+            )
+        self._meter.record(response)
+        return response
+
+    def stats(self) -> TransferStats:
+        return self._meter.stats()
+
+    def close(self) -> None:
+        pass
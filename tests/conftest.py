@@ -193,3 +193,77 @@ def houjinbangou_search_no_facets_v20250101(load_version_fixture):
 @pytest.fixture
 def houjinbangou_search_empty_facets_v20250101(load_version_fixture):
     return load_version_fixture("2025-01-01", "houjinbangou_search_empty_facets.json")
+
+
+class _Handler:
+    """Factory for the request handler used by the ``http_server`` fixture"""
+
+    @staticmethod
+    def build(server_state):
+        import http.server
+        import json
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                server_state.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                server_state.requests.append((self.path, self.headers))
+                route = server_state.routes.get(self.path)
+                if route is None:
+                    route = server_state.routes.get(self.path.split("?", 1)[0])
+                if route is None:
+                    status, headers, body = 404, {}, {"message": "not found"}
+                elif callable(route):
+                    status, headers, body = route(self)
+                else:
+                    status, headers, body = route
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode("utf-8")
+                    headers = {"Content-Type": "application/json", **headers}
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+class ServerState:
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.url = ""
+
+    def json(self, path, payload, status=200, headers=None):
+        self.routes[path] = (status, headers or {}, payload)
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP/1.1 keep-alive server answering from ``routes``"""
+    import http.server
+    import threading
+
+    state = ServerState()
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler.build(state))
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,144 @@
+import asyncio
+import urllib.error
+
+import pytest
+
+
+def test_get(http_server, postalcode_v20221101):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.models import v20221101
+
+    http_server.json("/v1/postalcode/1008105", postalcode_v20221101)
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            return await c.get("1008105", api_version="2022-11-01")
+
+    result = asyncio.run(main())
+    assert isinstance(result, v20221101.AddressResolverResponse)
+    assert result == v20221101.AddressResolverResponse.fromdict(postalcode_v20221101)
+    path, headers = http_server.requests[0]
+    assert headers["Authorization"] == "Token testing-api-key"
+    assert headers["KenAll-API-Version"] == "2022-11-01"
+
+
+def test_search_houjin(http_server, houjinbangou_search_v20250101):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.models import v20250101
+
+    http_server.json("/v1/houjinbangou", houjinbangou_search_v20250101)
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            return await c.search_houjin(q="test", limit=1, api_version="2025-01-01")
+
+    result = asyncio.run(main())
+    assert isinstance(result, v20250101.NTACorporateInfoSearcherResponse)
+    assert http_server.requests[0][0] == "/v1/houjinbangou?q=test&limit=1"
+
+
+@pytest.mark.parametrize(
+    "method,args,path,fixture",
+    [
+        ("get_banks", (), "/v1/bank", "banks_get.json"),
+        ("get_bank", ("0001",), "/v1/bank/0001", "bank_get.json"),
+        (
+            "get_bank_branches",
+            ("0001",),
+            "/v1/bank/0001/branches",
+            "bank_branches_get.json",
+        ),
+        (
+            "get_bank_branch",
+            ("0001", "001"),
+            "/v1/bank/0001/branches/001",
+            "bank_branch_get.json",
+        ),
+        (
+            "get_school",
+            ("F113110102700",),
+            "/v1/school/F113110102700",
+            "school_get.json",
+        ),
+    ],
+)
+def test_parity_with_sync_client(
+    http_server, load_version_fixture, method, args, path, fixture
+):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.client import KenAllClient
+
+    http_server.json(path, load_version_fixture("2025-01-01", fixture))
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            return await getattr(c, method)(*args, api_version="2025-01-01")
+
+    result = asyncio.run(main())
+    sync_client = KenAllClient("testing-api-key", api_url=http_server.url)
+    assert result == getattr(sync_client, method)(*args, api_version="2025-01-01")
+
+
+def test_search_holiday(http_server, dummy_holiday_search_json):
+    from kenallclient.aio import AsyncKenAllClient
+
+    http_server.json("/v1/holidays", dummy_holiday_search_json)
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            return await c.search_holiday(year=2022)
+
+    result = asyncio.run(main())
+    assert result.data[0].title == "元日"
+
+
+def test_http_error(http_server):
+    from kenallclient.aio import AsyncKenAllClient
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            return await c.get("0000000")
+
+    with pytest.raises(urllib.error.HTTPError) as e:
+        asyncio.run(main())
+    assert e.value.code == 404
+
+
+def test_unexpected_content_type(http_server):
+    from kenallclient.aio import AsyncKenAllClient
+
+    http_server.routes["/v1/postalcode/1008105"] = (
+        200,
+        {"Content-Type": "text/plain"},
+        b"hello",
+    )
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            return await c.get("1008105")
+
+    with pytest.raises(ValueError) as e:
+        asyncio.run(main())
+    assert e.value.args == ("not json response", b"hello")
+
+
+def test_concurrent_requests_share_connections(http_server, postalcode_v20221101):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.pool import AsyncConnectionPool
+
+    http_server.json("/v1/postalcode/1008105", postalcode_v20221101)
+
+    async def main():
+        pool = AsyncConnectionPool(maxsize=4)
+        async with AsyncKenAllClient(
+            "testing-api-key",
+            api_url=http_server.url,
+            connection_pool=pool,
+            coalesce_requests=False,
+        ) as c:
+            return await asyncio.gather(*(c.get("1008105") for _ in range(50)))
+
+    results = asyncio.run(main())
+    assert len(results) == 50
+    assert http_server.connections <= 4
+    assert len(http_server.requests) == 50
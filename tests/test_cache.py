@@ -0,0 +1,580 @@
+import time
+
+import pytest
+
+
+def _entry(value, ttl=60.0, size=0):
+    from kenallclient.cache import CacheEntry
+
+    return CacheEntry(value=value, expires_at=time.time() + ttl, size=size)
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://api.kenall.jp/v1/postalcode/1008105", "postalcode"),
+        ("https://api.kenall.jp/v1/postalcode/?q=a", "postalcode"),
+        ("https://api.kenall.jp/v1/houjinbangou?q=a", "houjinbangou"),
+        ("https://api.kenall.jp/v1/bank/0001/branches/001", "bank"),
+        ("https://api.kenall.jp/v1/holidays?year=2022", "holidays"),
+    ],
+)
+def test_endpoint_of(url, expected):
+    from kenallclient.cache import endpoint_of
+
+    assert endpoint_of(url) == expected
+
+
+def test_cache_key_includes_api_version():
+    from kenallclient.cache import cache_key
+    from kenallclient.client import KenAllClient
+
+    target = KenAllClient("testing-api-key")
+    assert cache_key(target.create_request("1008105")) != cache_key(
+        target.create_request("1008105", api_version="2025-01-01")
+    )
+
+
+class TestMemoryCache:
+    def test_get_set(self):
+        from kenallclient.cache import MemoryCache
+
+        cache = MemoryCache()
+        assert cache.get("a") is None
+        cache.set("a", _entry({"x": 1}))
+        assert cache.get("a").value == {"x": 1}
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_expired(self):
+        from kenallclient.cache import MemoryCache
+
+        cache = MemoryCache()
+        cache.set("a", _entry(1, ttl=-1))
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self):
+        from kenallclient.cache import MemoryCache
+
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", _entry(1))
+        cache.set("b", _entry(2))
+        cache.get("a")
+        cache.set("c", _entry(3))
+        assert cache.get("b") is None
+        assert cache.get("a").value == 1
+        assert cache.get("c").value == 3
+        assert cache.stats().evictions == 1
+
+    def test_eviction_by_bytes(self):
+        from kenallclient.cache import MemoryCache
+
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", _entry(1, size=6))
+        cache.set("b", _entry(2, size=6))
+        assert cache.get("a") is None
+        assert cache.stats().bytes == 6
+        # entries larger than the whole cache are not stored
+        cache.set("c", _entry(3, size=11))
+        assert cache.get("c") is None
+        assert cache.get("b").value == 2
+
+    def test_ttl_per_endpoint(self):
+        from kenallclient.cache import MemoryCache
+
+        cache = MemoryCache(ttl=10, ttls={"holidays": 100})
+        assert cache.ttl_for("https://api.kenall.jp/v1/holidays?year=2022") == 100
+        assert cache.ttl_for("https://api.kenall.jp/v1/postalcode/1008105") == 10
+
+
+def test_client_cache(http_server, load_version_fixture):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+    from kenallclient.models import compatible, v20250101
+
+    http_server.json(
+        "/v1/postalcode/1008105",
+        load_version_fixture("2025-01-01", "postalcode_get.json"),
+    )
+    cache = MemoryCache()
+    target = KenAllClient("testing-api-key", api_url=http_server.url, cache=cache)
+
+    first = target.get("1008105", api_version="2025-01-01")
+    second = target.get("1008105", api_version="2025-01-01")
+    assert isinstance(second, v20250101.AddressResolverResponse)
+    assert first == second
+    assert len(http_server.requests) == 1
+
+    # a different api version is a different entry
+    assert isinstance(target.get("1008105"), compatible.AddressResolverResponse)
+    assert len(http_server.requests) == 2
+    assert cache.stats().hits == 1
+
+
+def test_async_client_cache(http_server, load_version_fixture):
+    import asyncio
+
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.cache import MemoryCache
+
+    http_server.json(
+        "/v1/holidays", load_version_fixture("common", "holiday_search.json")
+    )
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=MemoryCache()
+        ) as c:
+            return [await c.search_holiday(year=2022) for _ in range(3)]
+
+    results = asyncio.run(main())
+    assert results[0] == results[2]
+    assert len(http_server.requests) == 1
+
+
+def test_async_client_sqlite_cache(http_server, load_version_fixture, tmp_path):
+    import asyncio
+    import threading
+
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.cache import SQLiteCache
+
+    http_server.json(
+        "/v1/holidays", load_version_fixture("common", "holiday_search.json")
+    )
+    cache = SQLiteCache(str(tmp_path / "kenall-cache.sqlite3"))
+    threads = []
+    get, set_ = cache.get, cache.set
+
+    def record(fn):
+        def wrapper(*args):
+            threads.append(threading.get_ident())
+            return fn(*args)
+
+        return wrapper
+
+    cache.get, cache.set = record(get), record(set_)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=cache
+        ) as c:
+            return [await c.search_holiday(year=2022) for _ in range(2)]
+
+    results = asyncio.run(main())
+    assert results[0] == results[1]
+    assert len(http_server.requests) == 1
+    # the database is not read or written on the event loop
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+
+
+class TestSQLiteCache:
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "kenall-cache.sqlite3")
+
+    def test_get_set(self, db_path):
+        from kenallclient.cache import SQLiteCache
+
+        cache = SQLiteCache(db_path)
+        assert cache.get("a") is None
+        cache.set("a", _entry({"data": ["東京都"]}, size=10))
+        entry = cache.get("a")
+        assert entry.value == {"data": ["東京都"]}
+        assert entry.size == 10
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (1, 1, 1, 10)
+
+    def test_wal_mode(self, db_path):
+        import sqlite3
+
+        from kenallclient.cache import SQLiteCache
+
+        SQLiteCache(db_path)
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    def test_shared_between_instances(self, db_path):
+        from kenallclient.cache import SQLiteCache
+
+        SQLiteCache(db_path).set("a", _entry([1, 2, 3]))
+        assert SQLiteCache(db_path).get("a").value == [1, 2, 3]
+
+    def test_shared_between_processes(self, db_path):
+        import multiprocessing
+
+        from kenallclient.cache import SQLiteCache
+
+        process = multiprocessing.get_context("spawn").Process(
+            target=_store_in_sqlite_cache, args=(db_path,)
+        )
+        process.start()
+        process.join(30)
+        assert process.exitcode == 0
+        assert SQLiteCache(db_path).get("from-child").value == {"ok": True}
+
+    def test_expired(self, db_path):
+        from kenallclient.cache import SQLiteCache
+
+        cache = SQLiteCache(db_path)
+        cache.set("a", _entry(1, ttl=-1))
+        assert cache.get("a") is None
+
+    def test_eviction_by_entries(self, db_path):
+        from kenallclient.cache import SQLiteCache
+
+        cache = SQLiteCache(db_path, max_entries=2, touch_interval=0)
+        cache.set("a", _entry(1))
+        cache.set("b", _entry(2))
+        cache.get("a")
+        cache.set("c", _entry(3))
+        assert cache.get("b") is None
+        assert cache.get("a").value == 1
+        assert cache.get("c").value == 3
+        assert cache.stats().evictions == 1
+
+    def test_eviction_by_bytes(self, db_path):
+        from kenallclient.cache import SQLiteCache
+
+        cache = SQLiteCache(db_path, max_bytes=10)
+        cache.set("a", _entry(1, size=6))
+        cache.set("b", _entry(2, size=6))
+        assert cache.get("a") is None
+        assert cache.stats().bytes == 6
+
+    def test_totals(self, db_path):
+        import sqlite3
+
+        from kenallclient.cache import SQLiteCache
+
+        cache = SQLiteCache(db_path)
+        cache.set("a", _entry(1, size=6))
+        cache.set("b", _entry(2, size=4))
+        cache.set("a", _entry(3, size=10))
+        assert (cache.stats().entries, cache.stats().bytes) == (2, 14)
+        cache.delete("b")
+        assert (cache.stats().entries, cache.stats().bytes) == (1, 10)
+        cache.clear()
+        assert (cache.stats().entries, cache.stats().bytes) == (0, 0)
+
+        # the triggers also count writes of other processes
+        cache.set("c", _entry(4, size=5))
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+        assert (cache.stats().entries, cache.stats().bytes) == (0, 0)
+
+    def test_rebuilds_older_schema(self, db_path):
+        import sqlite3
+
+        from kenallclient.cache import SQLiteCache
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, size INTEGER)")
+        conn.execute("INSERT INTO responses VALUES ('a', 10)")
+        conn.execute("PRAGMA user_version = 2")
+        conn.commit()
+        conn.close()
+
+        cache = SQLiteCache(db_path)
+        assert cache.get("a") is None
+        cache.set("a", _entry(1, size=6))
+        assert (cache.stats().entries, cache.stats().bytes) == (1, 6)
+
+    def test_client(self, db_path, http_server, load_version_fixture):
+        from kenallclient.cache import SQLiteCache
+        from kenallclient.client import KenAllClient
+
+        http_server.json(
+            "/v1/bank", load_version_fixture("2025-01-01", "banks_get.json")
+        )
+        first = KenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=SQLiteCache(db_path)
+        ).get_banks()
+        # a new client (e.g. after a restart) reuses the stored response
+        second = KenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=SQLiteCache(db_path)
+        ).get_banks()
+        assert first == second
+        assert len(http_server.requests) == 1
+
+
+def _store_in_sqlite_cache(path):
+    from kenallclient.cache import SQLiteCache
+
+    SQLiteCache(path).set("from-child", _entry({"ok": True}))
+
+
+def _etag_route(payload, etag='"v1"'):
+    def route(handler):
+        if handler.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return (
+            200,
+            {"ETag": etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            payload,
+        )
+
+    return route
+
+
+@pytest.mark.parametrize("cache_type", ["memory", "sqlite"])
+def test_revalidation(http_server, load_version_fixture, tmp_path, cache_type):
+    from kenallclient.cache import MemoryCache, SQLiteCache
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "bank_branches_get.json")
+    http_server.routes["/v1/bank/0001/branches"] = _etag_route(payload)
+    if cache_type == "memory":
+        cache = MemoryCache(ttl=0)
+    else:
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), ttl=0)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, cache=cache)
+
+    first = target.get_bank_branches("0001", api_version="2025-01-01")
+    second = target.get_bank_branches("0001", api_version="2025-01-01")
+
+    assert first == second
+    assert len(http_server.requests) == 2
+    assert "If-None-Match" not in http_server.requests[0][1]
+    headers = http_server.requests[1][1]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def test_revalidation_extends_entry(http_server, load_version_fixture):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "banks_get.json")
+    http_server.routes["/v1/bank"] = _etag_route(payload)
+    cache = MemoryCache(ttl=0)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, cache=cache)
+    target.get_banks()
+
+    cache.ttl = 60
+    target.get_banks()
+    target.get_banks()
+    assert len(http_server.requests) == 2
+
+
+def test_revalidation_changed(http_server, load_version_fixture):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "banks_get.json")
+    http_server.routes["/v1/bank"] = _etag_route(payload)
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, cache=MemoryCache(ttl=0)
+    )
+    target.get_banks()
+
+    changed = dict(payload, version="2099-01-01")
+    http_server.routes["/v1/bank"] = _etag_route(changed, etag='"v2"')
+    assert target.get_banks().version == "2099-01-01"
+
+
+def test_expired_without_validators_is_dropped():
+    from kenallclient.cache import CacheEntry, MemoryCache
+
+    cache = MemoryCache()
+    cache.set("a", CacheEntry(value=1, expires_at=0))
+    cache.set("b", CacheEntry(value=2, expires_at=0, etag='"x"'))
+    assert cache.get("a") is None
+    assert cache.get("b").value == 2
+    assert len(cache) == 1
+
+
+def test_async_revalidation(http_server, load_version_fixture):
+    import asyncio
+
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.cache import MemoryCache
+
+    payload = load_version_fixture("2025-01-01", "banks_get.json")
+    http_server.routes["/v1/bank"] = _etag_route(payload)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=MemoryCache(ttl=0)
+        ) as c:
+            return [await c.get_banks() for _ in range(2)]
+
+    first, second = asyncio.run(main())
+    assert first == second
+    assert http_server.requests[1][1]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        ("get", ("0000000",)),
+        ("get_houjin", ("0000000000000",)),
+        ("get_bank", ("9999",)),
+        ("get_bank_branch", ("9999", "999")),
+        ("get_school", ("X000000000000",)),
+    ],
+)
+def test_negative_cache(http_server, method, args):
+    import urllib.error
+
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, cache=MemoryCache()
+    )
+    for _ in range(3):
+        with pytest.raises(NotFoundError) as e:
+            getattr(target, method)(*args)
+        assert isinstance(e.value, urllib.error.HTTPError)
+        assert e.value.code == 404
+
+    assert len(http_server.requests) == 1
+
+
+def test_negative_cache_ttl(http_server):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+
+    cache = MemoryCache(negative_ttl=None)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, cache=cache)
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            target.get("0000000")
+    assert len(http_server.requests) == 2
+
+
+def test_negative_cache_sqlite(http_server, tmp_path):
+    from kenallclient.cache import SQLiteCache
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+
+    path = str(tmp_path / "cache.sqlite3")
+    for _ in range(2):
+        target = KenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=SQLiteCache(path)
+        )
+        with pytest.raises(NotFoundError):
+            target.get("0000000")
+    assert len(http_server.requests) == 1
+
+
+def test_not_found_without_cache(http_server):
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+    with pytest.raises(NotFoundError) as e:
+        target.get("0000000")
+    assert e.value.read() == b'{"message": "not found"}'
+
+
+def test_async_negative_cache(http_server):
+    import asyncio
+
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.cache import MemoryCache
+    from kenallclient.exceptions import NotFoundError
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=MemoryCache()
+        ) as c:
+            for _ in range(2):
+                with pytest.raises(NotFoundError):
+                    await c.get_houjin("0000000000000")
+
+    asyncio.run(main())
+    assert len(http_server.requests) == 1
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_stale_while_revalidate(http_server, load_version_fixture):
+    import threading
+
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "bank_branch_get.json")
+    release = threading.Event()
+    versions = iter(["v1", "v2"])
+
+    def route(handler):
+        version = next(versions)
+        if version != "v1":
+            release.wait(5)
+        return 200, {}, dict(payload, version=version)
+
+    http_server.routes["/v1/bank/0001/branches/001"] = route
+    cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+    with KenAllClient(
+        "testing-api-key", api_url=http_server.url, cache=cache
+    ) as target:
+        assert target.get_bank_branch("0001", "001").version == "v1"
+
+        # the expired entry is served while one refresh runs in the background
+        for _ in range(5):
+            assert target.get_bank_branch("0001", "001").version == "v1"
+        cache.ttl = 60
+        release.set()
+        _wait_for(lambda: not target._refreshing)
+
+        assert target.get_bank_branch("0001", "001").version == "v2"
+        assert len(http_server.requests) == 2
+
+
+def test_stale_window_elapsed(http_server, load_version_fixture):
+    from kenallclient.cache import CacheEntry, MemoryCache, cache_key
+    from kenallclient.client import KenAllClient
+
+    http_server.json("/v1/bank", load_version_fixture("2025-01-01", "banks_get.json"))
+    cache = MemoryCache(stale_while_revalidate=60)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, cache=cache)
+    req = target.create_banks_request()
+    cache.set(cache_key(req), CacheEntry(value={}, expires_at=time.time() - 61, size=0))
+
+    assert target.get_banks().data
+    assert len(http_server.requests) == 1
+
+
+def test_async_stale_while_revalidate(http_server, load_version_fixture):
+    import asyncio
+
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.cache import MemoryCache
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    versions = iter(["v1", "v2"])
+    http_server.routes["/v1/postalcode/1008105"] = lambda handler: (
+        200,
+        {},
+        dict(payload, version=next(versions)),
+    )
+
+    async def main():
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, cache=cache
+        ) as c:
+            first = await c.get("1008105")
+            stale = [await c.get("1008105") for _ in range(3)]
+            cache.ttl = 60
+            await asyncio.gather(*c._refreshing.values())
+            return first, stale, await c.get("1008105")
+
+    first, stale, refreshed = asyncio.run(main())
+    assert first.version == "v1"
+    assert [r.version for r in stale] == ["v1"] * 3
+    assert refreshed.version == "v2"
+    assert len(http_server.requests) == 2
@@ -0,0 +1,266 @@
+import asyncio
+import time
+import urllib.error
+
+import pytest
+
+
+def _http_error(code):
+    return urllib.error.HTTPError("http://localhost/", code, "", None, None)
+
+
+def _fail(target, endpoint, error):
+    with pytest.raises(type(error)):
+        with target.guard(endpoint):
+            raise error
+
+
+def test_opens_after_consecutive_failures(mocker):
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+    from kenallclient.exceptions import CircuitOpenError
+
+    mocker.patch("kenallclient.circuitbreaker.time.monotonic", return_value=100.0)
+    changes = []
+    target = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=10,
+        on_state_change=lambda *c: changes.append(c),
+    )
+
+    _fail(target, "postalcode", _http_error(503))
+    with target.guard("postalcode"):
+        pass
+    _fail(target, "postalcode", _http_error(503))
+    assert target.state("postalcode") is CircuitState.CLOSED
+    _fail(target, "postalcode", ConnectionResetError())
+    assert target.state("postalcode") is CircuitState.OPEN
+    assert changes == [("postalcode", CircuitState.CLOSED, CircuitState.OPEN)]
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        target.before_request("postalcode")
+    assert excinfo.value.endpoint == "postalcode"
+    assert excinfo.value.retry_at == 110.0
+    # circuits are kept per endpoint
+    target.before_request("bank")
+
+
+@pytest.mark.parametrize("error", [_http_error(404), _http_error(429), ValueError()])
+def test_other_errors_are_not_failures(error):
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+
+    target = CircuitBreaker(failure_threshold=1)
+    _fail(target, "postalcode", error)
+    assert target.state("postalcode") is CircuitState.CLOSED
+
+
+@pytest.mark.parametrize(
+    "error, reset",
+    [
+        (_http_error(404), True),
+        (ValueError("not json response"), False),
+        ("deadline", False),
+    ],
+)
+def test_only_answers_are_successes(error, reset):
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+    from kenallclient.exceptions import DeadlineExceeded
+
+    if error == "deadline":
+        error = DeadlineExceeded("deadline exceeded waiting for the rate limit")
+    target = CircuitBreaker(failure_threshold=2)
+    _fail(target, "postalcode", _http_error(503))
+    _fail(target, "postalcode", error)
+    _fail(target, "postalcode", _http_error(503))
+
+    expected = CircuitState.CLOSED if reset else CircuitState.OPEN
+    assert target.state("postalcode") is expected
+
+
+def test_deadline_in_flight_is_failure():
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+    from kenallclient.exceptions import DeadlineExceeded
+
+    target = CircuitBreaker(failure_threshold=1)
+    _fail(target, "postalcode", DeadlineExceeded("deadline exceeded", in_flight=True))
+    assert target.state("postalcode") is CircuitState.OPEN
+
+
+def test_half_open(mocker):
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+    from kenallclient.exceptions import CircuitOpenError
+
+    now = mocker.patch("kenallclient.circuitbreaker.time.monotonic", return_value=100.0)
+    changes = []
+    target = CircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout=10,
+        recovery_timeouts={"bank": 60},
+        on_state_change=lambda *c: changes.append(c[1:]),
+    )
+    _fail(target, "postalcode", _http_error(502))
+    _fail(target, "bank", _http_error(502))
+
+    now.return_value = 110.0
+    assert target.state("postalcode") is CircuitState.HALF_OPEN
+    assert target.state("bank") is CircuitState.OPEN
+
+    # a failed trial opens the circuit again
+    _fail(target, "postalcode", _http_error(502))
+    assert target.state("postalcode") is CircuitState.OPEN
+
+    now.return_value = 120.0
+    target.before_request("postalcode")
+    with pytest.raises(CircuitOpenError):
+        target.before_request("postalcode")
+    target.record_success("postalcode")
+    assert target.state("postalcode") is CircuitState.CLOSED
+    assert changes[-4:] == [
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+def test_cancelled_trial_is_released(mocker):
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+
+    now = mocker.patch("kenallclient.circuitbreaker.time.monotonic", return_value=100.0)
+    target = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    _fail(target, "postalcode", _http_error(502))
+    now.return_value = 110.0
+
+    with pytest.raises(KeyboardInterrupt):
+        with target.guard("postalcode"):
+            raise KeyboardInterrupt
+    with target.guard("postalcode"):
+        pass
+    assert target.state("postalcode") is CircuitState.CLOSED
+
+
+def test_half_open_deadline_releases_trial(mocker):
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+    from kenallclient.exceptions import DeadlineExceeded
+
+    now = mocker.patch("kenallclient.circuitbreaker.time.monotonic", return_value=100.0)
+    target = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    _fail(target, "postalcode", _http_error(502))
+    now.return_value = 110.0
+
+    # a trial running out of the caller's budget does not close the circuit
+    _fail(target, "postalcode", DeadlineExceeded("deadline exceeded"))
+    assert target.state("postalcode") is CircuitState.HALF_OPEN
+    # and lets another trial through
+    _fail(target, "postalcode", DeadlineExceeded("deadline exceeded", in_flight=True))
+    assert target.state("postalcode") is CircuitState.OPEN
+
+
+def test_failure_thresholds_per_endpoint():
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+
+    target = CircuitBreaker(failure_threshold=5, failure_thresholds={"school": 1})
+    _fail(target, "school", TimeoutError())
+    _fail(target, "bank", TimeoutError())
+    assert target.state("school") is CircuitState.OPEN
+    assert target.state("bank") is CircuitState.CLOSED
+
+
+def test_client_fails_fast(http_server):
+    from kenallclient.circuitbreaker import CircuitBreaker
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import CircuitOpenError
+
+    http_server.json("/v1/bank/0001", {}, status=503)
+    target = KenAllClient(
+        "testing-api-key",
+        api_url=http_server.url,
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+    )
+
+    for _ in range(2):
+        with pytest.raises(urllib.error.HTTPError):
+            target.get_bank("0001")
+    with pytest.raises(CircuitOpenError):
+        target.get_bank("0001")
+    assert len(http_server.requests) == 2
+
+
+def test_client_serves_cache_while_open(http_server, load_version_fixture):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.circuitbreaker import CircuitBreaker
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.json("/v1/bank/0001", payload, headers={"ETag": '"v1"'})
+    cache = MemoryCache(ttl=0)
+    target = KenAllClient(
+        "testing-api-key",
+        api_url=http_server.url,
+        cache=cache,
+        circuit_breaker=CircuitBreaker(failure_threshold=1),
+    )
+    assert target.get_bank("0001").data.code == "0001"
+
+    http_server.json("/v1/bank/0001", {}, status=503)
+    with pytest.raises(urllib.error.HTTPError):
+        target.get_bank("0001")
+    # the expired entry is served instead of failing fast
+    assert target.get_bank("0001").data.code == "0001"
+    assert len(http_server.requests) == 2
+
+
+def test_async_client_fails_fast(http_server):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.circuitbreaker import CircuitBreaker
+    from kenallclient.exceptions import CircuitOpenError
+
+    http_server.json("/v1/bank/0001", {}, status=502)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key",
+            api_url=http_server.url,
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        ) as target:
+            with pytest.raises(urllib.error.HTTPError):
+                await target.get_bank("0001")
+            with pytest.raises(CircuitOpenError):
+                await target.get_bank("0001")
+
+    asyncio.run(main())
+    assert len(http_server.requests) == 1
+
+
+def test_async_client_opens_on_hung_endpoint():
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+    from kenallclient.exceptions import CircuitOpenError, DeadlineExceeded
+
+    class HungTransport:
+        async def send(self, req, timeout=None):
+            await asyncio.sleep(10)
+
+        def close(self):
+            pass
+
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", transport=HungTransport(), circuit_breaker=breaker
+        ) as target:
+            for _ in range(2):
+                with pytest.raises(DeadlineExceeded):
+                    await target.get_bank("0001", deadline=0.05)
+            with pytest.raises(CircuitOpenError):
+                await target.get_bank("0001", deadline=0.05)
+
+    asyncio.run(main())
+    assert breaker.state("bank") is CircuitState.OPEN
+
+
+def test_circuit_open_error_message():
+    from kenallclient import CircuitOpenError
+
+    error = CircuitOpenError("bank", time.monotonic())
+    assert str(error) == "circuit for 'bank' is open"
@@ -1,4 +1,5 @@
 import io
+import urllib.error
 
 import pytest
 
@@ -1026,3 +1027,46 @@ def test_school_api_with_invalid_version(mocker):
     with pytest.raises(ValueError) as e:
         target.get_school("F113110102700", api_version="2024-01-01")
     assert "School API not available for version 2024-01-01" in str(e.value)
+
+
+def test_get_many(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.models import v20250101
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    http_server.json("/v1/postalcode/1008105", payload)
+    http_server.json("/v1/postalcode/1000001", payload)
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+    result = target.get_many(
+        ["1008105", "0000000", "1000001", "1008105"],
+        concurrency=4,
+        api_version="2025-01-01",
+    )
+
+    assert len(http_server.requests) == 3
+    assert sorted(result.results) == ["1000001", "1008105"]
+    assert isinstance(result["1008105"], v20250101.AddressResolverResponse)
+    assert list(result.errors) == ["0000000"]
+    assert result.errors["0000000"].code == 404
+    with pytest.raises(urllib.error.HTTPError):
+        result["0000000"]
+    assert len(result) == 3
+    assert "0000000" in result
+
+
+def test_get_many_empty():
+    from kenallclient.client import KenAllClient
+
+    target = KenAllClient("testing-api-key")
+    result = target.get_many([])
+    assert result.results == {}
+    assert result.errors == {}
+
+
+def test_get_many_invalid_concurrency():
+    from kenallclient.client import KenAllClient
+
+    target = KenAllClient("testing-api-key")
+    with pytest.raises(ValueError):
+        target.get_many(["1008105"], concurrency=0)
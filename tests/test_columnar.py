@@ -0,0 +1,120 @@
+import sys
+
+import pytest
+
+from tests.test_concurrency import _search_pages_route
+
+
+def test_columns_from_model(load_version_fixture):
+    from kenallclient.columnar import ColumnarBuilder
+    from kenallclient.models import v20250101
+
+    payload = load_version_fixture("2025-01-01", "postalcode_search.json")
+    corporation = {
+        "name": "会社",
+        "name_kana": "カイシャ",
+        "block_lot": "1",
+        "block_lot_num": None,
+        "post_office": "局",
+        "code_type": 0,
+    }
+    records = [dict(payload["data"][0], corporation=corporation)]
+
+    target = ColumnarBuilder(model=v20250101.Address)
+    target.add_page(payload)
+    target.add_records(records)
+
+    rows = len(payload["data"]) + 1
+    assert len(target) == rows
+    columns = target.columns()
+    assert "corporation" not in columns
+    assert columns["corporation.name"] == [None] * (rows - 1) + ["会社"]
+    assert columns["postal_code"] == [a["postal_code"] for a in payload["data"]] + [
+        records[0]["postal_code"]
+    ]
+    assert all(len(c) == rows for c in columns.values())
+
+
+def test_columns_from_fields(load_version_fixture):
+    from kenallclient.columnar import ColumnarBuilder
+
+    payload = load_version_fixture("2025-01-01", "houjinbangou_search.json")
+
+    target = ColumnarBuilder(fields=["name", "address.prefecture", "missing"])
+    target.add_pages([payload, payload])
+
+    n = len(payload["data"])
+    assert target.fields == ["name", "address.prefecture", "missing"]
+    assert target.columns() == {
+        "name": [c["name"] for c in payload["data"]] * 2,
+        "address.prefecture": [c["address"]["prefecture"] for c in payload["data"]] * 2,
+        "missing": [None] * n * 2,
+    }
+
+
+def test_columns_from_first_record():
+    from kenallclient.columnar import ColumnarBuilder
+
+    target = ColumnarBuilder()
+    assert target.fields == []
+    target.add_records([{"a": 1, "b": {"c": {"d": 2}}}])
+    target.add_records([{"a": 3, "b": None}, {"a": 4}])
+
+    assert target.columns() == {"a": [1, 3, 4], "b.c.d": [2, None, None]}
+
+    with pytest.raises(TypeError):
+        target.add_page(object())
+
+
+def test_search_pages_to_columns(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.columnar import ColumnarBuilder
+    from kenallclient.models import v20250101
+
+    payload = load_version_fixture("2025-01-01", "postalcode_search.json")
+    http_server.routes["/v1/postalcode/"] = _search_pages_route(payload, 25)
+    client = KenAllClient("testing-api-key", api_url=http_server.url, raw=True)
+
+    target = ColumnarBuilder(model=v20250101.Address)
+    target.add_pages(client.iter_search_pages(q="千代田", t=None, limit=10))
+
+    assert len(target) == 25
+    assert set(target.columns()["town"]) == {payload["data"][0]["town"]}
+
+
+def test_dataframe_export():
+    pandas = pytest.importorskip("pandas")
+    from kenallclient.columnar import ColumnarBuilder
+
+    target = ColumnarBuilder()
+    target.add_records([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+
+    df = target.to_pandas()
+    assert isinstance(df, pandas.DataFrame)
+    assert list(df.columns) == ["a", "b"]
+    assert df["a"].tolist() == [1, 2]
+
+
+def test_arrow_export():
+    pytest.importorskip("pyarrow")
+    from kenallclient.columnar import ColumnarBuilder
+
+    target = ColumnarBuilder()
+    target.add_records([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+
+    table = target.to_arrow()
+    assert table.column_names == ["a", "b"]
+    assert table.to_pydict() == {"a": [1, 2], "b": ["x", "y"]}
+
+
+def test_missing_optional_dependency(monkeypatch):
+    from kenallclient.columnar import ColumnarBuilder
+
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    target = ColumnarBuilder()
+
+    with pytest.raises(ImportError, match=r"kenallclient\[pandas\]"):
+        target.to_pandas()
+    with pytest.raises(ImportError, match=r"kenallclient\[arrow\]"):
+        target.to_arrow()
@@ -0,0 +1,129 @@
+import copy
+import os
+
+import pytest
+
+here = os.path.dirname(__file__)
+
+FACTORIES = {
+    "postalcode_get.json": "create_address_resolver_response",
+    "postalcode_search.json": "create_address_searcher_response",
+    "postalcode_search_multiple_facets.json": "create_address_searcher_response",
+    "postalcode_search_no_facets.json": "create_address_searcher_response",
+    "city_get.json": "create_city_resolver_response",
+    "houjinbangou.json": "create_corporate_info_resolver_response",
+    "houjinbangou_search.json": "create_corporate_info_searcher_response",
+    "houjinbangou_search_empty_facets.json": "create_corporate_info_searcher_response",
+    "houjinbangou_search_no_facets.json": "create_corporate_info_searcher_response",
+    "banks_get.json": "create_banks_response",
+    "bank_get.json": "create_bank_resolver_response",
+    "bank_branches_get.json": "create_bank_branches_response",
+    "bank_branch_get.json": "create_bank_branch_resolver_response",
+    "invoice_issuer_get.json": "create_invoice_issuer_resolver_response",
+    "school_get.json": "create_school_resolver_response",
+    "school_search.json": "create_school_searcher_response",
+}
+
+
+def _outcome(factory, payload, api_version):
+    try:
+        return factory(payload, api_version)
+    except (KeyError, TypeError, ValueError) as e:
+        return type(e)
+
+
+FIXTURES = [
+    (version, name)
+    for version in ("2022-11-01", "2023-09-01", "2024-01-01", "2025-01-01")
+    for name in sorted(os.listdir(os.path.join(here, "fixtures", version)))
+]
+
+
+def _model_classes():
+    from kenallclient.models import (
+        compatible,
+        v20221101,
+        v20230901,
+        v20240101,
+        v20250101,
+    )
+
+    for module in (compatible, v20221101, v20230901, v20240101, v20250101):
+        for name in module.__all__:
+            yield getattr(module, name)
+
+
+@pytest.mark.parametrize("version,name", FIXTURES)
+@pytest.mark.parametrize("api_version", ["fixture", None])
+def test_decoder_matches_fromdict(
+    monkeypatch, load_version_fixture, version, name, api_version
+):
+    from kenallclient.models import factories
+
+    factory = getattr(factories, FACTORIES[name])
+    if api_version == "fixture":
+        api_version = version
+    payload = load_version_fixture(version, name)
+    original = copy.deepcopy(payload)
+
+    with monkeypatch.context() as m:
+        m.setattr(factories, "decoder", lambda cls: cls.fromdict)
+        expected = _outcome(factory, copy.deepcopy(payload), api_version)
+
+    result = _outcome(factory, payload, api_version)
+    assert result == expected
+    assert type(result) is type(expected)
+    assert payload == original
+
+
+@pytest.mark.parametrize(
+    "cls", list(_model_classes()), ids=lambda cls: f"{cls.__module__}.{cls.__name__}"
+)
+def test_decoder_compiles(cls):
+    from kenallclient.models.compiler import decoder
+
+    fn = decoder(cls)
+    assert decoder(cls) is fn
+
+
+def test_decoder_fallback(load_version_fixture):
+    from kenallclient.models import compatible, v20250101
+    from kenallclient.models.compiler import decoder
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    address = payload["data"][0]
+
+    # unknown keys are rejected by fromdict, and by the decoder
+    with pytest.raises(TypeError):
+        v20250101.Address.fromdict({**address, "unknown": 1})
+    with pytest.raises(TypeError):
+        decoder(v20250101.Address)({**address, "unknown": 1})
+
+    # the compatible models ignore them, and fill in missing optional fields
+    partial = {k: v for k, v in address.items() if k != "town_roman"}
+    result = decoder(compatible.Address)({**partial, "unknown": 1})
+    assert result == compatible.Address.fromdict({**partial, "unknown": 1})
+    assert result.town_roman is None
+
+    # a truthy corporation is decoded, and a falsy one kept as is
+    corporation = {
+        "name": "name",
+        "name_kana": "kana",
+        "block_lot": "1",
+        "block_lot_num": None,
+        "post_office": "office",
+        "code_type": 0,
+    }
+    for value in (corporation, None, {}):
+        result = decoder(v20250101.Address)({**address, "corporation": value})
+        assert result == v20250101.Address.fromdict({**address, "corporation": value})
+
+    with pytest.raises(KeyError):
+        decoder(v20250101.AddressResolverResponse)({"version": "x"})
+
+
+def test_decoder_rejects_non_models():
+    from kenallclient.models.compiler import decoder
+
+    with pytest.raises(TypeError):
+        decoder(dict)
@@ -0,0 +1,301 @@
+import threading
+import time
+import urllib.error
+import urllib.parse
+
+import pytest
+
+
+def _http_error(code):
+    return urllib.error.HTTPError("http://localhost/", code, "", None, None)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial_limit": 0, "min_limit": 0},
+        {"initial_limit": 100, "max_limit": 64},
+        {"backoff_ratio": 1.0},
+        {"window": 0},
+    ],
+)
+def test_invalid_settings(kwargs):
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (_http_error(429), True),
+        (_http_error(503), True),
+        (_http_error(500), False),
+        (TimeoutError(), True),
+        (urllib.error.URLError(TimeoutError()), True),
+        (urllib.error.URLError(ConnectionRefusedError()), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_overload(error, expected):
+    from kenallclient.concurrency import is_overload
+
+    assert is_overload(error) is expected
+
+
+def test_additive_increase(mocker):
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    now = mocker.patch("kenallclient.concurrency.time.monotonic", return_value=0.0)
+    target = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+    # about one full window of healthy requests adds one slot
+    for _ in range(3):
+        started = target.acquire()
+        now.return_value += 0.1
+        target.release(started)
+    assert target.limit == 3
+
+    for _ in range(10):
+        started = target.acquire()
+        now.return_value += 0.1
+        target.release(started)
+    assert target.limit == 3
+
+    stats = target.stats()
+    assert stats.successes == 13
+    assert stats.in_flight == 0
+    assert stats.latency == pytest.approx(0.1)
+    assert stats.min_latency == pytest.approx(0.1)
+
+
+def test_slow_requests_hold_limit(mocker):
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    now = mocker.patch("kenallclient.concurrency.time.monotonic", return_value=0.0)
+    target = AdaptiveConcurrencyLimiter(initial_limit=4)
+    started = target.acquire()
+    now.return_value += 0.1
+    target.release(started)
+    limit = target._limit
+
+    for _ in range(4):
+        started = target.acquire()
+        now.return_value += 1.0
+        target.release(started)
+
+    assert target._limit == limit
+    assert target.stats().latency > 0.1
+
+
+def test_multiplicative_decrease_once_per_window(mocker):
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    now = mocker.patch("kenallclient.concurrency.time.monotonic", return_value=0.0)
+    target = AdaptiveConcurrencyLimiter(initial_limit=8)
+    window = [target.acquire() for _ in range(4)]
+    now.return_value = 1.0
+    for started in window:
+        target.release(started, _http_error(429))
+    assert target.limit == 4
+
+    started = target.acquire()
+    now.return_value = 2.0
+    target.release(started, TimeoutError())
+    assert target.limit == 2
+
+    started = target.acquire()
+    target.release(started, ValueError())
+    assert target.limit == 2
+    assert target.stats().overloads == 5
+    assert target.stats().errors == 1
+
+
+def test_min_latency_window(mocker):
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    now = mocker.patch("kenallclient.concurrency.time.monotonic", return_value=0.0)
+    target = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8, window=3)
+    for latency in (0.001, 0.1, 0.1, 0.1):
+        started = target.acquire()
+        now.return_value += latency
+        target.release(started)
+    assert target.stats().min_latency == pytest.approx(0.1)
+
+    # healthy again against the baseline of the window
+    limit = target._limit
+    started = target.acquire()
+    now.return_value += 0.15
+    target.release(started)
+    assert target._limit > limit
+
+
+def test_unsent_requests_are_not_recorded(mocker):
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter, served_locally
+
+    now = mocker.patch("kenallclient.concurrency.time.monotonic", return_value=0.0)
+    target = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+    def hit():
+        served_locally()
+        return "hit"
+
+    def miss():
+        now.return_value += 0.1
+        return "miss"
+
+    assert target.call(hit) == "hit"
+    assert target.call(miss) == "miss"
+    assert target.call(hit) == "hit"
+    stats = target.stats()
+    assert stats.successes == 1
+    assert stats.min_latency == pytest.approx(0.1)
+    assert stats.in_flight == 0
+
+
+def test_acquire_blocks_at_limit():
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    target = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    started = target.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        target.release(target.acquire())
+        acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)
+    target.release(started)
+    assert acquired.wait(5)
+    thread.join()
+
+
+def test_call_records_error():
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    target = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+    def fail():
+        raise _http_error(429)
+
+    with pytest.raises(urllib.error.HTTPError):
+        target.call(fail)
+    assert target.call(len, "abc") == 3
+    assert target.stats().overloads == 1
+    assert target.stats().in_flight == 0
+
+
+def test_get_many_adaptive(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    postal_codes = [f"10081{i:02d}" for i in range(20)]
+    for postal_code in postal_codes[:-1]:
+        http_server.json(f"/v1/postalcode/{postal_code}", payload)
+    http_server.json(f"/v1/postalcode/{postal_codes[-1]}", {}, status=429)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+    result = target.get_many(postal_codes, concurrency=limiter)
+
+    assert len(result.results) == 19
+    assert result.errors[postal_codes[-1]].code == 429
+    stats = limiter.stats()
+    assert stats.successes == 19
+    assert stats.overloads == 1
+    assert stats.in_flight == 0
+
+
+def test_get_many_adaptive_cache_hits(http_server, load_version_fixture):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+
+    def slow(handler):
+        time.sleep(0.02)
+        return 200, {}, payload
+
+    misses = [f"10081{i:02d}" for i in range(30)]
+    hits = [f"20081{i:02d}" for i in range(30)]
+    for postal_code in misses:
+        http_server.routes[f"/v1/postalcode/{postal_code}"] = slow
+    for postal_code in hits:
+        http_server.json(f"/v1/postalcode/{postal_code}", payload)
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, cache=MemoryCache()
+    )
+    target.get_many(hits)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=16)
+
+    # instant cache hits mixed with slow misses do not set the baseline
+    lookups = [code for pair in zip(hits, misses, strict=True) for code in pair]
+    result = target.get_many(lookups, concurrency=limiter)
+
+    assert len(result.results) == 60
+    stats = limiter.stats()
+    assert stats.successes == 30
+    assert stats.min_latency >= 0.02
+    assert stats.limit > 2
+
+
+def _search_pages_route(payload, count):
+    def route(handler):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(handler.path).query)
+        offset = int(query["offset"][0])
+        limit = int(query["limit"][0])
+        data = [payload["data"][0]] * min(limit, count - offset)
+        return 200, {}, dict(payload, data=data, count=count, offset=offset)
+
+    return route
+
+
+def test_iter_search_pages(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.concurrency import AdaptiveConcurrencyLimiter
+
+    payload = load_version_fixture("2025-01-01", "postalcode_search.json")
+    http_server.routes["/v1/postalcode/"] = _search_pages_route(payload, 25)
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+    pages = list(
+        target.iter_search_pages(
+            q="千代田",
+            t=None,
+            limit=10,
+            api_version="2025-01-01",
+            concurrency=AdaptiveConcurrencyLimiter(),
+        )
+    )
+
+    assert [p.offset for p in pages] == [0, 10, 20]
+    assert sum(len(p.data) for p in pages) == 25
+    assert len(http_server.requests) == 3
+
+
+def test_iter_search_houjin_pages(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "houjinbangou_search.json")
+    http_server.routes["/v1/houjinbangou"] = _search_pages_route(payload, 3)
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+    pages = list(
+        target.iter_search_houjin_pages("キャッシュ", limit=2, api_version="2025-01-01")
+    )
+
+    assert [p.offset for p in pages] == [0, 2]
+    assert [len(p.data) for p in pages] == [2, 1]
+
+
+def test_iter_search_pages_invalid_limit():
+    from kenallclient.client import KenAllClient
+
+    target = KenAllClient("testing-api-key")
+    with pytest.raises(ValueError):
+        next(target.iter_search_pages(q="千代田", t=None, limit=0))
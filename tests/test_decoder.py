@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+
+def test_get_decoder():
+    from kenallclient.decoder import available_decoders, get_decoder
+
+    assert get_decoder() is json.loads
+    assert get_decoder("json") is json.loads
+    assert get_decoder("auto") in available_decoders().values()
+    custom = json.loads
+    assert get_decoder(custom) is custom
+    with pytest.raises(ValueError):
+        get_decoder("simdjson")
+
+
+def test_orjson_decoder():
+    orjson = pytest.importorskip("orjson")
+    from kenallclient.decoder import get_decoder
+
+    assert get_decoder("orjson") is orjson.loads
+    assert get_decoder("auto") is orjson.loads
+
+
+@pytest.mark.parametrize("name", ["json", "auto"])
+def test_client_decoder(http_server, load_version_fixture, name):
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "houjinbangou_search.json")
+    http_server.json("/v1/houjinbangou", payload)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, json_decoder=name)
+
+    res = target.search_houjin(q="ケンオール", api_version="2025-01-01")
+    assert res.count == payload["count"]
+    assert len(res.data) == len(payload["data"])
+
+
+def test_decoder_receives_bytes(http_server, load_version_fixture):
+    import asyncio
+
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.client import KenAllClient
+
+    http_server.json(
+        "/v1/bank/0001", load_version_fixture("2025-01-01", "bank_get.json")
+    )
+    bodies = []
+
+    def decoder(data):
+        bodies.append(data)
+        return json.loads(data)
+
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, json_decoder=decoder
+    )
+    assert target.get_bank("0001", api_version="2025-01-01").data.code == "0001"
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, json_decoder=decoder
+        ) as target:
+            return await target.get_bank("0001", api_version="2025-01-01")
+
+    assert asyncio.run(main()).data.code == "0001"
+    assert len(bodies) == 2
+    assert all(isinstance(body, bytes) for body in bodies)
@@ -0,0 +1,230 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+import urllib.request
+
+import pytest
+
+RESOLVER_URL = "http://localhost/v1/postalcode/1008105"
+
+
+@pytest.fixture
+def executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def _slow_first(results):
+    """Return a function answering slowly on its first call only"""
+    calls = []
+    lock = threading.Lock()
+
+    def fn():
+        with lock:
+            n = len(calls)
+            calls.append(n)
+        if n == 0:
+            time.sleep(0.5)
+        return results[n]
+
+    fn.calls = calls
+    return fn
+
+
+def test_delay_percentile():
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy(
+        percentile=90, initial_delay=0.05, min_samples=10, max_delay=0.5
+    )
+    assert target.delay("postalcode") == 0.05
+    for ms in range(1, 11):
+        target._record_latency("postalcode", ms / 1000)
+    assert target.delay("postalcode") == 0.009
+    target._record_latency("postalcode", 3.0)
+    target._record_latency("postalcode", 3.0)
+    assert target.delay("postalcode") == 0.5
+    assert target.delay("bank") == 0.05
+
+
+def test_is_hedgeable():
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy()
+    assert target.is_hedgeable(urllib.request.Request(RESOLVER_URL))
+    assert not target.is_hedgeable(
+        urllib.request.Request("http://localhost/v1/postalcode/?q=chiyoda")
+    )
+    assert not target.is_hedgeable(
+        urllib.request.Request(RESOLVER_URL, data=b"", method="POST")
+    )
+    target = HedgePolicy(endpoints=frozenset({"bank"}))
+    assert not target.is_hedgeable(urllib.request.Request(RESOLVER_URL))
+
+
+def test_hedge_wins(executor):
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy(initial_delay=0.05)
+    fn = _slow_first(["primary", "hedge"])
+
+    started = time.monotonic()
+    assert target.call(urllib.request.Request(RESOLVER_URL), fn, executor) == "hedge"
+    assert time.monotonic() - started < 0.4
+    assert len(fn.calls) == 2
+    stats = target.stats()
+    assert (stats.requests, stats.hedged, stats.won, stats.skipped) == (1, 1, 1, 0)
+
+
+def test_hedge_not_queued_behind_primaries():
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy(initial_delay=0.05)
+    release = threading.Event()
+    with (
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as primaries,
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as hedges,
+    ):
+        # the only primary worker is busy
+        busy = primaries.submit(release.wait, 5)
+        started = time.monotonic()
+        result = target.call(
+            urllib.request.Request(RESOLVER_URL), lambda: "done", primaries, hedges
+        )
+        assert time.monotonic() - started < 0.4
+        release.set()
+        busy.result()
+
+    assert result == "done"
+    assert target.stats().won == 1
+
+
+def test_fast_response_is_not_hedged(executor):
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy(initial_delay=0.2)
+    calls = []
+
+    assert (
+        target.call(
+            urllib.request.Request(RESOLVER_URL), lambda: calls.append(1), executor
+        )
+        is None
+    )
+    assert calls == [1]
+    assert target.stats().hedged == 0
+
+
+def test_budget(executor):
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy(initial_delay=0.01, budget_ratio=0.5, max_budget=1)
+    req = urllib.request.Request(RESOLVER_URL)
+
+    target._budget = 0
+    fn = _slow_first(["primary", "hedge"])
+    assert target.call(req, fn, executor) == "primary"
+    assert target.stats().skipped == 1
+    fn = _slow_first(["primary", "hedge"])
+    assert target.call(req, fn, executor) == "hedge"
+    assert target.stats().hedged == 1
+
+
+def test_both_fail(executor):
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy(initial_delay=0.01)
+    errors = [ConnectionResetError("primary"), ConnectionResetError("hedge")]
+    calls = []
+
+    def fn():
+        calls.append(1)
+        error = errors[len(calls) - 1]
+        time.sleep(0.05)
+        raise error
+
+    with pytest.raises(ConnectionResetError, match="primary"):
+        target.call(urllib.request.Request(RESOLVER_URL), fn, executor)
+    assert len(calls) == 2
+
+
+def test_async_loser_is_cancelled():
+    from kenallclient.hedge import HedgePolicy
+
+    target = HedgePolicy(initial_delay=0.05)
+    cancelled = []
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+            return "primary"
+        return "hedge"
+
+    async def main():
+        result = await target.call_async(urllib.request.Request(RESOLVER_URL), fn)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == "hedge"
+    assert cancelled == [1]
+    assert target.stats().won == 1
+
+
+def test_client_hedges_slow_resolver(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.hedge import HedgePolicy
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    calls = []
+
+    def route(handler):
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.5)
+        return 200, {}, payload
+
+    http_server.routes["/v1/bank/0001"] = route
+    hedge = HedgePolicy(initial_delay=0.05)
+    with KenAllClient(
+        "testing-api-key", api_url=http_server.url, hedge=hedge
+    ) as target:
+        started = time.monotonic()
+        res = target.get_bank("0001", api_version="2025-01-01")
+        assert time.monotonic() - started < 0.4
+
+    assert res.data.code == "0001"
+    assert len(calls) == 2
+    assert hedge.stats().won == 1
+
+
+def test_client_hedge_pools(http_server, load_version_fixture, caplog):
+    from kenallclient.client import KenAllClient
+    from kenallclient.hedge import HedgePolicy
+
+    http_server.json(
+        "/v1/bank/0001", load_version_fixture("2025-01-01", "bank_get.json")
+    )
+    with pytest.raises(ValueError):
+        HedgePolicy(max_workers=0)
+    hedge = HedgePolicy(max_workers=64)
+    with KenAllClient(
+        "testing-api-key", api_url=http_server.url, hedge=hedge
+    ) as target:
+        target.get_bank("0001", api_version="2025-01-01")
+        primaries, hedges = target._hedge_pools(hedge)
+        assert primaries is not hedges
+        assert primaries._max_workers == hedges._max_workers == 64
+
+        with caplog.at_level("WARNING", logger="kenallclient.client"):
+            target.get_many(["1000001"], concurrency=64)
+        assert not caplog.records
+        with caplog.at_level("WARNING", logger="kenallclient.client"):
+            target.get_many(["1000001"], concurrency=128)
+        assert "max_workers=64" in caplog.text
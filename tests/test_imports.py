@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+CHECK = """
+import sys
+{statement}
+loaded = sorted(
+    name
+    for name in sys.modules
+    if name.startswith("kenallclient.models.")
+    and name.rsplit(".", 1)[1] not in ("compiler", "factories", "lazy")
+)
+print(loaded)
+print("kenallclient.aio" in sys.modules)
+"""
+
+
+def _run(statement):
+    out = subprocess.run(
+        [sys.executable, "-c", CHECK.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    # the last lines, after any output of the statement
+    return out.splitlines()[-2:]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import kenallclient",
+        "import runpy\n"
+        "sys.argv = ['kenallclient', '--help']\n"
+        "try:\n"
+        "    runpy.run_module('kenallclient', run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass",
+    ],
+    ids=["import", "help"],
+)
+def test_models_not_imported_at_startup(statement):
+    assert _run(statement) == ["[]", "False"]
+
+
+def test_models_imported_on_use():
+    loaded, aio = _run(
+        "import kenallclient\n"
+        "from kenallclient.models import v20250101\n"
+        "kenallclient.AsyncKenAllClient"
+    )
+    assert loaded == "['kenallclient.models.v20250101']"
+    assert aio == "True"
+
+
+def test_module_attributes():
+    import kenallclient
+    import kenallclient.models as models
+    from kenallclient.aio import AsyncKenAllClient
+
+    assert kenallclient.AsyncKenAllClient is AsyncKenAllClient
+    assert models.v20240101.Address.__module__ == "kenallclient.models.v20240101"
+    assert "v20250101" in dir(models)
+    with pytest.raises(AttributeError):
+        models.v20000101  # noqa: B018
+    with pytest.raises(AttributeError):
+        kenallclient.Missing  # noqa: B018
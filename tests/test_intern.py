@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+
+def _copy(value):
+    # a distinct str object with the same value
+    return "".join(list(value))
+
+
+def test_intern_table():
+    from kenallclient.intern import InternTable
+
+    target = InternTable(max_entries=2)
+    a = target.intern(_copy("東京都"))
+    assert target.intern(_copy("東京都")) is a
+    target.intern(_copy("千代田区"))
+    value = _copy("大阪府")
+    assert target.intern(value) is value
+    assert len(target) == 2
+
+    stats = target.stats()
+    assert (stats.hits, stats.misses, stats.rejected, stats.entries) == (1, 2, 1, 2)
+
+    target.clear()
+    assert len(target) == 0
+    with pytest.raises(ValueError):
+        InternTable(max_entries=0)
+
+
+def test_intern_payload(load_version_fixture):
+    from kenallclient.intern import InternTable
+
+    body = json.dumps(load_version_fixture("2025-01-01", "school_search.json"))
+    first, second = json.loads(body), json.loads(body)
+    target = InternTable()
+
+    assert target.intern_payload(first) is first
+    target.intern_payload(second)
+
+    assert first == json.loads(body)
+    assert second["version"] is first["version"]
+    a, b = first["data"][0], second["data"][0]
+    assert b["type"] is a["type"]
+    assert b["addresses"][0]["prefecture"] is a["addresses"][0]["prefecture"]
+    # high-cardinality fields are left alone
+    assert b["name"] is not a["name"]
+
+
+def test_intern_stats_are_exact_across_threads():
+    import threading
+
+    from kenallclient.intern import InternTable
+
+    target = InternTable()
+    payload = {"data": [{"prefecture": "東京都", "city": "千代田区"}] * 100}
+    body = json.dumps(payload)
+
+    def worker():
+        for _ in range(50):
+            target.intern_payload(json.loads(body))
+            target.intern(_copy("東京都"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = target.stats()
+    assert stats.hits + stats.misses == 8 * 50 * 201
+    assert stats.misses == 2
+
+
+def test_client_interner(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.intern import InternTable
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    http_server.json("/v1/postalcode/1000001", payload)
+    http_server.json("/v1/postalcode/1000002", payload)
+    interner = InternTable()
+    target = KenAllClient("testing-api-key", api_url=http_server.url, interner=interner)
+
+    a = target.get("1000001", api_version="2025-01-01").data[0]
+    b = target.get("1000002", api_version="2025-01-01").data[0]
+
+    assert a == b
+    assert b.prefecture is a.prefecture
+    assert b.city_roman is a.city_roman
+    assert interner.stats().hits > 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cache_interner(http_server, load_version_fixture, tmp_path, backend):
+    from kenallclient.cache import MemoryCache, SQLiteCache
+    from kenallclient.client import KenAllClient
+    from kenallclient.intern import InternTable
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    http_server.json("/v1/postalcode/1000001", payload)
+    http_server.json("/v1/postalcode/1000002", payload)
+    if backend == "memory":
+        cache = MemoryCache(interner=InternTable())
+    else:
+        cache = SQLiteCache(str(tmp_path / "cache.db"), interner=InternTable())
+    clients = [
+        KenAllClient("testing-api-key", api_url=http_server.url, cache=cache)
+        for _ in range(2)
+    ]
+
+    a = clients[0].get("1000001", api_version="2025-01-01").data[0]
+    b = clients[1].get("1000002", api_version="2025-01-01").data[0]
+    c = clients[1].get("1000001", api_version="2025-01-01").data[0]
+
+    assert b.prefecture is a.prefecture
+    assert c.jisx0402 is a.jisx0402
+    assert len(http_server.requests) == 2
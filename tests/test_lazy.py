@@ -0,0 +1,153 @@
+import asyncio
+import copy
+import pickle
+
+import pytest
+
+
+def test_lazy_sequence():
+    from kenallclient.models.lazy import LazySequence
+
+    calls = []
+
+    def decode(record):
+        calls.append(record["n"])
+        return {"value": record["n"] * 10}
+
+    target = LazySequence([{"n": i} for i in range(10)], decode)
+
+    assert len(target) == 10
+    assert target.decoded == 0
+    assert target[3] == {"value": 30}
+    assert target[3] is target[3]
+    assert target[-1] == {"value": 90}
+    assert calls == [3, 9]
+
+    view = target[2:8:2]
+    assert isinstance(view, LazySequence)
+    assert len(view) == 3
+    assert view.decoded == 0
+    assert view[1] is target[4]
+    assert list(view) == [{"value": 20}, {"value": 40}, {"value": 60}]
+    assert calls == [3, 9, 4, 2, 6]
+
+    with pytest.raises(IndexError):
+        target[10]
+
+    assert list(target) == [{"value": i * 10} for i in range(10)]
+    assert target.decoded == 10
+    assert sorted(calls) == list(range(10))
+
+
+def test_lazy_sequence_compat():
+    from kenallclient.models.lazy import LazySequence
+
+    target = LazySequence([1, 2, 3], lambda n: n * 2)
+
+    assert target == [2, 4, 6]
+    assert [2, 4, 6] == target
+    assert target != [2, 4]
+    assert target[1:] == (4, 6)
+    assert 4 in target
+    assert target.index(6) == 2
+    assert repr(target) == "LazySequence([2, 4, 6])"
+    assert pickle.loads(pickle.dumps(target)) == [2, 4, 6]
+    assert copy.deepcopy(target) == [2, 4, 6]
+
+
+@pytest.mark.parametrize(
+    "version,name,factory",
+    [
+        ("2022-11-01", "postalcode_search.json", "create_address_searcher_response"),
+        ("2025-01-01", "postalcode_search.json", "create_address_searcher_response"),
+        (
+            "2025-01-01",
+            "houjinbangou_search.json",
+            "create_corporate_info_searcher_response",
+        ),
+        (
+            "2024-01-01",
+            "houjinbangou_search_no_facets.json",
+            "create_corporate_info_searcher_response",
+        ),
+        ("2025-01-01", "school_search.json", "create_school_searcher_response"),
+    ],
+)
+@pytest.mark.parametrize("api_version", ["fixture", None])
+def test_lazy_search_response(
+    load_version_fixture, version, name, factory, api_version
+):
+    from kenallclient.models import factories
+    from kenallclient.models.lazy import LazySequence
+
+    factory = getattr(factories, factory)
+    if api_version == "fixture":
+        api_version = version
+    payload = load_version_fixture(version, name)
+
+    result = factory(payload, api_version, lazy=True)
+
+    assert isinstance(result.data, LazySequence)
+    assert result.data.decoded == 0
+    assert result == factory(copy.deepcopy(payload), api_version)
+    assert result.data.decoded == len(payload["data"])
+
+
+@pytest.mark.parametrize(
+    "version,name,factory",
+    [
+        ("2025-01-01", "postalcode_search.json", "create_address_searcher_response"),
+        (
+            "2025-01-01",
+            "houjinbangou_search.json",
+            "create_corporate_info_searcher_response",
+        ),
+    ],
+)
+def test_lazy_asdict(load_version_fixture, version, name, factory):
+    import dataclasses
+
+    from kenallclient.models import factories
+    from kenallclient.models.lazy import materialize
+
+    factory = getattr(factories, factory)
+    payload = load_version_fixture(version, name)
+    eager = factory(copy.deepcopy(payload), version)
+    lazy = factory(payload, version, lazy=True)
+
+    # asdict copies a lazy sequence as a list of models
+    assert dataclasses.is_dataclass(dataclasses.asdict(lazy)["data"][0])
+
+    target = materialize(lazy)
+    assert type(target.data) is list
+    assert dataclasses.asdict(target) == dataclasses.asdict(eager)
+    assert dataclasses.astuple(target) == dataclasses.astuple(eager)
+    assert materialize(eager) is eager
+
+
+def test_client_lazy(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.client import KenAllClient
+    from kenallclient.models.lazy import LazySequence
+
+    payload = load_version_fixture("2025-01-01", "postalcode_search.json")
+    http_server.json("/v1/postalcode/", payload)
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url, lazy=True)
+    res = target.search(q="test", t=None, api_version="2025-01-01")
+    assert isinstance(res.data, LazySequence)
+    assert res.data[0].postal_code == payload["data"][0]["postal_code"]
+    assert res.data.decoded == 1
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, lazy=True
+        ) as target:
+            return await target.search(q="test", t=None, api_version="2025-01-01")
+
+    res = asyncio.run(main())
+    assert isinstance(res.data, LazySequence)
+    assert [a.town for a in res.data] == [a["town"] for a in payload["data"]]
+
+    eager = KenAllClient("testing-api-key", api_url=http_server.url)
+    assert type(eager.search(q="test", t=None, api_version="2025-01-01").data) is list
@@ -343,3 +343,34 @@ class TestHoujinSearchResult:
         # Test __getitem__ raises KeyError for missing facets
         with pytest.raises(KeyError):
             _ = result.facets["area"]
+
+
+@pytest.mark.parametrize(
+    "module_name", ["compatible", "v20221101", "v20230901", "v20240101", "v20250101"]
+)
+def test_models_use_slots(module_name):
+    import dataclasses
+    import importlib
+
+    module = importlib.import_module(f"kenallclient.models.{module_name}")
+    for name in module.__all__:
+        cls = getattr(module, name)
+        if dataclasses.is_dataclass(cls):
+            assert "__slots__" in vars(cls), name
+
+
+def test_slotted_model_compatibility(postalcode_search_v20221101):
+    import copy
+    import dataclasses
+    import pickle
+
+    result = model.KenAllSearchResult.fromdict(postalcode_search_v20221101)
+    item = result.data[0]
+
+    assert not hasattr(item, "__dict__")
+    assert dataclasses.asdict(result)["data"][0]["postal_code"] == item.postal_code
+    assert dataclasses.replace(item, town="丸の内").town == "丸の内"
+    assert pickle.loads(pickle.dumps(result)) == result
+    assert copy.deepcopy(result) == result
+    with pytest.raises(AttributeError):
+        item.unknown = 1
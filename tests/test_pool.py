@@ -0,0 +1,99 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+
+def test_pool_reuses_connection(http_server, postalcode_v20221101):
+    from kenallclient.client import KenAllClient
+    from kenallclient.pool import ConnectionPool
+
+    http_server.json("/v1/postalcode/1008105", postalcode_v20221101)
+    pool = ConnectionPool()
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, connection_pool=pool
+    )
+
+    for _ in range(3):
+        result = target.get("1008105", api_version="2022-11-01")
+        assert result.data[0].postal_code == "1008105"
+
+    assert http_server.connections == 1
+    assert len(http_server.requests) == 3
+    path, headers = http_server.requests[0]
+    assert headers["Authorization"] == "Token testing-api-key"
+    assert headers["Kenall-Api-Version"] == "2022-11-01"
+
+
+def test_pool_max_requests(http_server):
+    from kenallclient.pool import ConnectionPool
+
+    http_server.json("/ping", {"ok": True})
+    pool = ConnectionPool(max_requests=2)
+    for _ in range(4):
+        with pool.urlopen(urllib.request.Request(http_server.url + "/ping")) as res:
+            res.read()
+
+    assert http_server.connections == 2
+
+
+def test_pool_idle_timeout(http_server):
+    from kenallclient.pool import ConnectionPool
+
+    http_server.json("/ping", {"ok": True})
+    pool = ConnectionPool(idle_timeout=0)
+    for _ in range(2):
+        with pool.urlopen(urllib.request.Request(http_server.url + "/ping")) as res:
+            res.read()
+
+    assert http_server.connections == 2
+
+
+def test_pool_unread_body_discards_connection(http_server):
+    from kenallclient.pool import ConnectionPool
+
+    http_server.json("/ping", {"ok": True})
+    pool = ConnectionPool()
+    with pool.urlopen(urllib.request.Request(http_server.url + "/ping")):
+        pass
+    with pool.urlopen(urllib.request.Request(http_server.url + "/ping")) as res:
+        assert res.read() == b'{"ok": true}'
+
+    assert http_server.connections == 2
+
+
+def test_pool_http_error(http_server):
+    from kenallclient.pool import ConnectionPool
+
+    pool = ConnectionPool()
+    with pytest.raises(urllib.error.HTTPError) as e:
+        pool.urlopen(urllib.request.Request(http_server.url + "/missing"))
+    assert e.value.code == 404
+    assert e.value.read() == b'{"message": "not found"}'
+
+    # the connection survives an error response
+    http_server.json("/ping", {"ok": True})
+    with pool.urlopen(urllib.request.Request(http_server.url + "/ping")) as res:
+        res.read()
+    assert http_server.connections == 1
+
+
+def test_pool_is_thread_safe(http_server):
+    import concurrent.futures
+
+    from kenallclient.pool import ConnectionPool
+
+    http_server.json("/ping", {"ok": True})
+    pool = ConnectionPool(maxsize=4)
+
+    def fetch(_):
+        req = urllib.request.Request(http_server.url + "/ping")
+        with pool.urlopen(req) as res:
+            return res.read()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(fetch, range(40)))
+
+    assert results == [b'{"ok": true}'] * 40
+    assert http_server.connections <= 4
+    pool.clear()
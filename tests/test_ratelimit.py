@@ -0,0 +1,229 @@
+import asyncio
+
+import pytest
+
+
+def test_take_token():
+    from kenallclient.ratelimit import take_token
+
+    # a full bucket serves immediately
+    assert take_token(2.0, 0.0, 0.0, rate=1.0, burst=2.0) == (1.0, 0.0)
+    # an empty bucket promises the next token
+    assert take_token(0.0, 0.0, 0.0, rate=2.0, burst=2.0) == (-1.0, 0.5)
+    # refill is capped by burst
+    assert take_token(0.0, 0.0, 100.0, rate=1.0, burst=3.0) == (2.0, 0.0)
+
+
+@pytest.mark.parametrize("rate, burst", [(0, None), (-1, None), (1, 0.5)])
+def test_invalid_settings(rate, burst):
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    with pytest.raises(ValueError):
+        MemoryRateLimiter(rate, burst=burst)
+
+
+def test_memory_rate_limiter(mocker):
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    now = mocker.patch("kenallclient.ratelimit.time.monotonic", return_value=100.0)
+    target = MemoryRateLimiter(2, rates={"bank": 1})
+
+    assert [target.reserve("key", "postalcode") for _ in range(4)] == [
+        0.0,
+        0.0,
+        0.5,
+        1.0,
+    ]
+    assert [target.reserve("key", "bank") for _ in range(2)] == [0.0, 1.0]
+    # buckets are kept per API key
+    assert target.reserve("other-key", "postalcode") == 0.0
+
+    now.return_value = 102.0
+    assert target.reserve("key", "postalcode") == 0.0
+
+
+def test_key_rates(mocker):
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    mocker.patch("kenallclient.ratelimit.time.monotonic", return_value=100.0)
+    target = MemoryRateLimiter(1, rates={"bank": 4}, key_rates={"premium": 2})
+
+    assert target.rate_for("bank", "premium") == 2
+    assert target.rate_for("bank", "key") == 4
+    assert [target.reserve("premium", "bank") for _ in range(3)] == [0.0, 0.0, 0.5]
+    assert [target.reserve("key", "postalcode") for _ in range(2)] == [0.0, 1.0]
+    with pytest.raises(ValueError):
+        MemoryRateLimiter(1, key_rates={"key": 0})
+
+
+def test_memory_rate_limiter_acquire(mocker):
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    mocker.patch("kenallclient.ratelimit.time.monotonic", return_value=100.0)
+    sleep = mocker.patch("kenallclient.ratelimit.time.sleep")
+    target = MemoryRateLimiter(4, burst=1)
+
+    assert target.acquire("key", "postalcode") == 0.0
+    sleep.assert_not_called()
+    assert target.acquire("key", "postalcode") == 0.25
+    sleep.assert_called_once_with(0.25)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_acquire_past_deadline(tmp_path, mocker, backend):
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.ratelimit import MemoryRateLimiter, SQLiteRateLimiter
+    from kenallclient.timeout import Deadline
+
+    mocker.patch("kenallclient.ratelimit.time.monotonic", return_value=100.0)
+    mocker.patch("kenallclient.ratelimit.time.time", return_value=1000.0)
+    sleep = mocker.patch("kenallclient.ratelimit.time.sleep")
+    if backend == "memory":
+        target = MemoryRateLimiter(0.5, burst=1)
+    else:
+        target = SQLiteRateLimiter(str(tmp_path / "ratelimit.sqlite3"), 0.5, burst=1)
+
+    assert target.acquire("key", "postalcode", Deadline(0.1)) == 0.0
+    with pytest.raises(DeadlineExceeded):
+        target.acquire("key", "postalcode", Deadline(0.1))
+    sleep.assert_not_called()
+    # the token promised to the failed call was given back
+    assert target.reserve("key", "postalcode") == 2.0
+
+
+def test_memory_rate_limiter_acquire_async():
+    import time
+
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    target = MemoryRateLimiter(50, burst=1)
+
+    async def main():
+        started = time.monotonic()
+        await asyncio.gather(
+            *[target.acquire_async("key", "postalcode") for _ in range(4)]
+        )
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.05
+
+
+def test_sqlite_rate_limiter_shared(tmp_path, mocker):
+    from kenallclient.ratelimit import SQLiteRateLimiter
+
+    mocker.patch("kenallclient.ratelimit.time.time", return_value=1000.0)
+    path = str(tmp_path / "ratelimit.sqlite3")
+    # two limiters on one file stand for two processes
+    first = SQLiteRateLimiter(path, 1, burst=2)
+    second = SQLiteRateLimiter(path, 1, burst=2)
+
+    assert first.reserve("key", "houjinbangou") == 0.0
+    assert second.reserve("key", "houjinbangou") == 0.0
+    assert first.reserve("key", "houjinbangou") == 1.0
+    assert second.reserve("key", "houjinbangou") == 2.0
+    assert second.reserve("key", "school") == 0.0
+    first.close()
+    second.close()
+
+
+def test_sqlite_rate_limiter_acquire_async(tmp_path, mocker):
+    import threading
+
+    from kenallclient.ratelimit import SQLiteRateLimiter
+
+    target = SQLiteRateLimiter(str(tmp_path / "ratelimit.sqlite3"), 100)
+    threads = []
+    mocker.patch.object(
+        target,
+        "reserve",
+        side_effect=lambda *args: threads.append(threading.get_ident()) or 0.0,
+    )
+
+    async def main():
+        return await target.acquire_async("key", "postalcode")
+
+    assert asyncio.run(main()) == 0.0
+    # the reservation does not block the event loop
+    assert threads and threads[0] != threading.get_ident()
+
+
+def test_client_rate_limiter(http_server, load_version_fixture, mocker):
+    from kenallclient.client import KenAllClient
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    http_server.json("/v1/bank", load_version_fixture("2025-01-01", "banks_get.json"))
+    limiter = MemoryRateLimiter(100)
+    acquire = mocker.spy(limiter, "acquire")
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, rate_limiter=limiter
+    )
+
+    target.get_banks()
+
+    acquire.assert_called_once_with("testing-api-key", "bank", None)
+
+
+def test_async_client_rate_limiter(http_server, load_version_fixture, mocker):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    http_server.json("/v1/bank", load_version_fixture("2025-01-01", "banks_get.json"))
+    limiter = MemoryRateLimiter(100)
+    acquire = mocker.spy(limiter, "acquire_async")
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, rate_limiter=limiter
+        ) as target:
+            await target.get_banks()
+
+    asyncio.run(main())
+
+    acquire.assert_called_once_with("testing-api-key", "bank", None)
+
+
+def test_client_rate_limit_deadline(http_server, load_version_fixture):
+    import time
+
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    http_server.json("/v1/bank", load_version_fixture("2025-01-01", "banks_get.json"))
+    target = KenAllClient(
+        "testing-api-key",
+        api_url=http_server.url,
+        rate_limiter=MemoryRateLimiter(0.5, burst=1),
+    )
+    target.get_banks()
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        target.get_banks(deadline=0.1)
+    assert time.monotonic() - started < 0.5
+    assert len(http_server.requests) == 1
+
+
+def test_async_client_rate_limit_deadline(http_server, load_version_fixture):
+    import time
+
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.ratelimit import MemoryRateLimiter
+
+    http_server.json("/v1/bank", load_version_fixture("2025-01-01", "banks_get.json"))
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key",
+            api_url=http_server.url,
+            rate_limiter=MemoryRateLimiter(0.5, burst=1),
+        ) as target:
+            await target.get_banks()
+            with pytest.raises(DeadlineExceeded):
+                await target.get_banks(deadline=0.1)
+
+    started = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - started < 0.5
+    assert len(http_server.requests) == 1
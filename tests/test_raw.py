@@ -0,0 +1,100 @@
+import asyncio
+
+from tests.test_concurrency import _search_pages_route
+
+
+def test_raw_results(http_server, load_version_fixture):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+
+    postalcode = load_version_fixture("2025-01-01", "postalcode_get.json")
+    bank = load_version_fixture("2025-01-01", "bank_get.json")
+    holiday = load_version_fixture("common", "holiday_search.json")
+    http_server.json("/v1/postalcode/1000001", postalcode)
+    http_server.json("/v1/bank/0001", bank)
+    http_server.json("/v1/holidays", holiday)
+
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, cache=MemoryCache(), raw=True
+    )
+
+    assert target.get("1000001", api_version="2025-01-01") == postalcode
+    assert target.get_bank("0001", api_version="2025-01-01") == bank
+    assert target.search_holiday(year=2024) == holiday
+
+    # cached results are raw as well
+    assert target.get("1000001", api_version="2025-01-01") == postalcode
+    paths = [path for path, _ in http_server.requests]
+    assert paths == [
+        "/v1/postalcode/1000001",
+        "/v1/bank/0001",
+        "/v1/holidays?year=2024",
+    ]
+    [_, headers] = http_server.requests[0]
+    assert headers["KenAll-API-Version"] == "2025-01-01"
+
+
+def test_raw_search_pages(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "postalcode_search.json")
+    http_server.routes["/v1/postalcode/"] = _search_pages_route(payload, 25)
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url, raw=True)
+    pages = list(target.iter_search_pages(q="千代田", t=None, limit=10))
+
+    assert [p["offset"] for p in pages] == [0, 10, 20]
+    assert sum(len(p["data"]) for p in pages) == 25
+    assert all(type(a) is dict for p in pages for a in p["data"])
+
+
+def test_async_raw_results(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+
+    payload = load_version_fixture("2025-01-01", "houjinbangou_search.json")
+    http_server.json("/v1/houjinbangou", payload)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, raw=True
+        ) as target:
+            return await target.search_houjin("キャッシュ", api_version="2025-01-01")
+
+    assert asyncio.run(main()) == payload
+
+
+def test_raw_results_do_not_share_cache(http_server, load_version_fixture):
+    from kenallclient.cache import MemoryCache
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    http_server.json("/v1/postalcode/1000001", payload)
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, cache=MemoryCache(), raw=True
+    )
+
+    first = target.get("1000001", api_version="2025-01-01")
+    first["data"][0]["town"] = "changed"
+    first["data"].clear()
+    second = target.get("1000001", api_version="2025-01-01")
+    second["version"] = "changed"
+
+    assert target.get("1000001", api_version="2025-01-01") == payload
+    assert len(http_server.requests) == 1
+
+
+def test_raw_results_without_sharing_are_not_copied(http_server, mocker):
+    from kenallclient import client
+    from kenallclient.client import KenAllClient
+
+    http_server.json("/v1/holidays", {"data": []})
+    copy_payload = mocker.spy(client, "_copy_payload")
+    target = KenAllClient(
+        "testing-api-key",
+        api_url=http_server.url,
+        raw=True,
+        coalesce_requests=False,
+    )
+
+    assert target.search_holiday(year=2024) == {"data": []}
+    copy_payload.assert_not_called()
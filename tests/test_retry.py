@@ -0,0 +1,189 @@
+import asyncio
+import urllib.error
+import urllib.request
+
+import pytest
+
+
+def _flaky_route(payload, failures, status=503, headers=None):
+    """Answer ``failures`` times with ``status`` before returning ``payload``"""
+    remaining = [failures]
+
+    def route(handler):
+        if remaining[0] > 0:
+            remaining[0] -= 1
+            return status, headers or {}, {"message": "unavailable"}
+        return 200, {}, payload
+
+    return route
+
+
+def test_parse_retry_after():
+    from kenallclient.retry import parse_retry_after
+
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480) == 10.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412490) == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_backoff_full_jitter(mocker):
+    from kenallclient.retry import RetryPolicy
+
+    uniform = mocker.patch("kenallclient.retry.random.uniform", return_value=0.5)
+    target = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    assert target.backoff(1) == 0.5
+    uniform.assert_called_with(0, 1.0)
+    target.backoff(3)
+    uniform.assert_called_with(0, 4.0)
+    target.backoff(10)
+    uniform.assert_called_with(0, 5.0)
+
+
+@pytest.mark.parametrize(
+    "method, error, expected",
+    [
+        ("GET", urllib.error.HTTPError("u", 503, "", None, None), True),
+        ("GET", urllib.error.HTTPError("u", 429, "", None, None), True),
+        ("GET", urllib.error.HTTPError("u", 500, "", None, None), False),
+        ("GET", urllib.error.HTTPError("u", 404, "", None, None), False),
+        ("GET", urllib.error.URLError(ConnectionRefusedError()), True),
+        ("GET", ConnectionResetError(), True),
+        ("GET", ValueError("not json response"), False),
+        ("POST", urllib.error.HTTPError("u", 503, "", None, None), False),
+        ("POST", ConnectionResetError(), False),
+    ],
+)
+def test_is_retryable(method, error, expected):
+    from kenallclient.retry import RetryPolicy
+
+    req = urllib.request.Request("http://localhost/", method=method)
+    assert RetryPolicy().is_retryable(req, error) is expected
+
+
+def test_client_retries_transient_status(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.retry import RetryPolicy
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _flaky_route(payload, failures=2)
+    events = []
+    retry = RetryPolicy(base_delay=0.001, on_retry=events.append)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, retry=retry)
+
+    assert target.get_bank("0001").data.code == "0001"
+    assert len(http_server.requests) == 3
+    assert [e.attempt for e in events] == [1, 2]
+    assert all(e.error.code == 503 for e in events)
+
+
+def test_client_gives_up_after_max_attempts(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.retry import RetryPolicy
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _flaky_route(payload, failures=5)
+    retry = RetryPolicy(max_attempts=2, base_delay=0.001)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, retry=retry)
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        target.get_bank("0001")
+    assert excinfo.value.code == 503
+    assert len(http_server.requests) == 2
+
+
+def test_client_honors_retry_after(http_server, load_version_fixture, mocker):
+    from kenallclient.client import KenAllClient
+    from kenallclient.retry import RetryPolicy
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _flaky_route(
+        payload, failures=1, status=429, headers={"Retry-After": "7"}
+    )
+    sleep = mocker.patch("kenallclient.retry.time.sleep")
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, retry=RetryPolicy()
+    )
+
+    assert target.get_bank("0001").data.code == "0001"
+    sleep.assert_called_once_with(7.0)
+
+
+def test_client_gives_up_on_long_retry_after(http_server, load_version_fixture, mocker):
+    from kenallclient.client import KenAllClient
+    from kenallclient.retry import RetryPolicy
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _flaky_route(
+        payload, failures=1, status=429, headers={"Retry-After": "3600"}
+    )
+    sleep = mocker.patch("kenallclient.retry.time.sleep")
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, retry=RetryPolicy()
+    )
+
+    with pytest.raises(urllib.error.HTTPError):
+        target.get_bank("0001")
+    sleep.assert_not_called()
+    assert len(http_server.requests) == 1
+
+    retry = RetryPolicy(max_retry_after=3600.0)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, retry=retry)
+    http_server.routes["/v1/bank/0001"] = _flaky_route(
+        payload, failures=1, status=429, headers={"Retry-After": "3600"}
+    )
+    assert target.get_bank("0001").data.code == "0001"
+    sleep.assert_called_once_with(3600.0)
+
+
+def test_client_retry_deadline(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.retry import RetryPolicy
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _flaky_route(
+        payload, failures=1, headers={"Retry-After": "60"}
+    )
+    retry = RetryPolicy(deadline=1.0)
+    target = KenAllClient("testing-api-key", api_url=http_server.url, retry=retry)
+
+    with pytest.raises(urllib.error.HTTPError):
+        target.get_bank("0001")
+    assert len(http_server.requests) == 1
+
+
+def test_client_does_not_retry_not_found(http_server):
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+    from kenallclient.retry import RetryPolicy
+
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, retry=RetryPolicy()
+    )
+
+    with pytest.raises(NotFoundError):
+        target.get_bank("9999")
+    assert len(http_server.requests) == 1
+
+
+def test_async_client_retries_transient_status(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.retry import RetryPolicy
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _flaky_route(payload, failures=2, status=502)
+    events = []
+    retry = RetryPolicy(base_delay=0.001, on_retry=events.append)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, retry=retry
+        ) as target:
+            return await target.get_bank("0001")
+
+    assert asyncio.run(main()).data.code == "0001"
+    assert len(http_server.requests) == 3
+    assert len(events) == 2
@@ -0,0 +1,348 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+
+def test_single_flight_shares_result():
+    import concurrent.futures
+
+    from kenallclient.singleflight import SingleFlight
+
+    target = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 1}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(target.do, "key", fn)
+        started.wait(5)
+        followers = [executor.submit(target.do, "key", fn) for _ in range(7)]
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert len(target) == 0
+
+
+def test_single_flight_shares_exception():
+    import concurrent.futures
+
+    from kenallclient.singleflight import SingleFlight
+
+    target = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    error = ValueError("boom")
+
+    def fn():
+        started.set()
+        release.wait(5)
+        raise error
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(target.do, "key", fn)
+        started.wait(5)
+        followers = [executor.submit(target.do, "key", fn) for _ in range(3)]
+        release.set()
+        for future in [leader] + followers:
+            assert future.exception() is error
+
+
+def test_single_flight_separate_keys():
+    from kenallclient.singleflight import SingleFlight
+
+    target = SingleFlight()
+    assert target.do("a", lambda: 1) == 1
+    assert target.do("b", lambda: 2) == 2
+    assert target.do("a", lambda: 3) == 3
+
+
+def test_single_flight_follower_deadline():
+    import concurrent.futures
+
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.singleflight import SingleFlight
+    from kenallclient.timeout import Deadline
+
+    target = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        return 1
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(target.do, "key", fn)
+        started.wait(5)
+        before = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            target.do("key", fn, Deadline(0.1))
+        assert time.monotonic() - before < 1.0
+        release.set()
+        # the shared call is not affected
+        assert leader.result() == 1
+
+
+def test_single_flight_leader_deadline():
+    import concurrent.futures
+
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.singleflight import SingleFlight
+
+    target = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def leader():
+        started.set()
+        release.wait(5)
+        raise DeadlineExceeded("deadline exceeded", in_flight=True)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(target.do, "key", leader)
+        started.wait(5)
+        follower = executor.submit(target.do, "key", lambda: "own")
+        # give the follower time to join the in-flight call
+        time.sleep(0.05)
+        release.set()
+        with pytest.raises(DeadlineExceeded):
+            first.result()
+        # the budget of the leader ran out, not the one of the follower
+        assert follower.result() == "own"
+
+
+def test_async_single_flight():
+    from kenallclient.singleflight import AsyncSingleFlight
+
+    target = AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def main():
+        return await asyncio.gather(*(target.do("key", fn) for _ in range(10)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert len(target) == 0
+
+
+def test_async_single_flight_exception():
+    from kenallclient.singleflight import AsyncSingleFlight
+
+    target = AsyncSingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            *(target.do("key", fn) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert results[0] is results[1] is results[2]
+
+
+def test_async_single_flight_follower_deadline():
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.singleflight import AsyncSingleFlight
+    from kenallclient.timeout import Deadline
+
+    target = AsyncSingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.3)
+        return 1
+
+    async def main():
+        leader = asyncio.ensure_future(target.do("key", fn))
+        await asyncio.sleep(0)
+        with pytest.raises(DeadlineExceeded):
+            await target.do("key", fn, Deadline(0.05))
+        return await leader
+
+    assert asyncio.run(main()) == 1
+
+
+def test_client_coalesces_requests(http_server, load_version_fixture):
+    import concurrent.futures
+
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    started = threading.Event()
+    release = threading.Event()
+
+    def route(handler):
+        started.set()
+        release.wait(5)
+        return 200, {}, payload
+
+    http_server.routes["/v1/postalcode/1008105"] = route
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(target.get, "1008105")
+        started.wait(5)
+        followers = [executor.submit(target.get, "1008105") for _ in range(7)]
+        # give the followers time to join the in-flight request
+        time.sleep(0.1)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(http_server.requests) == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_client_coalesces_errors(http_server):
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+    with pytest.raises(NotFoundError):
+        target.get("0000000")
+    assert len(target._single_flight) == 0
+
+
+def test_async_client_coalesces_requests(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+
+    http_server.json(
+        "/v1/postalcode/1008105",
+        load_version_fixture("2025-01-01", "postalcode_get.json"),
+    )
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            return await asyncio.gather(*(c.get("1008105") for _ in range(20)))
+
+    results = asyncio.run(main())
+    assert len(results) == 20
+    assert len(http_server.requests) == 1
+
+
+def test_client_follower_deadline(http_server, load_version_fixture):
+    import concurrent.futures
+
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    started = threading.Event()
+    release = threading.Event()
+
+    def route(handler):
+        started.set()
+        release.wait(5)
+        return 200, {}, payload
+
+    http_server.routes["/v1/postalcode/1008105"] = route
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(target.get, "1008105")
+        started.wait(5)
+        before = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            target.get("1008105", deadline=0.2)
+        assert time.monotonic() - before < 1.0
+        release.set()
+        assert leader.result().data
+
+    assert len(http_server.requests) == 1
+
+
+def test_async_client_follower_deadline(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+    release = threading.Event()
+
+    def route(handler):
+        release.wait(5)
+        return 200, {}, payload
+
+    http_server.routes["/v1/postalcode/1008105"] = route
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            leader = asyncio.ensure_future(c.get("1008105"))
+            await asyncio.sleep(0.05)
+            before = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                await c.get("1008105", deadline=0.2)
+            elapsed = time.monotonic() - before
+            release.set()
+            return elapsed, await leader
+
+    elapsed, result = asyncio.run(main())
+    assert elapsed < 1.0
+    assert result.data
+    assert len(http_server.requests) == 1
+
+
+def test_client_leader_deadline(http_server, load_version_fixture):
+    import concurrent.futures
+
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+
+    def route(handler):
+        time.sleep(0.3)
+        return 200, {}, payload
+
+    http_server.routes["/v1/postalcode/1000001"] = route
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(target.get, "1000001", deadline=0.1)
+        time.sleep(0.01)
+        follower = executor.submit(target.get, "1000001")
+        with pytest.raises(DeadlineExceeded):
+            leader.result()
+        assert follower.result().data
+
+
+def test_async_client_leader_deadline(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+
+    payload = load_version_fixture("2025-01-01", "postalcode_get.json")
+
+    def route(handler):
+        time.sleep(0.3)
+        return 200, {}, payload
+
+    http_server.routes["/v1/postalcode/1000001"] = route
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", api_url=http_server.url) as c:
+            leader = asyncio.ensure_future(c.get("1000001", deadline=0.1))
+            await asyncio.sleep(0.01)
+            follower = asyncio.ensure_future(c.get("1000001"))
+            with pytest.raises(DeadlineExceeded):
+                await leader
+            return await follower
+
+    assert asyncio.run(main()).data
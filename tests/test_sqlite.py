@@ -0,0 +1,32 @@
+import threading
+
+
+def test_connections_per_thread(tmp_path):
+    from kenallclient.sqlite import SQLiteConnections
+
+    target = SQLiteConnections(str(tmp_path / "db.sqlite3"))
+    conn = target.get()
+    assert target.get() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    others = []
+    thread = threading.Thread(target=lambda: others.append(target.get()))
+    thread.start()
+    thread.join()
+    assert others[0] is not conn
+
+    target.close()
+    assert target.get() is not conn
+    target.close()
+
+
+def test_connections_after_fork(tmp_path, mocker):
+    from kenallclient.sqlite import SQLiteConnections
+
+    target = SQLiteConnections(str(tmp_path / "db.sqlite3"))
+    conn = target.get()
+    # a child process does not reuse the connection of its parent
+    mocker.patch("kenallclient.sqlite.os.getpid", return_value=-1)
+    assert target.get() is not conn
+    conn.close()
+    target.close()
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import time
+import urllib.error
+
+import pytest
+
+
+def _slow_route(payload, delay):
+    def route(handler):
+        time.sleep(delay)
+        return 200, {}, payload
+
+    return route
+
+
+def _json_response(payload):
+    from tests.test_client import DummyResponse
+
+    response = DummyResponse(json.dumps(payload))
+    response.headers = {"Content-Type": "application/json"}
+    return response
+
+
+def test_timeout_of():
+    from kenallclient.timeout import Timeout
+
+    assert Timeout.of(None) is None
+    assert Timeout.of(3) == Timeout(connect=3, read=3)
+    timeout = Timeout(connect=1)
+    assert Timeout.of(timeout) is timeout
+    assert timeout.cap(0.5) == Timeout(connect=0.5, read=0.5)
+    assert Timeout(connect=1, read=10).cap(5) == Timeout(connect=1, read=5)
+    assert Timeout(connect=1, read=10).socket_timeout == 10
+    assert Timeout(connect=1).socket_timeout == 1
+
+
+def test_deadline(mocker):
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.timeout import Deadline, attempt_timeout
+
+    now = mocker.patch("kenallclient.timeout.time.monotonic", return_value=100.0)
+    deadline = Deadline.of(2)
+    assert Deadline.of(deadline) is deadline
+    assert Deadline.of(None) is None
+    assert deadline.remaining() == 2.0
+    assert attempt_timeout(None, deadline).read == 2.0
+
+    now.return_value = 102.0
+    assert deadline.expired()
+    with pytest.raises(DeadlineExceeded):
+        deadline.check()
+    assert issubclass(DeadlineExceeded, TimeoutError)
+
+
+def test_client_timeout(mocker, postalcode_v20221101):
+    from kenallclient.client import KenAllClient
+    from kenallclient.timeout import Timeout
+
+    mock_urlopen = mocker.patch("kenallclient.client.urllib.request.urlopen")
+    mock_urlopen.side_effect = lambda *args, **kwargs: _json_response(
+        postalcode_v20221101
+    )
+    target = KenAllClient("testing-api-key", timeout=5)
+    request = target.create_request("1008105")
+
+    target.fetch(request)
+    mock_urlopen.assert_called_with(request, timeout=5)
+
+    target.get("1008105", timeout=Timeout(connect=1, read=2))
+    assert mock_urlopen.call_args.kwargs == {"timeout": 2}
+
+
+def test_call_deadline_caps_timeout(mocker, postalcode_v20221101):
+    from kenallclient.client import KenAllClient
+
+    mock_urlopen = mocker.patch("kenallclient.client.urllib.request.urlopen")
+    mock_urlopen.return_value = _json_response(postalcode_v20221101)
+    target = KenAllClient("testing-api-key", timeout=30)
+
+    target.get("1008105", deadline=1)
+    assert mock_urlopen.call_args.kwargs["timeout"] <= 1
+
+
+def test_expired_deadline(mocker):
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.timeout import Deadline
+
+    mock_urlopen = mocker.patch("kenallclient.client.urllib.request.urlopen")
+    target = KenAllClient("testing-api-key")
+
+    with pytest.raises(DeadlineExceeded):
+        target.get_bank("0001", deadline=Deadline(0))
+    mock_urlopen.assert_not_called()
+
+
+def test_deadline_on_slow_response(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _slow_route(payload, 1.0)
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+
+    started = time.monotonic()
+    with pytest.raises((TimeoutError, urllib.error.URLError)):
+        target.get_bank("0001", deadline=0.2)
+    assert time.monotonic() - started < 0.8
+
+
+def test_deadline_stops_retries(http_server):
+    from kenallclient.client import KenAllClient
+    from kenallclient.retry import RetryPolicy
+
+    http_server.json("/v1/bank/0001", {}, status=503, headers={"Retry-After": "5"})
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, retry=RetryPolicy()
+    )
+
+    started = time.monotonic()
+    with pytest.raises(urllib.error.HTTPError):
+        target.get_bank("0001", deadline=1)
+    assert time.monotonic() - started < 1
+    assert len(http_server.requests) == 1
+
+
+def test_deadline_spans_pages(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.timeout import Deadline
+
+    payload = load_version_fixture("2025-01-01", "postalcode_search.json")
+    http_server.json("/v1/postalcode/", dict(payload, count=30))
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+    deadline = Deadline(60)
+
+    pages = target.iter_search_pages(q="千代田", t=None, limit=10, deadline=deadline)
+    next(pages)
+    deadline.expires_at = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        list(pages)
+    assert len(http_server.requests) == 1
+
+
+def test_deadline_does_not_trip_circuit(mocker):
+    from kenallclient.circuitbreaker import CircuitBreaker, CircuitState
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+    from kenallclient.timeout import Deadline
+
+    mocker.patch("kenallclient.client.urllib.request.urlopen")
+    breaker = CircuitBreaker(failure_threshold=1)
+    target = KenAllClient("testing-api-key", circuit_breaker=breaker)
+
+    with pytest.raises(DeadlineExceeded):
+        target.get_bank("0001", deadline=Deadline(0))
+    assert breaker.state("bank") is CircuitState.CLOSED
+
+
+def test_pool_read_timeout(http_server, load_version_fixture):
+    import socket
+    import urllib.request
+
+    from kenallclient.pool import ConnectionPool
+    from kenallclient.timeout import Timeout
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _slow_route(payload, 1.0)
+    http_server.json("/v1/bank/0002", payload)
+
+    with ConnectionPool() as pool:
+        with pytest.raises(socket.timeout):
+            pool.urlopen(
+                urllib.request.Request(f"{http_server.url}/v1/bank/0001"),
+                timeout=Timeout(read=0.1),
+            )
+        with pool.urlopen(
+            urllib.request.Request(f"{http_server.url}/v1/bank/0002"),
+            timeout=Timeout(connect=1, read=1),
+        ) as res:
+            assert res.status == 200
+
+
+def test_async_deadline(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.exceptions import DeadlineExceeded
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _slow_route(payload, 1.0)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url
+        ) as target:
+            await target.get_bank("0001", deadline=0.2)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(main())
+    assert time.monotonic() - started < 0.8
+
+
+def test_async_read_timeout(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+
+    payload = load_version_fixture("2025-01-01", "bank_get.json")
+    http_server.routes["/v1/bank/0001"] = _slow_route(payload, 1.0)
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, timeout=0.1
+        ) as target:
+            await target.get_bank("0001")
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(main())
@@ -0,0 +1,235 @@
+import asyncio
+import email.message
+import json
+import urllib.error
+
+import pytest
+
+
+def _headers(content_type="application/json"):
+    headers = email.message.Message()
+    headers["Content-Type"] = content_type
+    return headers
+
+
+class FakeTransport:
+    """Transport answering every request with a canned JSON payload"""
+
+    def __init__(self, payload, status=200):
+        self.payload = payload
+        self.status = status
+        self.requests = []
+        self.closed = False
+
+    def _respond(self, req, timeout):
+        from kenallclient.transport import Response
+
+        self.requests.append((req, timeout))
+        body = json.dumps(self.payload).encode("utf-8")
+        if self.status != 200:
+            raise urllib.error.HTTPError(
+                req.full_url, self.status, "error", _headers(), None
+            )
+        return Response(req.full_url, self.status, "OK", _headers(), body)
+
+    def send(self, req, timeout=None):
+        return self._respond(req, timeout)
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncFakeTransport(FakeTransport):
+    async def send(self, req, timeout=None):
+        return self._respond(req, timeout)
+
+
+def test_response_json():
+    from kenallclient.transport import Response
+
+    res = Response("http://localhost/", 200, "OK", _headers(), b'{"data": []}')
+    assert res.json() == {"data": []}
+
+    res = Response("http://localhost/", 200, "OK", _headers("text/html"), b"<html>")
+    with pytest.raises(ValueError):
+        res.json()
+
+
+def test_client_uses_transport(load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.timeout import Timeout
+
+    transport = FakeTransport(load_version_fixture("2025-01-01", "bank_get.json"))
+    with KenAllClient("testing-api-key", transport=transport, timeout=5) as target:
+        res = target.get_bank("0001", api_version="2025-01-01")
+
+    assert res.data.code == "0001"
+    [(req, timeout)] = transport.requests
+    assert req.full_url == "https://api.kenall.jp/v1/bank/0001"
+    assert timeout == Timeout(connect=5, read=5)
+    assert transport.closed
+
+
+def test_transport_errors(load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+
+    transport = FakeTransport({"message": "not found"}, status=404)
+    target = KenAllClient("testing-api-key", transport=transport)
+
+    with pytest.raises(NotFoundError):
+        target.get_bank("9999")
+
+
+def test_connection_pool_transport(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.pool import ConnectionPool
+
+    http_server.json(
+        "/v1/bank/0001", load_version_fixture("2025-01-01", "bank_get.json")
+    )
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, transport=ConnectionPool()
+    )
+
+    for _ in range(3):
+        assert target.get_bank("0001", api_version="2025-01-01").data.code == "0001"
+    assert http_server.connections == 1
+
+
+def test_async_client_uses_transport(load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+
+    transport = AsyncFakeTransport(load_version_fixture("2025-01-01", "bank_get.json"))
+
+    async def main():
+        async with AsyncKenAllClient("testing-api-key", transport=transport) as target:
+            return await target.get_bank("0001", api_version="2025-01-01")
+
+    assert asyncio.run(main()).data.code == "0001"
+    assert len(transport.requests) == 1
+    assert transport.closed
+
+
+def _gzip_route(payload, status=200):
+    import gzip
+
+    def route(handler):
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if "gzip" in handler.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        return status, headers, body
+
+    return route
+
+
+@pytest.mark.parametrize(
+    "encoding,compress",
+    [
+        ("gzip", lambda data: __import__("gzip").compress(data)),
+        ("deflate", lambda data: __import__("zlib").compress(data)),
+        ("deflate", lambda data: __import__("zlib").compress(data, wbits=-15)),
+        ("identity", lambda data: data),
+    ],
+)
+def test_content_decoder(encoding, compress):
+    from kenallclient.transport import ContentDecoder
+
+    data = json.dumps([{"code": str(i)} for i in range(1000)]).encode("utf-8")
+    wire = compress(data)
+    target = ContentDecoder(encoding)
+    for i in range(0, len(wire), 100):
+        target.feed(wire[i : i + 100])
+    assert target.finish() == data
+    assert target.wire_bytes == len(wire)
+
+
+def test_content_decoder_errors():
+    import gzip
+
+    from kenallclient.transport import ContentDecoder
+
+    with pytest.raises(ValueError):
+        ContentDecoder("br")
+    target = ContentDecoder("gzip")
+    target.feed(gzip.compress(b"{}" * 100)[:-10])
+    with pytest.raises(ValueError):
+        target.finish()
+
+
+def test_compressed_response(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+
+    payload = load_version_fixture("2025-01-01", "banks_get.json")
+    http_server.routes["/v1/bank"] = _gzip_route(payload)
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+
+    res = target.get_banks(api_version="2025-01-01")
+
+    assert len(res.data) == len(payload["data"])
+    [(_, headers)] = http_server.requests
+    assert headers["Accept-Encoding"] == "gzip, deflate"
+    stats = target.transport.stats()
+    assert stats.responses == stats.compressed == 1
+    assert stats.wire_bytes < stats.body_bytes
+
+
+def test_compressed_error(http_server):
+    from kenallclient.client import KenAllClient
+    from kenallclient.exceptions import NotFoundError
+
+    http_server.routes["/v1/bank/9999"] = _gzip_route({"message": "not found"}, 404)
+    target = KenAllClient("testing-api-key", api_url=http_server.url)
+
+    with pytest.raises(NotFoundError) as excinfo:
+        target.get_bank("9999")
+    assert json.loads(excinfo.value.read()) == {"message": "not found"}
+
+
+def test_compression_disabled(http_server, load_version_fixture):
+    from kenallclient.client import KenAllClient
+    from kenallclient.transport import UrllibTransport
+
+    payload = load_version_fixture("2025-01-01", "banks_get.json")
+    http_server.routes["/v1/bank"] = _gzip_route(payload)
+    transport = UrllibTransport(compress=False)
+    target = KenAllClient(
+        "testing-api-key", api_url=http_server.url, transport=transport
+    )
+
+    assert target.get_banks(api_version="2025-01-01").data
+    [(_, headers)] = http_server.requests
+    assert headers.get("Accept-Encoding", "identity") == "identity"
+    assert transport.stats().compressed == 0
+
+
+def test_pool_compressed_response(http_server, load_version_fixture):
+    from kenallclient.aio import AsyncKenAllClient
+    from kenallclient.client import KenAllClient
+    from kenallclient.pool import AsyncConnectionPool, ConnectionPool
+
+    payload = load_version_fixture("2025-01-01", "banks_get.json")
+    http_server.routes["/v1/bank"] = _gzip_route(payload)
+    pool = ConnectionPool()
+    target = KenAllClient("testing-api-key", api_url=http_server.url, transport=pool)
+    for _ in range(2):
+        assert len(target.get_banks(api_version="2025-01-01").data) == len(
+            payload["data"]
+        )
+    assert pool.stats().compressed == 2
+    assert http_server.connections == 1
+
+    async_pool = AsyncConnectionPool()
+
+    async def main():
+        async with AsyncKenAllClient(
+            "testing-api-key", api_url=http_server.url, transport=async_pool
+        ) as target:
+            return await target.get_banks(api_version="2025-01-01")
+
+    assert len(asyncio.run(main()).data) == len(payload["data"])
+    stats = async_pool.stats()
+    assert stats.compressed == 1
+    assert stats.wire_bytes < stats.body_bytes